@@ -5,7 +5,8 @@ from pathlib import Path
 import subprocess
 from typing import List, Optional
 
-from ..io import Paths, ensure_parent, git_head, git_is_dirty
+from ..io import Paths, ensure_parent, git_head, git_is_dirty, invalidate_git_probe
+from ..jobs import communicate
 
 
 @dataclass(frozen=True)
@@ -62,17 +63,19 @@ def run_codex(
 
     # Feed the prompt via stdin to avoid codex-specific flags.
     stdin_bytes = prompt_path.read_bytes()
-    proc = subprocess.run(
+    proc = subprocess.Popen(
         cmd,
         cwd=paths.repo_root,
-        input=stdin_bytes,
+        stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        check=False,
     )
+    # Inside a background job, a cancel kills codex (JobCancelled propagates).
+    output = communicate(proc, stdin_bytes)
 
-    log_path.write_bytes(proc.stdout)
+    log_path.write_bytes(output)
 
+    invalidate_git_probe(paths)
     head_after = git_head(paths)
     dirty_after = git_is_dirty(paths)
 
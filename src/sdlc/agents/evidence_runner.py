@@ -8,7 +8,8 @@ from typing import List, Optional
 import hashlib
 
 from ..codec import sha256_canonical_json
-from ..io import Paths, ensure_parent, now_utc
+from ..io import Paths, ensure_parent, invalidate_git_probe, now_utc
+from ..jobs import report_progress
 from ..models import (
     AcceptanceCheck,
     Actor,
@@ -56,7 +57,8 @@ def run_acceptance_checks_to_evidence(
     produced_paths: List[str] = []
     worst_exit = 0
 
-    for check in acceptance_checks:
+    for index, check in enumerate(acceptance_checks):
+        report_progress(index / len(acceptance_checks), f"acceptance check {check.name}")
         started_at = now_utc()
         cmd_str = check.command
         cwd = paths.repo_root
@@ -129,6 +131,8 @@ def run_acceptance_checks_to_evidence(
 
     atomic_write_text(evidence_path, bundle.model_dump_json(indent=2) + "\n", encoding="utf-8")
     produced_paths.append(f"runs/{bead_id}/evidence.json")
+    # The checks (and their logs) may have touched the working tree.
+    invalidate_git_probe(paths)
 
     return EvidenceRunResult(
         evidence=bundle,
@@ -10,7 +10,14 @@ from ..engine import (
     request_transition,
     validate_evidence_bundle,
 )
-from ..io import Paths, load_bead, load_execution_records, load_grounding, write_execution_record
+from ..io import (
+    Paths,
+    load_bead,
+    load_execution_records_for_bead,
+    load_grounding,
+    write_execution_record,
+)
+from ..jobs import report_progress
 from ..models import Actor, BeadStatus, FileRef, GitRef, RunPhase
 from .codex_runner import run_codex
 from .codex_runner import CodexRunResult
@@ -126,8 +133,7 @@ def build_codex_prompt_md(paths: Paths, bead_id: str) -> str:
 
 
 def _recent_runs_markdown(paths: Paths, bead_id: str, *, limit: int = 10) -> str:
-    records = [r for r in load_execution_records(paths) if r.bead_id == bead_id]
-    records = records[-limit:]
+    records = load_execution_records_for_bead(paths, bead_id, limit=limit)
     lines: List[str] = []
     for r in records:
         lines.append(
@@ -486,6 +492,7 @@ def run_implement(
     grounded = _grounded_files(paths, bead_id)
 
     log_path = paths.bead_dir(bead_id) / "codex.log"
+    report_progress(0.1, "running codex")
     result = subprocess_runner(
         paths,
         bead_id,
@@ -495,7 +502,7 @@ def run_implement(
         log_path=log_path,
     )
 
-    changed_files = detect_changed_files(paths, head_before=result.head_before)
+    changed_files = list(detect_changed_files(paths, head_before=result.head_before))
     violation = _policy_violation_notes(changed_files, grounded)
 
     record = build_execution_record(
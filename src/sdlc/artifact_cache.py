@@ -0,0 +1,137 @@
+"""
+Opt-in, process-wide LRU of parsed artifact models (bead.json, bead_review.json, grounding,
+evidence).
+
+A single transition or agent run loads the same bead several times; with the cache enabled
+(`SDLC_ARTIFACT_CACHE=<max entries>`) repeated loads cost one `stat` plus a model copy instead
+of a read + JSON parse + validation. Entries are keyed by path and validated against the
+file's (inode, mtime_ns, size), so atomic replacements and in-place edits are both picked up.
+
+Callers always receive a deep copy and may mutate it freely.
+
+Read-only artifacts the engine never mutates (boundary registries) use `load_shared` instead:
+an always-on table, also validated by file identity, that hands out the *shared* parsed model
+together with its canonical hash, so a registry with hundreds of subsystems is parsed and
+hashed once per change rather than once per transition.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .codec import sha256_canonical_model
+
+
+_Identity = tuple[int, int, int]
+
+
+def cache_size_from_env() -> int:
+    raw = os.getenv("SDLC_ARTIFACT_CACHE", "")
+    try:
+        return max(0, int(raw)) if raw.strip() else 0
+    except ValueError:
+        return 0
+
+
+class ArtifactCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Path, tuple[_Identity, BaseModel]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def load[ModelT: BaseModel](self, path: Path, model_type: type[ModelT]) -> Optional[ModelT]:
+        """Parsed model at `path` (a private copy), or None when the file does not exist."""
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self.max_entries > 0:
+            with self._lock:
+                cached = self._entries.get(path)
+                if cached is not None and cached[0] == identity:
+                    model = cached[1]
+                    if isinstance(model, model_type):
+                        self._entries.move_to_end(path)
+                        self.hits += 1
+                        return model.model_copy(deep=True)
+                self.misses += 1
+        model = model_type.model_validate_json(path.read_bytes())
+        if self.max_entries > 0:
+            # Re-stat: if the file changed while we read it, do not cache what we parsed.
+            try:
+                after = os.stat(path)
+            except FileNotFoundError:
+                return model
+            if (after.st_ino, after.st_mtime_ns, after.st_size) == identity:
+                with self._lock:
+                    self._entries[path] = (identity, model.model_copy(deep=True))
+                    self._entries.move_to_end(path)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        return model
+
+
+_CACHE: Optional[ArtifactCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def artifact_cache() -> ArtifactCache:
+    """The process-wide cache, sized from `SDLC_ARTIFACT_CACHE` (0 disables caching)."""
+
+    global _CACHE
+    with _CACHE_LOCK:
+        size = cache_size_from_env()
+        if _CACHE is None or _CACHE.max_entries != size:
+            _CACHE = ArtifactCache(size)
+        return _CACHE
+
+
+_SHARED_MAX_ENTRIES = 64
+_SHARED: OrderedDict[Path, tuple[_Identity, BaseModel, str]] = OrderedDict()
+_SHARED_LOCK = threading.Lock()
+
+
+def load_shared[ModelT: BaseModel](path: Path, model_type: type[ModelT]) -> tuple[ModelT, str]:
+    """
+    The parsed model at `path` and its canonical hash, cached by (inode, mtime_ns, size).
+
+    The model is shared between callers and must not be mutated. Raises FileNotFoundError
+    when the file does not exist.
+    """
+
+    stat = os.stat(path)
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with _SHARED_LOCK:
+        cached = _SHARED.get(path)
+        if cached is not None and cached[0] == identity and isinstance(cached[1], model_type):
+            _SHARED.move_to_end(path)
+            return cached[1], cached[2]
+    model = model_type.model_validate_json(path.read_bytes())
+    digest = sha256_canonical_model(model)
+    after = os.stat(path)
+    if (after.st_ino, after.st_mtime_ns, after.st_size) == identity:
+        with _SHARED_LOCK:
+            _SHARED[path] = (identity, model, digest)
+            _SHARED.move_to_end(path)
+            while len(_SHARED) > _SHARED_MAX_ENTRIES:
+                _SHARED.popitem(last=False)
+    return model, digest
@@ -0,0 +1,160 @@
+"""
+Async facade over the engine for callers running on an event loop (the FastAPI server).
+
+The engine and io layer are synchronous: they read and write files and spawn git. Called from
+an `async def` endpoint they would block the loop, and called from a sync endpoint they hold
+one of Starlette's few threadpool workers for the whole request. This module keeps both off
+the loop:
+
+- git state is taken with `asyncio.create_subprocess_exec` (`GitProbe.snapshot_async`) into
+  the caller's git probe scope, so the engine code that runs afterwards finds it memoized and
+  never spawns git itself
+- the remaining blocking work runs on a dedicated, bounded thread pool
+  (`SDLC_ASYNC_IO_WORKERS`, default 8) in a copy of the caller's context, i.e. inside the
+  same git probe scope; excess calls queue instead of exhausting the server's threadpool
+
+Every function opens a git probe scope when the caller has none (nested scopes reuse the outer
+one), so the snapshot taken here is the one the worker sees.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
+
+from . import engine, io
+from .git_probe import GitSnapshot, git_probe, git_probe_scope
+from .io import Paths
+from .models import Actor, ArtifactLink, Bead, EvidenceBundle, ExecutionRecord, RunPhase
+
+
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+def io_workers() -> int:
+    raw = os.getenv("SDLC_ASYNC_IO_WORKERS", "").strip()
+    if not raw:
+        return 8
+    value = int(raw)
+    if value < 1:
+        raise ValueError("SDLC_ASYNC_IO_WORKERS must be >= 1")
+    return value
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    global _IO_POOL
+    with _IO_POOL_LOCK:
+        if _IO_POOL is None:
+            _IO_POOL = ThreadPoolExecutor(max_workers=io_workers(), thread_name_prefix="sdlc-aio")
+        return _IO_POOL
+
+
+async def run_blocking[T](func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run `func` on the bounded IO pool, in the caller's context (git probe scope included)."""
+
+    loop = asyncio.get_running_loop()
+    call = partial(func, *args, **kwargs)
+    return await loop.run_in_executor(_io_pool(), contextvars.copy_context().run, call)
+
+
+async def git_snapshot(paths: Paths) -> Optional[GitSnapshot]:
+    """HEAD, branch and changed files from one asyncio `git status` (memoized within a scope)."""
+
+    return await git_probe(paths.repo_root).snapshot_async()
+
+
+async def git_head(paths: Paths) -> Optional[str]:
+    snapshot = await git_snapshot(paths)
+    return snapshot.head if snapshot is not None else None
+
+
+async def git_is_dirty(paths: Paths) -> Optional[bool]:
+    snapshot = await git_snapshot(paths)
+    return snapshot.dirty if snapshot is not None else None
+
+
+async def offload[T](paths: Paths, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Take the git snapshot on the loop, then run `func` (which may read it) on the IO pool."""
+
+    with git_probe_scope():
+        await git_snapshot(paths)
+        return await run_blocking(func, *args, **kwargs)
+
+
+async def load_bead_versioned(paths: Paths, bead_id: str) -> tuple[Bead, str]:
+    return await run_blocking(io.load_bead_versioned, paths, bead_id)
+
+
+async def request_transition(
+    paths: Paths,
+    bead_id: str,
+    transition: str,
+    actor: Actor,
+    *,
+    if_match: Optional[str] = None,
+) -> engine.TransitionResult:
+    return await offload(
+        paths, engine.request_transition, paths, bead_id, transition, actor, if_match=if_match
+    )
+
+
+async def record_transition_attempt(
+    paths: Paths,
+    bead_id: str,
+    phase: RunPhase,
+    actor: Actor,
+    requested: str,
+    result: engine.TransitionResult,
+    extra_links: Optional[list[ArtifactLink]] = None,
+) -> ExecutionRecord:
+    return await offload(
+        paths,
+        engine.record_transition_attempt,
+        paths,
+        bead_id,
+        phase,
+        actor,
+        requested,
+        result,
+        extra_links,
+    )
+
+
+async def validate_evidence_bundle(
+    paths: Paths, bead_id: str, actor: Actor, mark_validated: bool = True
+) -> tuple[Optional[EvidenceBundle], list[str]]:
+    return await offload(
+        paths,
+        engine.validate_evidence_bundle,
+        paths,
+        bead_id,
+        actor,
+        mark_validated=mark_validated,
+    )
+
+
+async def invalidate_evidence_if_stale(paths: Paths, bead_id: str, actor: Actor) -> Optional[str]:
+    return await offload(paths, engine.invalidate_evidence_if_stale, paths, bead_id, actor)
+
+
+async def readiness_report(
+    paths: Paths,
+    bead_ids: Optional[Iterable[str]] = None,
+    *,
+    actor: Optional[Actor] = None,
+    include_failure_targets: bool = False,
+) -> list[engine.BeadReadiness]:
+    return await offload(
+        paths,
+        engine.readiness_report,
+        paths,
+        bead_ids,
+        actor=actor,
+        include_failure_targets=include_failure_targets,
+    )
@@ -0,0 +1,370 @@
+"""
+Indexed adapter for the bd issues store (`beads/issues.jsonl`, `beads/issues.json` or
+`.beads/issues.jsonl`).
+
+The store's format is sniffed once per file (JSONL, or a whole-file JSON list/dict) instead of
+attempting a whole-file `json.loads` on every read. For JSONL stores an id -> (offset, length,
+sha256) index is kept in memory and persisted next to the other runs/ sidecars, so a lookup is
+one seek + one line parse, also in a fresh process. On refresh the store is re-stat'ed:
+
+- unchanged (inode, size, mtime): nothing is read
+- appended (a hash of the bytes just before the previously indexed end still matches): only
+  the new lines are scanned
+- rewritten (e.g. a bd export): every line is re-read, but lines whose content (sha256 of the
+  raw bytes) is already known keep their cached id and parsed issue, so only changed lines
+  are JSON-parsed
+
+Whole-file JSON stores are simply re-parsed when their identity changes.
+
+As before, the first line for a given id wins. Returned issue dicts are shared cache entries
+and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+_TAIL_HASH_BYTES = 4096
+_INDEX_VERSION = 2
+
+
+def bd_issues_path(repo_root: Path) -> Optional[Path]:
+    candidates = [
+        repo_root / "beads" / "issues.jsonl",
+        repo_root / "beads" / "issues.json",
+        repo_root / ".beads" / "issues.jsonl",
+    ]
+    for cand in candidates:
+        if cand.exists():
+            return cand
+    return None
+
+
+def bead_payload_from_issue(data: dict[str, Any]) -> dict[str, Any]:
+    """Map a bd issue onto a `sdlc.bead` payload (validated by the caller)."""
+
+    bead_id = data.get("id")
+    created_at = data.get("created_at") or data.get("created")
+    if not created_at:
+        created_at = datetime.now(timezone.utc).isoformat()
+
+    acceptance = data.get("acceptance") or data.get("acceptance_criteria") or ""
+    description = data.get("description") or data.get("body") or ""
+    title = data.get("title") or bead_id
+    status = data.get("status") or "draft"
+
+    owner = data.get("owner") or data.get("assignee")
+    priority: Any = data.get("priority")
+    if isinstance(priority, str) and priority.upper().startswith("P"):
+        try:
+            priority = int(priority[1:]) + 1
+        except ValueError:
+            priority = 3
+    if isinstance(priority, int):
+        priority = max(1, min(5, priority))
+    else:
+        priority = 3
+
+    return {
+        "schema_name": "sdlc.bead",
+        "schema_version": 1,
+        "artifact_id": bead_id,
+        "created_at": created_at,
+        "created_by": {"kind": "system", "name": "bd"},
+        "bead_id": bead_id,
+        "title": title,
+        "bead_type": data.get("bead_type", "implementation"),
+        "status": status,
+        "priority": priority,
+        "owner": owner,
+        "requirements_md": description,
+        "acceptance_criteria_md": acceptance,
+        "context_md": data.get("notes") or data.get("context") or "",
+        "acceptance_checks": [],
+    }
+
+
+@dataclass
+class _Line:
+    offset: int
+    length: int
+    digest: str
+
+
+def _line_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _issues_from_document(payload: Any) -> list[dict[str, Any]]:
+    if isinstance(payload, list):
+        return [x for x in payload if isinstance(x, dict)]
+    if isinstance(payload, dict):
+        # common patterns: {"issues":[...]} or similar
+        for key in ("issues", "items", "data"):
+            val = payload.get(key)
+            if isinstance(val, list):
+                return [x for x in val if isinstance(x, dict)]
+        # if it's a single issue dict
+        return [payload]
+    return []
+
+
+def sniff_format(path: Path) -> str:
+    """Return "jsonl" or "json" from the first non-blank line of the store."""
+
+    with path.open("rb") as handle:
+        first = handle.readline()
+        while first and not first.strip():
+            first = handle.readline()
+    if not first.lstrip().startswith(b"{"):
+        return "json"
+    try:
+        payload = json.loads(first)
+    except ValueError:
+        # A multi-line (pretty-printed) document.
+        return "json"
+    if any(isinstance(payload.get(key), list) for key in ("issues", "items", "data")):
+        return "json"
+    return "jsonl"
+
+
+class BdIssueStore:
+    def __init__(self, path: Path, index_path: Optional[Path] = None) -> None:
+        self.path = path
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self.format: Optional[str] = None
+        self._identity: Optional[tuple[int, int, int]] = None
+        self._indexed_size = 0
+        self._tail_hash = ""
+        self._lines: dict[str, _Line] = {}
+        # sha256 of the raw line -> parsed issue, for lines whose content is already known.
+        self._parsed: dict[str, dict[str, Any]] = {}
+        self._document: list[dict[str, Any]] = []
+        self.lines_parsed = 0
+
+    # ---- public API ----
+
+    def issue(self, bead_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            if self.format == "json":
+                return next((x for x in self._document if x.get("id") == bead_id), None)
+            line = self._lines.get(bead_id)
+            if line is None:
+                return None
+            return self._parse_at(bead_id, line)
+
+    def issues(self) -> list[dict[str, Any]]:
+        """All issues in store order (first line per id for JSONL)."""
+
+        with self._lock:
+            self._refresh()
+            if self.format == "json":
+                return list(self._document)
+            ordered = sorted(self._lines.items(), key=lambda item: item[1].offset)
+            out: list[dict[str, Any]] = []
+            missing = [line for _, line in ordered if line.digest not in self._parsed]
+            if missing:
+                with self.path.open("rb") as handle:
+                    for line in missing:
+                        handle.seek(line.offset)
+                        self._remember(handle.read(line.length), line.digest)
+            for bead_id, line in ordered:
+                issue = self._parsed.get(line.digest)
+                if issue is not None and issue.get("id") == bead_id:
+                    out.append(issue)
+            return out
+
+    def ids(self) -> list[str]:
+        with self._lock:
+            self._refresh()
+            if self.format == "json":
+                return [x["id"] for x in self._document if isinstance(x.get("id"), str)]
+            return list(self._lines)
+
+    # ---- internals ----
+
+    def _parse_at(self, bead_id: str, line: _Line) -> Optional[dict[str, Any]]:
+        issue = self._parsed.get(line.digest)
+        if issue is None:
+            with self.path.open("rb") as handle:
+                handle.seek(line.offset)
+                issue = self._remember(handle.read(line.length), line.digest)
+        # A hit must be the line indexed for this id, never another one with the same key.
+        if issue is None or issue.get("id") != bead_id:
+            return None
+        return issue
+
+    def _remember(self, raw: bytes, digest: str) -> Optional[dict[str, Any]]:
+        self.lines_parsed += 1
+        try:
+            obj = json.loads(raw)
+        except ValueError:
+            logger.exception("Failed to parse bd issues JSONL line", extra={"path": str(self.path)})
+            return None
+        if not isinstance(obj, dict):
+            return None
+        self._parsed[digest] = obj
+        return obj
+
+    def _reset(self) -> None:
+        self.format = None
+        self._identity = None
+        self._indexed_size = 0
+        self._tail_hash = ""
+        self._lines = {}
+        self._document = []
+
+    def _hash_before(self, handle: BinaryIO, end: int) -> str:
+        start = max(0, end - _TAIL_HASH_BYTES)
+        handle.seek(start)
+        return hashlib.sha256(handle.read(end - start)).hexdigest()
+
+    def _refresh(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+        identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if identity == self._identity:
+            return
+        if self._identity is None and self._load_persisted():
+            if identity == self._identity:
+                return
+        if self.format is None or self._identity is None or self._identity[0] != stat.st_ino:
+            self.format = sniff_format(self.path)
+        if self.format == "json":
+            self._load_document()
+        else:
+            self._scan(stat.st_size)
+        self._identity = identity
+        self._persist()
+
+    def _load_document(self) -> None:
+        text = self.path.read_text(encoding="utf-8")
+        self.lines_parsed += 1
+        try:
+            self._document = _issues_from_document(json.loads(text))
+        except ValueError:
+            logger.exception(
+                "Failed to parse bd issues store as JSON", extra={"path": str(self.path)}
+            )
+            self._document = []
+
+    def _scan(self, size: int) -> None:
+        with self.path.open("rb") as handle:
+            appended = (
+                self._indexed_size > 0
+                and size >= self._indexed_size
+                and self._hash_before(handle, self._indexed_size) == self._tail_hash
+            )
+            if not appended:
+                known_ids = {line.digest: bead_id for bead_id, line in self._lines.items()}
+                self._lines = {}
+                self._indexed_size = 0
+            else:
+                known_ids = {}
+            handle.seek(self._indexed_size)
+            offset = self._indexed_size
+            for raw in handle:
+                self._index_line(raw, offset, known_ids)
+                if not raw.endswith(b"\n"):
+                    # Unterminated last line (or one mid-write): indexed if it parses, but
+                    # scanned again on the next refresh.
+                    break
+                offset += len(raw)
+            self._indexed_size = offset
+            self._tail_hash = self._hash_before(handle, offset)
+        live = {line.digest for line in self._lines.values()}
+        self._parsed = {digest: issue for digest, issue in self._parsed.items() if digest in live}
+
+    def _index_line(self, raw: bytes, offset: int, known_ids: dict[str, str]) -> None:
+        if not raw.strip():
+            return
+        digest = _line_digest(raw)
+        bead_id = known_ids.get(digest)
+        if bead_id is None:
+            issue = self._parsed.get(digest) or self._remember(raw, digest)
+            candidate = issue.get("id") if issue is not None else None
+            if not isinstance(candidate, str):
+                return
+            bead_id = candidate
+        if bead_id not in self._lines:
+            self._lines[bead_id] = _Line(offset=offset, length=len(raw), digest=digest)
+
+    def _persist(self) -> None:
+        if self.index_path is None or self._identity is None:
+            return
+        payload = {
+            "version": _INDEX_VERSION,
+            "path": str(self.path),
+            "format": self.format,
+            "identity": list(self._identity),
+            "indexed_size": self._indexed_size,
+            "tail_hash": self._tail_hash,
+            "lines": {
+                bead_id: [line.offset, line.length, line.digest]
+                for bead_id, line in self._lines.items()
+            },
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def _load_persisted(self) -> bool:
+        if self.index_path is None or not self.index_path.exists():
+            return False
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if payload.get("version") != _INDEX_VERSION or payload.get("path") != str(self.path):
+                return False
+            if payload["format"] == "json":
+                # Whole-file stores are not indexed by offset; re-parse on first use.
+                return False
+            lines = {
+                str(bead_id): _Line(offset=int(v[0]), length=int(v[1]), digest=str(v[2]))
+                for bead_id, v in payload["lines"].items()
+            }
+            identity = tuple(int(v) for v in payload["identity"])
+        except (ValueError, KeyError, TypeError, IndexError):
+            return False
+        if len(identity) != 3:
+            return False
+        self.format = str(payload["format"])
+        self._identity = (identity[0], identity[1], identity[2])
+        self._indexed_size = int(payload["indexed_size"])
+        self._tail_hash = str(payload["tail_hash"])
+        self._lines = lines
+        return True
+
+
+_STORES: dict[tuple[Path, Optional[Path]], BdIssueStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def bd_store(repo_root: Path, index_path: Optional[Path] = None) -> Optional[BdIssueStore]:
+    """Return the process-wide store for the repo's bd issues file, or None if there is none."""
+
+    path = bd_issues_path(repo_root)
+    if path is None:
+        return None
+    with _STORES_LOCK:
+        key = (path, index_path)
+        store = _STORES.get(key)
+        if store is None:
+            store = BdIssueStore(path, index_path)
+            _STORES[key] = store
+        return store
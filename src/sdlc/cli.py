@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import dataclasses
 import json
 import os
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
 import typer
 from pydantic import ValidationError
 
 from .codec import sha256_canonical_json
 from .engine import (
     append_decision_entry,
+    audit_bead_status,
     build_execution_record,
     collect_evidence_skeleton,
     create_abort_entry,
@@ -16,12 +21,29 @@ from .engine import (
     decision_ledger_link,
     generate_grounding_bundle,
     invalidate_evidence_if_stale,
+    readiness_report,
     record_decision_action,
     record_transition_attempt,
     request_transition,
     validate_evidence_bundle,
 )
-from .io import Paths, git_head, git_is_dirty, load_bead, load_evidence, write_model
+from .git_probe import git_probe_scope
+from .jobs import job_slot
+from .io import (
+    Paths,
+    git_head,
+    git_is_dirty,
+    import_bd_issues,
+    load_bead,
+    load_evidence,
+    load_projection,
+    rebuild_journal_index,
+    rebuild_mirror,
+    repair_logs,
+    seal_logs,
+    verify_logs,
+    write_model,
+)
 from .models import Actor, BeadStatus, FileRef, GitRef, OpenSpecRef, RunPhase, schema_registry
 from .phase import phase_for_transition_str
 
@@ -30,6 +52,12 @@ app = typer.Typer(add_completion=False)
 schema_app = typer.Typer(add_completion=False)
 
 
+@app.callback()
+def _main(ctx: typer.Context) -> None:
+    # One git status snapshot per command, however many records it journals.
+    ctx.with_resource(git_probe_scope())
+
+
 def _decision_action_phase(paths: Paths, bead_id: str) -> RunPhase:
     bead = load_bead(paths, bead_id)
     if bead.status in {BeadStatus.draft, BeadStatus.sized, BeadStatus.ready}:
@@ -93,10 +121,41 @@ def request(
     result = request_transition(paths, bead_id, transition, actor)
     phase = phase_for_transition_str(transition)
     record_transition_attempt(paths, bead_id, phase, actor, transition, result)
+    if result.conflict:
+        typer.echo(result.notes, err=True)
     if not result.ok:
         raise typer.Exit(code=1)
 
 
+@app.command()
+def readiness(
+    bead_id: Optional[list[str]] = typer.Option(None, "--id"),
+    failure_targets: bool = typer.Option(False, "--failure-targets"),
+    as_json: bool = typer.Option(False, "--json"),
+) -> None:
+    """Report which beads could move forward now, and why not (changes nothing)."""
+
+    paths = Paths(Path.cwd())
+    report = readiness_report(paths, bead_id, include_failure_targets=failure_targets)
+    if as_json:
+        typer.echo(json.dumps([dataclasses.asdict(item) for item in report], indent=2))
+        return
+    for item in report:
+        if item.error is not None:
+            typer.echo(f"{item.bead_id}: error: {item.error}")
+            continue
+        if not item.transitions:
+            typer.echo(f"{item.bead_id} [{item.status}]: terminal")
+        for transition in item.transitions:
+            if transition.auto_abort:
+                verdict = "auto-abort"
+            else:
+                verdict = "ok" if transition.ok else "blocked"
+            typer.echo(f"{item.bead_id}: {transition.transition}: {verdict}")
+            for blocker in transition.blockers:
+                typer.echo(f"  {blocker}")
+
+
 evidence_app = typer.Typer(add_completion=False)
 app.add_typer(evidence_app, name="evidence")
 
@@ -114,6 +173,19 @@ agent_app = typer.Typer(add_completion=False)
 app.add_typer(agent_app, name="agent")
 
 
+journal_app = typer.Typer(add_completion=False)
+app.add_typer(journal_app, name="journal")
+
+mirror_app = typer.Typer(add_completion=False)
+app.add_typer(mirror_app, name="mirror")
+
+bd_app = typer.Typer(add_completion=False)
+app.add_typer(bd_app, name="bd")
+
+projection_app = typer.Typer(add_completion=False)
+app.add_typer(projection_app, name="projection")
+
+
 @evidence_app.command("collect")
 def evidence_collect(bead_id: str) -> None:
     paths = Paths(Path.cwd())
@@ -160,6 +232,133 @@ def evidence_invalidate_if_stale(bead_id: str) -> None:
         typer.echo(reason)
 
 
+@journal_app.command("reindex")
+def journal_reindex() -> None:
+    """Rebuild the per-bead byte-offset index for runs/journal.jsonl."""
+
+    paths = Paths(Path.cwd())
+    count = rebuild_journal_index(paths)
+    typer.echo(f"Indexed {count} records -> {paths.journal_index_path}")
+
+
+@journal_app.command("verify")
+def journal_verify() -> None:
+    """Check record checksums and sequence numbers of the active journal and ledger."""
+
+    paths = Paths(Path.cwd())
+    failed = False
+    for report in verify_logs(paths):
+        status = "OK" if report.ok else "FAIL"
+        typer.echo(
+            f"{status} {report.path}: {report.records} records ({report.framed} framed, "
+            f"seq {report.first_seq}..{report.last_seq})"
+        )
+        for offset in report.corrupt_offsets:
+            typer.echo(f"  corrupt record at byte {offset}")
+        for previous, following in report.seq_breaks:
+            typer.echo(f"  sequence break: {previous} -> {following}")
+        if report.torn_tail_bytes:
+            typer.echo(f"  torn tail: {report.torn_tail_bytes} bytes")
+        failed = failed or not report.ok
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@journal_app.command("repair")
+def journal_repair() -> None:
+    """Truncate torn tails left by writers that died mid-append."""
+
+    paths = Paths(Path.cwd())
+    for path, removed in repair_logs(paths).items():
+        typer.echo(f"{path}: removed {removed} bytes")
+
+
+@journal_app.command("seal")
+def journal_seal() -> None:
+    """Seal the active journal and decision ledger into compressed segments."""
+
+    paths = Paths(Path.cwd())
+    sealed = seal_logs(paths)
+    if not sealed:
+        typer.echo("Nothing to seal")
+    for info in sealed:
+        typer.echo(f"Sealed {info.record_count} records -> {info.name}")
+
+
+@mirror_app.command("rebuild")
+def mirror_rebuild() -> None:
+    """(Re)create the SQLite mirror at runs/mirror.sqlite3 from the JSONL logs and bead files."""
+
+    paths = Paths(Path.cwd())
+    stats = rebuild_mirror(paths)
+    typer.echo(
+        f"Mirrored {stats.execution_records} execution records, {stats.decision_entries} "
+        f"decision entries, {stats.beads} beads -> {paths.mirror_path}"
+    )
+
+
+@bd_app.command("import")
+def bd_import(
+    bead_id: Optional[list[str]] = typer.Option(None, "--id"),
+    status: Optional[str] = typer.Option(None, "--status"),
+    workers: int = typer.Option(8, "--workers", min=1),
+) -> None:
+    """Materialize bd issues into runs/<bead_id>/bead.json in bulk."""
+
+    paths = Paths(Path.cwd())
+    summary = import_bd_issues(paths, bead_ids=bead_id, status=status, workers=workers)
+    typer.echo(
+        f"Imported {len(summary.imported)}, updated {len(summary.updated)}, "
+        f"unchanged {len(summary.unchanged)}, skipped {len(summary.skipped)}, "
+        f"invalid {len(summary.invalid)}"
+    )
+    for skipped in summary.skipped:
+        typer.echo(f"  skipped (managed in runs/): {skipped}")
+    for invalid in summary.invalid:
+        typer.echo(f"  invalid: {invalid}")
+
+
+@projection_app.command("status")
+def projection_status(
+    at: Optional[datetime] = typer.Option(None, "--at", help="ISO timestamp (default: now)"),
+) -> None:
+    """Bead statuses replayed from the journal's applied transitions (optionally as of --at)."""
+
+    paths = Paths(Path.cwd())
+    projection = load_projection(paths)
+    state = projection.at(at) if at is not None else projection.current()
+    for bead_id, bead in sorted(state.beads.items()):
+        typer.echo(f"{bead_id}: {bead.status} ({bead.last_transition} at {bead.updated_at})")
+    typer.echo(f"{state.records} records replayed up to {state.last_created_at}")
+
+
+@projection_app.command("snapshot")
+def projection_snapshot() -> None:
+    """Write a projection snapshot covering the whole journal now."""
+
+    paths = Paths(Path.cwd())
+    path = load_projection(paths).write_snapshot()
+    typer.echo(f"Snapshot -> {path}")
+
+
+@projection_app.command("audit")
+def projection_audit(repair: bool = typer.Option(False, "--repair")) -> None:
+    """Check bead.json statuses against the journal; --repair rewrites drifted beads."""
+
+    paths = Paths(Path.cwd())
+    drifts = audit_bead_status(paths, repair=repair)
+    for drift in drifts:
+        action = " (repaired)" if drift.repaired else ""
+        typer.echo(
+            f"{drift.bead_id}: bead.json={drift.file_status} journal={drift.projected_status} "
+            f"[{drift.last_transition}]{action}"
+        )
+    if not drifts:
+        typer.echo("bead.json statuses match the journal")
+    elif not repair:
+        raise typer.Exit(code=1)
+
+
 @grounding_app.command("generate")
 def grounding_generate(bead_id: str) -> None:
     paths = Paths(Path.cwd())
@@ -280,7 +479,8 @@ def agent_plan(
 
     paths = Paths(Path.cwd())
     actor = Actor(kind="agent", name=actor_name)
-    run_plan(paths, bead_id, actor)
+    with job_slot(paths.jobs_dir, "plan"):
+        run_plan(paths, bead_id, actor)
 
 
 @agent_app.command("openspec-propose")
@@ -304,17 +504,18 @@ def agent_openspec_propose(
     settings = AgentSettings()
     if interactive is None:
         interactive = settings.openspec_interactive_default
-    run_openspec_propose(
-        paths,
-        bead_id,
-        change_id,
-        actor=Actor(kind="agent", name=actor_name),
-        interactive=interactive,
-        council=council,
-        overwrite=overwrite,
-        openspec_ref_id=openspec_ref_id,
-        settings=settings,
-    )
+    with job_slot(paths.jobs_dir, "openspec_propose"):
+        run_openspec_propose(
+            paths,
+            bead_id,
+            change_id,
+            actor=Actor(kind="agent", name=actor_name),
+            interactive=interactive,
+            council=council,
+            overwrite=overwrite,
+            openspec_ref_id=openspec_ref_id,
+            settings=settings,
+        )
 
 
 @agent_app.command("implement")
@@ -333,7 +534,8 @@ def agent_implement(
 
     paths = Paths(Path.cwd())
     actor = Actor(kind="agent", name=actor_name)
-    code = run_implement(paths, bead_id, actor, auto_transition=auto_transition)
+    with job_slot(paths.jobs_dir, "implement"):
+        code = run_implement(paths, bead_id, actor, auto_transition=auto_transition)
     if code != 0:
         raise typer.Exit(code=code)
 
@@ -354,6 +556,7 @@ def agent_verify(
 
     paths = Paths(Path.cwd())
     actor = Actor(kind="agent", name=actor_name)
-    code = run_verify(paths, bead_id, actor, auto_transition=auto_transition)
+    with job_slot(paths.jobs_dir, "verify"):
+        code = run_verify(paths, bead_id, actor, auto_transition=auto_transition)
     if code != 0:
         raise typer.Exit(code=code)
@@ -1,8 +1,15 @@
+"""
+Canonical JSON encoding and hashing for artifacts (sorted keys, compact separators, UTF-8).
+"""
+
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from hashlib import sha256
-from typing import Any
+from typing import Any, Iterable, Mapping
+
+from pydantic import BaseModel
 
 
 def canonicalize_json(value: Any) -> Any:
@@ -20,3 +27,80 @@ def canonical_json_bytes(value: Any) -> bytes:
 
 def sha256_canonical_json(value: Any) -> str:
     return sha256(canonical_json_bytes(value)).hexdigest()
+
+
+def sorted_json_bytes(value: Any) -> bytes:
+    """
+    `canonical_json_bytes` via the C encoder's `sort_keys`, without rebuilding the value.
+
+    Byte-identical for JSON-mode payloads (dicts with string keys, lists, scalars), which is
+    what `model_dump(mode="json")` produces; `canonicalize_json` does not descend into tuples.
+    """
+
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+@dataclass(frozen=True)
+class ModelHashTree:
+    """
+    Per-field digests of a model, computed in the same pass as its canonical hash.
+
+    `root` equals `sha256_canonical_json(model.model_dump(mode="json"))`; `fields` maps each
+    top-level field to the digest of its canonical JSON (for a list field, e.g. a bead's
+    acceptance checks, that is exactly the hash of the list); `items` holds the digest of every
+    element of list-valued fields.
+    """
+
+    root: str
+    fields: dict[str, str]
+    items: dict[str, tuple[str, ...]]
+
+    def changed_fields(self, baseline: Mapping[str, str]) -> list[str]:
+        """Fields whose digest differs from `baseline` (including added and removed fields)."""
+
+        names = set(self.fields) | set(baseline)
+        return sorted(name for name in names if self.fields.get(name) != baseline.get(name))
+
+
+def _hash_tree(payload: dict[str, Any]) -> ModelHashTree:
+    parts: list[bytes] = []
+    fields: dict[str, str] = {}
+    items: dict[str, tuple[str, ...]] = {}
+    for name in sorted(payload):
+        value = payload[name]
+        if isinstance(value, list):
+            encoded_items = [sorted_json_bytes(item) for item in value]
+            items[name] = tuple(sha256(item).hexdigest() for item in encoded_items)
+            encoded = b"[" + b",".join(encoded_items) + b"]"
+        else:
+            encoded = sorted_json_bytes(value)
+        fields[name] = sha256(encoded).hexdigest()
+        parts.append(json.dumps(name, ensure_ascii=False).encode("utf-8") + b":" + encoded)
+    data = b"{" + b",".join(parts) + b"}"
+    return ModelHashTree(root=sha256(data).hexdigest(), fields=fields, items=items)
+
+
+def sha256_canonical_model(model: BaseModel) -> str:
+    """Same digest as `sha256_canonical_json(model.model_dump(mode="json"))`."""
+
+    return sha256(sorted_json_bytes(model.model_dump(mode="json"))).hexdigest()
+
+
+def sha256_canonical_models(models: Iterable[BaseModel]) -> str:
+    """Same digest as `sha256_canonical_json([m.model_dump(mode="json") for m in models])`."""
+
+    hasher = sha256(b"[")
+    for i, model in enumerate(models):
+        if i:
+            hasher.update(b",")
+        hasher.update(sorted_json_bytes(model.model_dump(mode="json")))
+    hasher.update(b"]")
+    return hasher.hexdigest()
+
+
+def model_hash_tree(model: BaseModel) -> ModelHashTree:
+    """Root hash (== `sha256_canonical_model`), per-field and per-list-item digests."""
+
+    return _hash_tree(model.model_dump(mode="json"))
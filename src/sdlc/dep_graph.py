@@ -0,0 +1,433 @@
+"""
+Persisted dependency graph over the beads materialized in runs/<bead_id>/bead.json.
+
+The dependency gate and the bead list used to call `load_bead` for every bead they looked at,
+and nothing could answer "which beads are unblocked" without loading all of them. The graph
+keeps, per bead, the fields those questions need (status, `depends_on` and the list-view
+summary) together with the identity (inode, mtime, size) of the bead.json they came from. It
+is persisted to `runs/deps.index.json`, so a fresh process starts from the saved graph.
+
+`refresh` scans runs/ and stats every bead.json; only files whose identity changed are parsed
+again. Callers that only need a few nodes (the dependency gate asks about one bead's
+`depends_on`) use `revalidate`, which stats just those files, so a transition costs
+O(dependencies) instead of O(beads). `io.write_bead` updates the graph directly, so beads
+written by the engine are never re-read. Beads that only exist in the bd store are not part of
+the graph.
+
+Every node carries the identity it was parsed from, so a stale index is only slower, never
+wrong. Writes therefore do not rewrite the index each time: changes are persisted by `refresh`,
+by `flush` (also run at exit), and otherwise at most every `SDLC_DEPS_PERSIST_SECONDS`
+(default 5) per graph.
+
+Queries (topological order, cycles, transitive blockers, ready frontier) run over the
+in-memory graph and never touch the disk.
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from pydantic import ValidationError
+
+from .models import Bead
+
+_INDEX_VERSION = 1
+_DONE = "done"
+_TERMINAL = frozenset({"done", "failed", "superseded"})
+
+Identity = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class DepNode:
+    bead_id: str
+    status: str
+    depends_on: tuple[str, ...]
+    title: str
+    bead_type: str
+    priority: int
+    owner: Optional[str]
+    created_at: str
+    identity: Identity
+
+    @classmethod
+    def from_bead(cls, bead: Bead, identity: Identity) -> DepNode:
+        return cls(
+            bead_id=bead.bead_id,
+            status=bead.status.value,
+            depends_on=tuple(dict.fromkeys(bead.depends_on)),
+            title=bead.title,
+            bead_type=bead.bead_type.value,
+            priority=bead.priority,
+            owner=bead.owner,
+            created_at=bead.created_at.isoformat(),
+            identity=identity,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "depends_on": list(self.depends_on),
+            "title": self.title,
+            "bead_type": self.bead_type,
+            "priority": self.priority,
+            "owner": self.owner,
+            "created_at": self.created_at,
+            "identity": list(self.identity),
+        }
+
+    @classmethod
+    def from_json(cls, bead_id: str, payload: dict[str, Any]) -> DepNode:
+        ino, mtime_ns, size = (int(v) for v in payload["identity"])
+        owner = payload.get("owner")
+        return cls(
+            bead_id=bead_id,
+            status=str(payload["status"]),
+            depends_on=tuple(str(v) for v in payload["depends_on"]),
+            title=str(payload["title"]),
+            bead_type=str(payload["bead_type"]),
+            priority=int(payload["priority"]),
+            owner=str(owner) if owner is not None else None,
+            created_at=str(payload["created_at"]),
+            identity=(ino, mtime_ns, size),
+        )
+
+
+def _identity(path: Path) -> Optional[Identity]:
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def persist_interval_seconds() -> float:
+    raw = os.getenv("SDLC_DEPS_PERSIST_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else 5.0
+    except ValueError:
+        return 5.0
+
+
+class DependencyGraph:
+    def __init__(self, runs_dir: Path, index_path: Optional[Path] = None) -> None:
+        self.runs_dir = runs_dir
+        self.index_path = index_path
+        self._lock = threading.RLock()
+        self._nodes: dict[str, DepNode] = {}
+        # bead.json files that failed validation, so they are not re-parsed until they change.
+        self._invalid: dict[str, Identity] = {}
+        self._dependents: Optional[dict[str, list[str]]] = None
+        self._loaded = False
+        self._dirty = False
+        self._persisted_at: Optional[float] = None
+        self.beads_parsed = 0
+
+    # ---- maintenance ----
+
+    def refresh(self) -> bool:
+        """Re-stat runs/*/bead.json and re-parse the changed ones; True if the graph changed."""
+
+        with self._lock:
+            self._ensure_loaded()
+            changed = False
+            seen: set[str] = set()
+            try:
+                entries = list(os.scandir(self.runs_dir))
+            except FileNotFoundError:
+                entries = []
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                bead_id = entry.name
+                path = Path(entry.path) / "bead.json"
+                identity = _identity(path)
+                if identity is None:
+                    continue
+                seen.add(bead_id)
+                changed |= self._revalidate(bead_id, path, identity)
+            for bead_id in [bead_id for bead_id in self._nodes if bead_id not in seen]:
+                del self._nodes[bead_id]
+                changed = True
+            if changed:
+                self._dependents = None
+            if changed or self._dirty:
+                self._persist()
+            return changed
+
+    def revalidate(self, bead_ids: Iterable[str]) -> bool:
+        """Re-stat only the bead.json of `bead_ids`, re-parsing changed ones; True on change."""
+
+        with self._lock:
+            self._ensure_loaded()
+            changed = False
+            for bead_id in dict.fromkeys(bead_ids):
+                path = self.runs_dir / bead_id / "bead.json"
+                identity = _identity(path)
+                if identity is None:
+                    self._invalid.pop(bead_id, None)
+                    changed |= self._nodes.pop(bead_id, None) is not None
+                else:
+                    changed |= self._revalidate(bead_id, path, identity)
+            if changed:
+                self._dependents = None
+                self._mark_dirty()
+            return changed
+
+    def note_written(self, bead: Bead, path: Path) -> None:
+        """Record a bead.json the caller just wrote (no re-read)."""
+
+        identity = _identity(path)
+        if identity is None:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            node = DepNode.from_bead(bead, identity)
+            if self._nodes.get(bead.bead_id) == node:
+                return
+            self._invalid.pop(bead.bead_id, None)
+            self._nodes[bead.bead_id] = node
+            self._dependents = None
+            self._mark_dirty()
+
+    def flush(self) -> None:
+        """Persist changes that `note_written`/`revalidate` deferred."""
+
+        with self._lock:
+            if self._dirty:
+                self._persist()
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            self._load_persisted()
+
+    def _revalidate(self, bead_id: str, path: Path, identity: Identity) -> bool:
+        node = self._nodes.get(bead_id)
+        if node is not None and node.identity == identity:
+            return False
+        if self._invalid.get(bead_id) == identity:
+            return False
+        self._invalid.pop(bead_id, None)
+        return self._parse(bead_id, path, identity)
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if (
+            self._persisted_at is None
+            or time.monotonic() - self._persisted_at >= persist_interval_seconds()
+        ):
+            self._persist()
+
+    def _parse(self, bead_id: str, path: Path, identity: Identity) -> bool:
+        self.beads_parsed += 1
+        try:
+            bead = Bead.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            self._invalid[bead_id] = identity
+            return self._nodes.pop(bead_id, None) is not None
+        self._nodes[bead_id] = DepNode.from_bead(bead, identity)
+        return True
+
+    def _persist(self) -> None:
+        self._dirty = False
+        self._persisted_at = time.monotonic()
+        if self.index_path is None:
+            return
+        payload = {
+            "version": _INDEX_VERSION,
+            "nodes": {bead_id: node.to_json() for bead_id, node in sorted(self._nodes.items())},
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def _load_persisted(self) -> None:
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if payload.get("version") != _INDEX_VERSION:
+                return
+            nodes = {
+                str(bead_id): DepNode.from_json(str(bead_id), data)
+                for bead_id, data in payload["nodes"].items()
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return
+        self._nodes = nodes
+
+    # ---- queries ----
+
+    def node(self, bead_id: str) -> Optional[DepNode]:
+        with self._lock:
+            return self._nodes.get(bead_id)
+
+    def nodes(self) -> list[DepNode]:
+        with self._lock:
+            return [self._nodes[bead_id] for bead_id in sorted(self._nodes)]
+
+    def status(self, bead_id: str) -> Optional[str]:
+        node = self.node(bead_id)
+        return node.status if node is not None else None
+
+    def dependents(self, bead_id: str) -> list[str]:
+        """Beads that list `bead_id` in their `depends_on`."""
+
+        with self._lock:
+            if self._dependents is None:
+                reverse: dict[str, list[str]] = {}
+                for node in self._nodes.values():
+                    for dependency_id in node.depends_on:
+                        reverse.setdefault(dependency_id, []).append(node.bead_id)
+                self._dependents = {key: sorted(value) for key, value in reverse.items()}
+            return list(self._dependents.get(bead_id, []))
+
+    def blockers(self, bead_id: str) -> list[str]:
+        """Direct dependencies of `bead_id` that are not done (or not in the graph)."""
+
+        with self._lock:
+            node = self._nodes.get(bead_id)
+            if node is None:
+                return []
+            return [
+                dependency_id
+                for dependency_id in node.depends_on
+                if self.status(dependency_id) != _DONE
+            ]
+
+    def transitive_blockers(self, bead_id: str) -> list[str]:
+        """Every unfinished bead `bead_id` waits on, following unfinished dependencies."""
+
+        with self._lock:
+            found: set[str] = set()
+            stack = self.blockers(bead_id)
+            while stack:
+                dependency_id = stack.pop()
+                if dependency_id in found:
+                    continue
+                found.add(dependency_id)
+                stack.extend(self.blockers(dependency_id))
+            found.discard(bead_id)
+            return sorted(found)
+
+    def ready_frontier(self, status: Optional[str] = None) -> list[str]:
+        """Unfinished beads (optionally only those in `status`) with every dependency done."""
+
+        with self._lock:
+            return [
+                node.bead_id
+                for node in self.nodes()
+                if node.status not in _TERMINAL
+                and (status is None or node.status == status)
+                and not self.blockers(node.bead_id)
+            ]
+
+    def topological_order(self) -> list[str]:
+        """
+        Beads ordered so dependencies come first (ties broken by id). Beads on or behind a
+        cycle cannot be ordered and are left out; see `cycles()`.
+        """
+
+        with self._lock:
+            indegree = {
+                bead_id: sum(1 for dep in set(node.depends_on) if dep in self._nodes)
+                for bead_id, node in self._nodes.items()
+            }
+            heap = [bead_id for bead_id, degree in indegree.items() if degree == 0]
+            heapq.heapify(heap)
+            order: list[str] = []
+            while heap:
+                bead_id = heapq.heappop(heap)
+                order.append(bead_id)
+                for dependent_id in self.dependents(bead_id):
+                    indegree[dependent_id] -= 1
+                    if indegree[dependent_id] == 0:
+                        heapq.heappush(heap, dependent_id)
+            return order
+
+    def cycles(self) -> list[list[str]]:
+        """Dependency cycles (strongly connected components), each sorted, in id order."""
+
+        with self._lock:
+            index: dict[str, int] = {}
+            lowlink: dict[str, int] = {}
+            on_stack: set[str] = set()
+            stack: list[str] = []
+            found: list[list[str]] = []
+            counter = 0
+            for root in sorted(self._nodes):
+                if root in index:
+                    continue
+                # Iterative Tarjan: (node, iterator position over its dependencies).
+                work: list[tuple[str, int]] = [(root, 0)]
+                while work:
+                    bead_id, position = work.pop()
+                    if position == 0:
+                        index[bead_id] = lowlink[bead_id] = counter
+                        counter += 1
+                        stack.append(bead_id)
+                        on_stack.add(bead_id)
+                    edges = [dep for dep in self._nodes[bead_id].depends_on if dep in self._nodes]
+                    if position < len(edges):
+                        work.append((bead_id, position + 1))
+                        dependency_id = edges[position]
+                        if dependency_id not in index:
+                            work.append((dependency_id, 0))
+                        elif dependency_id in on_stack:
+                            lowlink[bead_id] = min(lowlink[bead_id], index[dependency_id])
+                        continue
+                    if lowlink[bead_id] == index[bead_id]:
+                        component: list[str] = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == bead_id:
+                                break
+                        if len(component) > 1 or bead_id in self._nodes[bead_id].depends_on:
+                            found.append(sorted(component))
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[bead_id])
+            return sorted(found)
+
+
+_GRAPHS: dict[tuple[Path, Optional[Path]], DependencyGraph] = {}
+_GRAPHS_LOCK = threading.Lock()
+
+
+def dependency_graph(runs_dir: Path, index_path: Optional[Path] = None) -> DependencyGraph:
+    """Return the process-wide graph for `runs_dir` (not refreshed; see `refresh`)."""
+
+    with _GRAPHS_LOCK:
+        key = (runs_dir, index_path)
+        graph = _GRAPHS.get(key)
+        if graph is None:
+            graph = DependencyGraph(runs_dir, index_path)
+            _GRAPHS[key] = graph
+        return graph
+
+
+def flush_dependency_graphs() -> None:
+    """Persist the deferred changes of every graph in this process."""
+
+    with _GRAPHS_LOCK:
+        graphs = list(_GRAPHS.values())
+    for graph in graphs:
+        try:
+            graph.flush()
+        except OSError:
+            pass
+
+
+atexit.register(flush_dependency_graphs)
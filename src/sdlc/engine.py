@@ -1,24 +1,45 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
 from dataclasses import dataclass, field
+from functools import partial
 import json
 import os
 from pathlib import Path
-import subprocess
-from typing import Callable, Iterable, Optional
-
-from .codec import sha256_canonical_json
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .artifact_cache import load_shared
+from .codec import (
+    model_hash_tree,
+    sha256_canonical_json,
+    sha256_canonical_model,
+    sha256_canonical_models,
+)
+from .git_probe import git_probe_scope
+from .ledger import BeadDecisionState
 from .io import (
+    BeadConflictError,
     Paths,
     git_head,
     git_is_dirty,
+    git_snapshot,
+    invalidate_git_probe,
+    iter_changed_paths,
+    iter_execution_records_for_bead_reversed,
+    list_bead_ids,
     load_bead,
     load_bead_review,
-    load_decision_ledger,
+    load_bead_versioned,
+    load_decision_state,
+    load_dependency_graph,
+    load_projection,
     load_evidence,
-    load_execution_records,
     load_grounding,
     now_utc,
+    write_bead,
     write_decision_entry,
     write_execution_record,
     write_model,
@@ -49,6 +70,7 @@ from .models import (
     OpenSpecState,
     RunPhase,
 )
+from .path_classifier import PathClassifier, normalize_path, path_classifier
 
 
 TRANSITIONS: dict[str, str] = {
@@ -79,6 +101,10 @@ TRANSITION_AUTHORITY: dict[tuple[str, str], set[str]] = {
 }
 
 
+# Gate helpers accept either raw ledger entries or a bead's materialized decision state.
+DecisionInputs = Iterable[DecisionLedgerEntry] | BeadDecisionState
+
+
 @dataclass
 class TransitionResult:
     ok: bool
@@ -87,6 +113,12 @@ class TransitionResult:
     phase: Optional[RunPhase] = None
     links: list[ArtifactLink] = field(default_factory=list)
     auto_abort: bool = False
+    # The artifacts the gates saw, reused by record_transition_attempt.
+    context: Optional[BeadContext] = field(default=None, repr=False, compare=False)
+    # The bead changed concurrently (or did not match `if_match`); reload and retry.
+    conflict: bool = False
+    # Version token of bead.json after the attempt (see io.bead_etag).
+    etag: Optional[str] = None
 
 
 @dataclass
@@ -95,6 +127,26 @@ class GateResult:
     notes: str = ""
 
 
+@dataclass
+class BeadContext:
+    """
+    Everything a transition's gates read, loaded once and shared by every gate and by
+    `record_transition_attempt`. Artifacts a transition does not need stay None.
+    """
+
+    paths: Paths
+    bead: Bead
+    decisions: BeadDecisionState
+    review: Optional[BeadReview] = None
+    ready_snapshot: Optional[dict[str, str]] = None
+    grounding: Optional[GroundingBundle] = None
+    evidence: Optional[EvidenceBundle] = None
+    # Raw runs/<bead_id>/openspec_ref.json (None when missing); parsed by the spec gate.
+    openspec_ref_json: Optional[str] = None
+    # depends_on id -> status of that bead, or None when it does not exist.
+    dependencies: dict[str, Optional[BeadStatus]] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class BoundaryEvaluation:
     registry: BoundaryRegistry
@@ -103,21 +155,21 @@ class BoundaryEvaluation:
     files_touched: int
     production_prefixes: list[str]
     registry_path: Optional[Path]
+    classifier: PathClassifier
+    # False when evaluation stopped at a limit: the counts are then lower bounds.
+    complete: bool = True
 
 
 def canonical_hash_for_model(model: Bead | BeadReview | EvidenceBundle) -> HashRef:
-    payload = model.model_dump(mode="json")
-    return HashRef(hash=sha256_canonical_json(payload))
+    return HashRef(hash=sha256_canonical_model(model))
 
 
 def canonical_hash_for_acceptance_checks(checks: list[AcceptanceCheck]) -> HashRef:
-    payload = [item.model_dump(mode="json") for item in checks]
-    return HashRef(hash=sha256_canonical_json(payload))
+    return HashRef(hash=sha256_canonical_models(checks))
 
 
 def canonical_hash_for_boundary_registry(registry: BoundaryRegistry) -> HashRef:
-    payload = registry.model_dump(mode="json")
-    return HashRef(hash=sha256_canonical_json(payload))
+    return HashRef(hash=sha256_canonical_model(registry))
 
 
 def _default_boundary_registry_path(paths: Paths) -> Path:
@@ -125,98 +177,109 @@ def _default_boundary_registry_path(paths: Paths) -> Path:
 
 
 def load_boundary_registry(paths: Paths, bead: Bead) -> tuple[BoundaryRegistry, Optional[Path]]:
+    registry, _, registry_path = _load_boundary_registry_hashed(paths, bead)
+    return registry, registry_path
+
+
+def _load_boundary_registry_hashed(
+    paths: Paths, bead: Bead
+) -> tuple[BoundaryRegistry, HashRef, Optional[Path]]:
+    """Registry, its canonical hash and its path; parsed and hashed once per file change."""
+
     if bead.boundary_registry_ref is not None:
         ref = bead.boundary_registry_ref
         if ref.artifact_type != "boundary_registry":
             raise ValueError("Bead.boundary_registry_ref must reference boundary_registry artifact")
         candidate = paths.repo_root / "sdlc" / f"{ref.artifact_id}.json"
         if candidate.exists():
-            return BoundaryRegistry.model_validate_json(
-                candidate.read_text(encoding="utf-8")
-            ), candidate
+            registry, digest = load_shared(candidate, BoundaryRegistry)
+            return registry, HashRef(hash=digest), candidate
     default_path = _default_boundary_registry_path(paths)
     if not default_path.exists():
         raise FileNotFoundError(f"BoundaryRegistry not found: {default_path}")
-    return BoundaryRegistry.model_validate_json(
-        default_path.read_text(encoding="utf-8")
-    ), default_path
+    registry, digest = load_shared(default_path, BoundaryRegistry)
+    return registry, HashRef(hash=digest), default_path
 
 
-def detect_changed_files(paths: Paths, head_before: Optional[str] = None) -> list[str]:
-    if git_head(paths) is None:
-        return []
-    try:
-        if head_before:
-            output = subprocess.check_output(
-                ["git", "diff", "--name-only", f"{head_before}..HEAD"],
-                cwd=paths.repo_root,
-                stderr=subprocess.DEVNULL,
-            )
-        else:
-            output = subprocess.check_output(
-                ["git", "diff", "--name-only", "HEAD"],
-                cwd=paths.repo_root,
-                stderr=subprocess.DEVNULL,
-            )
-        return [line.strip() for line in output.decode("utf-8").splitlines() if line.strip()]
-    except subprocess.CalledProcessError:
-        return []
-
+def detect_changed_files(paths: Paths, head_before: Optional[str] = None) -> Iterator[str]:
+    """
+    Changed paths, streamed from git: the working tree vs HEAD (including untracked files), or
+    the commits since `head_before`. Consumers may stop early; git is stopped with them.
+    """
 
-def _normalize_prefix(prefix: str) -> str:
-    return prefix.lstrip("./")
+    if head_before and git_head(paths) is None:
+        return
+    yield from iter_changed_paths(paths, since=head_before)
 
 
 def compute_touched_subsystems(
-    registry: BoundaryRegistry, changed_files: Iterable[str]
+    registry: BoundaryRegistry,
+    changed_files: Iterable[str],
+    *,
+    max_files: Optional[int] = None,
+    max_subsystems: Optional[int] = None,
+    classifier: Optional[PathClassifier] = None,
 ) -> tuple[list[str], int]:
+    """
+    Subsystems touched by `changed_files` and the number of files.
+
+    With `max_files` / `max_subsystems`, consumption stops as soon as either limit is exceeded.
+    """
+
+    if classifier is None:
+        classifier = path_classifier(registry)
     touched: set[str] = set()
     count = 0
-    normalized_files = [_normalize_prefix(path) for path in changed_files]
-    for path in normalized_files:
+    for changed in changed_files:
         count += 1
-        for subsystem in registry.subsystems:
-            for prefix in subsystem.paths:
-                normalized_prefix = _normalize_prefix(prefix)
-                if not normalized_prefix:
-                    continue
-                if path.startswith(normalized_prefix):
-                    touched.add(subsystem.name)
-                    break
+        touched.update(classifier.subsystems_for(changed))
+        if (max_files is not None and count > max_files) or (
+            max_subsystems is not None and len(touched) > max_subsystems
+        ):
+            break
     return sorted(touched), count
 
 
-def _production_prefixes(registry: BoundaryRegistry) -> list[str]:
-    prefixes: set[str] = set()
-    for subsystem in registry.subsystems:
-        for prefix in subsystem.paths:
-            normalized = _normalize_prefix(prefix)
-            if normalized:
-                prefixes.add(normalized)
-    return sorted(prefixes)
-
-
 def evaluate_boundary(
     paths: Paths,
     bead: Bead,
-    changed_files: Optional[list[str]] = None,
-    changed_files_provider: Optional[Callable[[Paths], list[str]]] = None,
+    changed_files: Optional[Iterable[str]] = None,
+    changed_files_provider: Optional[Callable[[Paths], Iterable[str]]] = None,
+    *,
+    max_files: Optional[int] = None,
+    max_subsystems: Optional[int] = None,
 ) -> BoundaryEvaluation:
-    registry, registry_path = load_boundary_registry(paths, bead)
-    registry_hash = canonical_hash_for_boundary_registry(registry)
+    registry, registry_hash, registry_path = _load_boundary_registry_hashed(paths, bead)
+    classifier = path_classifier(registry, registry_hash.hash, _discovery_allowlist())
     if changed_files is None:
         if changed_files_provider is None:
             changed_files = detect_changed_files(paths)
         else:
             changed_files = changed_files_provider(paths)
-    touched_subsystems, files_touched = compute_touched_subsystems(registry, changed_files)
+    touched_subsystems, files_touched = compute_touched_subsystems(
+        registry,
+        changed_files,
+        max_files=max_files,
+        max_subsystems=max_subsystems,
+        classifier=classifier,
+    )
+    close = getattr(changed_files, "close", None)
+    if close is not None:
+        # A streaming source we stopped reading early: stop git too.
+        close()
+    complete = not (
+        (max_files is not None and files_touched > max_files)
+        or (max_subsystems is not None and len(touched_subsystems) > max_subsystems)
+    )
     return BoundaryEvaluation(
         registry=registry,
         registry_hash=registry_hash,
         touched_subsystems=touched_subsystems,
         files_touched=files_touched,
-        production_prefixes=_production_prefixes(registry),
+        production_prefixes=classifier.production_prefixes,
         registry_path=registry_path,
+        classifier=classifier,
+        complete=complete,
     )
 
 
@@ -247,7 +310,7 @@ def _discovery_allowlist(default: str = "docs/,notes/,tools/,experiments/,runs/"
     raw = os.getenv("SDLC_DISCOVERY_ALLOWLIST", default)
     items = []
     for item in raw.split(","):
-        cleaned = _normalize_prefix(item.strip())
+        cleaned = normalize_path(item.strip())
         if cleaned:
             items.append(cleaned)
     return items
@@ -265,9 +328,11 @@ def _boundary_link(registry: BoundaryRegistry) -> ArtifactLink:
 def boundary_violation_notes(
     evaluation: BoundaryEvaluation, max_files: int, max_subsystems: int
 ) -> str:
+    # After an early stop the counts are lower bounds.
+    op = "=" if evaluation.complete else ">="
     parts = [
-        f"Boundary violation: files_touched={evaluation.files_touched} (limit {max_files})",
-        f"subsystems_touched={len(evaluation.touched_subsystems)} (limit {max_subsystems})",
+        f"Boundary violation: files_touched{op}{evaluation.files_touched} (limit {max_files})",
+        f"subsystems_touched{op}{len(evaluation.touched_subsystems)} (limit {max_subsystems})",
     ]
     if evaluation.touched_subsystems:
         parts.append("touched_subsystems=" + ", ".join(evaluation.touched_subsystems))
@@ -281,13 +346,11 @@ def discovery_policy_violation_notes(
     allowlist: list[str],
     policy_name: str = "Policy A",
 ) -> str:
-    normalized_files = [_normalize_prefix(path) for path in changed_files]
-    production_hits = []
-    for path in normalized_files:
-        for prefix in evaluation.production_prefixes:
-            if path.startswith(prefix):
-                production_hits.append(path)
-                break
+    production_hits = [
+        normalize_path(path)
+        for path in changed_files
+        if evaluation.classifier.classify(path).production
+    ]
     parts = [
         f"Discovery policy violation ({policy_name})",
         f"production_paths_hit={sorted(set(production_hits))}",
@@ -303,10 +366,12 @@ def _ready_acceptance_snapshot_path(paths: Paths, bead_id: str) -> Path:
 
 def _write_ready_acceptance_snapshot(paths: Paths, bead: Bead) -> None:
     snapshot_path = _ready_acceptance_snapshot_path(paths, bead.bead_id)
+    # One traversal: the acceptance-checks hash is the tree's digest of that field.
+    tree = model_hash_tree(bead)
     payload = {
         "bead_id": bead.bead_id,
-        "acceptance_checks_hash": canonical_hash_for_acceptance_checks(bead.acceptance_checks).hash,
-        "bead_hash": canonical_hash_for_model(bead).hash,
+        "acceptance_checks_hash": tree.fields["acceptance_checks"],
+        "bead_hash": tree.root,
     }
     from .io import dump_json
 
@@ -323,6 +388,35 @@ def _load_ready_acceptance_snapshot(paths: Paths, bead_id: str) -> Optional[dict
     return None
 
 
+def _evidence_bead_snapshot_path(paths: Paths, bead_id: str) -> Path:
+    return paths.bead_dir(bead_id) / "evidence_bead_hash.json"
+
+
+def _write_evidence_bead_snapshot(paths: Paths, bead: Bead) -> None:
+    """Per-field bead digests at evidence validation, so staleness can name what changed."""
+
+    tree = model_hash_tree(bead)
+    from .io import dump_json
+
+    dump_json(
+        _evidence_bead_snapshot_path(paths, bead.bead_id),
+        {"bead_id": bead.bead_id, "bead_hash": tree.root, "field_hashes": tree.fields},
+    )
+
+
+def _changed_bead_fields(paths: Paths, bead: Bead, validated_hash: str) -> Optional[list[str]]:
+    snapshot_path = _evidence_bead_snapshot_path(paths, bead.bead_id)
+    if not snapshot_path.exists():
+        return None
+    payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("bead_hash") != validated_hash:
+        return None
+    field_hashes = payload.get("field_hashes")
+    if not isinstance(field_hashes, dict):
+        return None
+    return model_hash_tree(bead).changed_fields({str(k): str(v) for k, v in field_hashes.items()})
+
+
 def ensure_bead_artifact_id(bead: Bead) -> Optional[str]:
     if bead.artifact_id != bead.bead_id:
         return "Bead artifact_id must equal bead_id"
@@ -359,30 +453,15 @@ def _require_review_for_ready(bead: Bead, review: Optional[BeadReview]) -> Optio
     return None
 
 
-def _bucket_l_justification_decision(paths: Paths, bead_id: str) -> Optional[DecisionLedgerEntry]:
-    for entry in load_decision_ledger(paths):
-        if entry.bead_id != bead_id:
-            continue
-        if entry.decision_type not in {
-            DecisionType.assumption,
-            DecisionType.tradeoff,
-            DecisionType.scope_change,
-        }:
-            continue
-        if not entry.summary.strip():
-            continue
-        return entry
-    return None
-
-
-def _plan_gate_bucket_l(paths: Paths, bead_id: str, review: Optional[BeadReview]) -> Optional[str]:
+def _plan_gate_bucket_l(ctx: BeadContext) -> Optional[str]:
+    review = ctx.review
     if review is None:
         return None
     if review.effort_bucket != EffortBucket.L:
         return None
     if review.split_required and review.split_proposal is not None:
         return None
-    if _bucket_l_justification_decision(paths, bead_id) is not None:
+    if ctx.decisions.justification is not None:
         return None
     if review.split_required and review.split_proposal is None:
         return "BeadReview split_required true but split_proposal missing for bucket L"
@@ -401,12 +480,8 @@ def _intervention_decision_types() -> set[DecisionType]:
     }
 
 
-def _count_interventions(paths: Paths, bead_id: str) -> int:
-    return sum(
-        1
-        for entry in load_decision_ledger(paths)
-        if entry.bead_id == bead_id and entry.decision_type in _intervention_decision_types()
-    )
+def _count_interventions(decisions: BeadDecisionState) -> int:
+    return decisions.intervention_count(_intervention_decision_types())
 
 
 def _elapsed_minutes(bead: Bead) -> int:
@@ -415,7 +490,9 @@ def _elapsed_minutes(bead: Bead) -> int:
     return seconds // 60
 
 
-def anti_stall_errors(paths: Paths, bead: Bead) -> list[str]:
+def anti_stall_errors(
+    paths: Paths, bead: Bead, decisions: Optional[BeadDecisionState] = None
+) -> list[str]:
     errors: list[str] = []
     max_elapsed = bead.max_elapsed_minutes
     if max_elapsed is None:
@@ -428,7 +505,9 @@ def anti_stall_errors(paths: Paths, bead: Bead) -> list[str]:
     if max_interventions is None:
         max_interventions = _env_optional_int("SDLC_MAX_INTERVENTIONS_DEFAULT")
     if max_interventions is not None:
-        interventions = _count_interventions(paths, bead.bead_id)
+        if decisions is None:
+            decisions = load_decision_state(paths, bead.bead_id)
+        interventions = _count_interventions(decisions)
         if interventions > max_interventions:
             types = ", ".join(sorted(t.value for t in _intervention_decision_types()))
             errors.append(
@@ -445,18 +524,18 @@ def _phase_for_transition(from_status: str, to_status: str) -> RunPhase:
     return phase_for_status_transition(from_status, to_status)
 
 
-def _spec_gate(paths: Paths, bead: Bead) -> Optional[str]:
+def _spec_gate(ctx: BeadContext) -> Optional[str]:
+    bead = ctx.bead
     if bead.bead_type != BeadType.implementation:
         return None
     if bead.openspec_ref is None:
         return "Bead.openspec_ref missing"
     if bead.openspec_ref.artifact_type != "openspec_ref":
         return "Bead.openspec_ref must reference openspec_ref artifact"
-    ref_path = paths.bead_dir(bead.bead_id) / "openspec_ref.json"
-    if not ref_path.exists():
+    if ctx.openspec_ref_json is None:
         return "OpenSpecRef artifact missing (runs/<bead_id>/openspec_ref.json); run grounding/spec sync"
     try:
-        ref = OpenSpecRef.model_validate_json(ref_path.read_text(encoding="utf-8"))
+        ref = OpenSpecRef.model_validate_json(ctx.openspec_ref_json)
     except Exception as exc:  # noqa: BLE001
         return f"OpenSpecRef invalid: {exc}"
     if ref.state != OpenSpecState.approved:
@@ -470,22 +549,22 @@ def _spec_gate(paths: Paths, bead: Bead) -> Optional[str]:
     return None
 
 
-def _execution_profile_gate(paths: Paths, bead: Bead) -> Optional[str]:
-    if bead.execution_profile != ExecutionProfile.exception:
+def _execution_profile_gate(ctx: BeadContext) -> Optional[str]:
+    if ctx.bead.execution_profile != ExecutionProfile.exception:
         return None
-    if find_active_exception_decision(paths, bead.bead_id) is not None:
+    if ctx.decisions.active_exception(now_utc()) is not None:
         return None
     return "Execution profile exception requires DecisionLedgerEntry"
 
 
-def _grounding_gate(paths: Paths, bead: Bead) -> Optional[str]:
-    if load_grounding(paths, bead.bead_id) is None:
+def _grounding_gate(ctx: BeadContext) -> Optional[str]:
+    if ctx.grounding is None:
         return "GroundingBundle missing"
     return None
 
 
-def _evidence_gate(paths: Paths, bead: Bead) -> Optional[str]:
-    evidence = load_evidence(paths, bead.bead_id)
+def _evidence_gate(ctx: BeadContext) -> Optional[str]:
+    evidence = ctx.evidence
     if evidence is None:
         return "EvidenceBundle missing"
     if evidence.status != EvidenceStatus.validated:
@@ -493,248 +572,794 @@ def _evidence_gate(paths: Paths, bead: Bead) -> Optional[str]:
     return None
 
 
-def _approval_gate(paths: Paths, bead: Bead) -> Optional[str]:
-    if find_approval_decision(paths, bead.bead_id) is not None:
+def _approval_gate(ctx: BeadContext) -> Optional[str]:
+    if ctx.decisions.latest_approval is not None:
         return None
     return "Approval DecisionLedgerEntry missing"
 
 
-def _dependencies_gate(paths: Paths, bead: Bead) -> GateResult:
+def _dependencies_gate(ctx: BeadContext) -> GateResult:
+    bead = ctx.bead
     if not bead.depends_on:
         return GateResult(True, "")
     blockers: list[str] = []
     for dependency_id in bead.depends_on:
-        try:
-            dependency = load_bead(paths, dependency_id)
-        except FileNotFoundError:
+        status = ctx.dependencies.get(dependency_id)
+        if status is None:
             blockers.append(f"{dependency_id} (missing)")
             continue
-        if dependency.status != BeadStatus.done:
-            blockers.append(f"{dependency_id} ({dependency.status.value})")
+        if status != BeadStatus.done:
+            blockers.append(f"{dependency_id} ({status.value})")
     if blockers:
         return GateResult(False, "Dependencies not done: " + ", ".join(blockers))
     return GateResult(True, "")
 
 
+_PREFETCH_WORKERS = 8
+_PREFETCH_POOL: Optional[ThreadPoolExecutor] = None
+_PREFETCH_POOL_LOCK = threading.Lock()
+
+
+def _prefetch_pool() -> ThreadPoolExecutor:
+    global _PREFETCH_POOL
+    with _PREFETCH_POOL_LOCK:
+        if _PREFETCH_POOL is None:
+            _PREFETCH_POOL = ThreadPoolExecutor(
+                max_workers=_PREFETCH_WORKERS, thread_name_prefix="sdlc-prefetch"
+            )
+        return _PREFETCH_POOL
+
+
+def _run_parallel(tasks: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run IO-bound loaders concurrently (in the caller's context, e.g. its git probe scope)."""
+
+    if len(tasks) <= 1:
+        return {name: task() for name, task in tasks.items()}
+    pool = _prefetch_pool()
+    futures: dict[str, Future[Any]] = {
+        name: pool.submit(contextvars.copy_context().run, task) for name, task in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def _dependency_statuses(paths: Paths, bead: Bead) -> dict[str, Optional[BeadStatus]]:
+    """Statuses of `bead.depends_on` from the dependency graph (bd-only beads are loaded)."""
+
+    dependency_ids = list(dict.fromkeys(bead.depends_on))
+    graph = load_dependency_graph(paths, dependency_ids)
+    statuses: dict[str, Optional[BeadStatus]] = {}
+    for dependency_id in dependency_ids:
+        status = graph.status(dependency_id)
+        if status is not None:
+            statuses[dependency_id] = BeadStatus(status)
+            continue
+        try:
+            statuses[dependency_id] = load_bead(paths, dependency_id).status
+        except FileNotFoundError:
+            statuses[dependency_id] = None
+    return statuses
+
+
+def _read_text_if_exists(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _warm_boundary_inputs(paths: Paths, bead: Bead) -> None:
+    """Parse the registry and take the git snapshot while the other artifacts load."""
+
+    try:
+        _load_boundary_registry_hashed(paths, bead)
+    except (FileNotFoundError, ValueError):
+        pass  # reported by the boundary gate itself
+    git_snapshot(paths)
+
+
+def _context_needs(bead: Bead, to_status: Optional[str]) -> set[str]:
+    """Artifacts the gates of `bead.status -> to_status` read (all of them when None)."""
+
+    if to_status is None:
+        return {"review", "ready_snapshot", "dependencies", "grounding", "openspec_ref", "evidence"}
+    needs: set[str] = set()
+    from_status = bead.status.value
+    if (from_status, to_status) == (BeadStatus.sized.value, BeadStatus.ready.value):
+        needs.add("review")
+    elif (from_status, to_status) == (BeadStatus.ready.value, BeadStatus.in_progress.value):
+        needs.update({"review", "ready_snapshot", "dependencies", "grounding", "openspec_ref"})
+    elif (from_status, to_status) == (
+        BeadStatus.verification_pending.value,
+        BeadStatus.verified.value,
+    ):
+        needs.update({"evidence", "boundary"})
+    if bead.bead_type == BeadType.discovery and to_status in {
+        BeadStatus.in_progress.value,
+        BeadStatus.verified.value,
+    }:
+        needs.add("boundary")
+    return needs
+
+
+def load_bead_context(
+    paths: Paths,
+    bead_id: str,
+    to_status: Optional[str] = None,
+    *,
+    bead: Optional[Bead] = None,
+) -> BeadContext:
+    """
+    Load `bead_id` and, in one parallel round, every artifact the gates for a transition to
+    `to_status` will read (every gate's artifacts when `to_status` is None).
+    """
+
+    if bead is None:
+        bead = load_bead(paths, bead_id)
+    needs = _context_needs(bead, to_status)
+    tasks: dict[str, Callable[[], Any]] = {
+        "decisions": lambda: load_decision_state(paths, bead_id),
+    }
+    if "review" in needs:
+        tasks["review"] = lambda: load_bead_review(paths, bead_id)
+    if "ready_snapshot" in needs:
+        tasks["ready_snapshot"] = lambda: _load_ready_acceptance_snapshot(paths, bead_id)
+    if "grounding" in needs:
+        tasks["grounding"] = lambda: load_grounding(paths, bead_id)
+    if "openspec_ref" in needs:
+        ref_path = paths.bead_dir(bead_id) / "openspec_ref.json"
+        tasks["openspec_ref"] = lambda: _read_text_if_exists(ref_path)
+    if "evidence" in needs:
+        tasks["evidence"] = lambda: load_evidence(paths, bead_id)
+    if "boundary" in needs:
+        boundary_bead = bead
+        tasks["boundary"] = lambda: _warm_boundary_inputs(paths, boundary_bead)
+    if "dependencies" in needs and bead.depends_on:
+        tasks["dependencies"] = partial(_dependency_statuses, paths, bead)
+    loaded = _run_parallel(tasks)
+    return BeadContext(
+        paths=paths,
+        bead=bead,
+        decisions=loaded["decisions"],
+        review=loaded.get("review"),
+        ready_snapshot=loaded.get("ready_snapshot"),
+        grounding=loaded.get("grounding"),
+        evidence=loaded.get("evidence"),
+        openspec_ref_json=loaded.get("openspec_ref"),
+        dependencies=loaded.get("dependencies", {}),
+    )
+
+
 def _apply_transition(bead: Bead, new_status: BeadStatus) -> None:
     bead.status = new_status
 
 
-def request_transition(
-    paths: Paths, bead_id: str, transition: str, actor: Actor
-) -> TransitionResult:
-    bead = load_bead(paths, bead_id)
-    phase_hint = (
-        RunPhase.plan if bead.status in {BeadStatus.draft, BeadStatus.sized} else RunPhase.implement
-    )
+@dataclass
+class TransitionEvaluation:
+    """What `request_transition` would do for one transition, computed without writing."""
+
+    from_status: str
+    to_status: str
+    phase: RunPhase
+    errors: list[str] = field(default_factory=list)
+    info_notes: list[str] = field(default_factory=list)
+    links: list[ArtifactLink] = field(default_factory=list)
+    force_abort: bool = False
+    context: Optional[BeadContext] = field(default=None, repr=False, compare=False)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def transition(self) -> str:
+        return f"{self.from_status} -> {self.to_status}"
+
+    @property
+    def notes(self) -> str:
+        notes = "; ".join(self.errors) if self.errors else ""
+        if self.info_notes:
+            extra = "; ".join(self.info_notes)
+            notes = f"{notes}; {extra}".strip("; ").strip()
+        return notes
+
+
+def _phase_hint(bead: Bead) -> RunPhase:
     if bead.status in {
         BeadStatus.verification_pending,
         BeadStatus.verified,
         BeadStatus.approval_pending,
         BeadStatus.done,
     }:
-        phase_hint = RunPhase.verify
+        return RunPhase.verify
+    if bead.status in {BeadStatus.draft, BeadStatus.sized}:
+        return RunPhase.plan
+    return RunPhase.implement
 
-    from_status, _, to_status = transition.partition("->")
-    from_status = from_status.strip()
-    to_status = to_status.strip()
-    if from_status != bead.status.value:
-        return TransitionResult(
-            False,
-            (
-                "Illegal transition: bead is "
-                f"'{bead.status.value}', request was '{from_status} -> {to_status}'"
-            ),
-            phase=_phase_for_transition(from_status, to_status),
-        )
-    if not allowed_transition(from_status, to_status):
-        return TransitionResult(
-            False,
-            f"Illegal transition: '{from_status} -> {to_status}' is not allowed",
-            phase=_phase_for_transition(from_status, to_status),
-        )
 
-    authority = TRANSITION_AUTHORITY.get((from_status, to_status))
-    if authority is not None and actor.kind not in authority:
-        return TransitionResult(
-            False,
-            (
-                f"Authority violation: {actor.kind} may not request '{from_status}->{to_status}' "
-                f"(requires: {sorted(authority)})"
-            ),
-            phase=phase_hint,
+@dataclass(frozen=True)
+class GateOutcome:
+    """What one gate adds to a `TransitionEvaluation`; frozen so cached outcomes can be shared."""
+
+    errors: tuple[str, ...] = ()
+    info_notes: tuple[str, ...] = ()
+    links: tuple[ArtifactLink, ...] = ()
+    force_abort: bool = False
+
+
+@dataclass
+class _Gate:
+    name: str
+    compute: Callable[[], GateOutcome]
+    # Everything the verdict depends on (JSON-serializable); None means "never memoize",
+    # e.g. for gates that read the clock.
+    inputs: Optional[Callable[[], Optional[list[Any]]]] = None
+
+
+_GATE_CACHE_SIZE = 1024
+# (repo root, bead id, transition, gate name) -> (input fingerprint, outcome)
+_GATE_CACHE: OrderedDict[tuple[str, str, str, str], tuple[str, GateOutcome]] = OrderedDict()
+_GATE_CACHE_LOCK = threading.Lock()
+
+
+def gate_cache_enabled() -> bool:
+    return os.getenv("SDLC_GATE_CACHE", "1").strip().lower() not in {"0", "false", "no"}
+
+
+def _run_gates(
+    paths: Paths, bead_id: str, transition: str, gates: list[_Gate]
+) -> tuple[list[GateOutcome], list[str]]:
+    """
+    Run `gates` in order, reusing the cached outcome of every gate whose input fingerprint is
+    unchanged since it last ran for this bead and transition. Returns the outcomes and the
+    names of the gates served from the cache.
+    """
+
+    enabled = gate_cache_enabled()
+    outcomes: list[GateOutcome] = []
+    cached: list[str] = []
+    for gate in gates:
+        inputs = gate.inputs() if enabled and gate.inputs is not None else None
+        if inputs is None:
+            outcomes.append(gate.compute())
+            continue
+        key = (str(paths.repo_root), bead_id, transition, gate.name)
+        fingerprint = sha256_canonical_json(inputs)
+        with _GATE_CACHE_LOCK:
+            hit = _GATE_CACHE.get(key)
+            if hit is not None and hit[0] == fingerprint:
+                _GATE_CACHE.move_to_end(key)
+        if hit is not None and hit[0] == fingerprint:
+            outcomes.append(hit[1])
+            cached.append(gate.name)
+            continue
+        outcome = gate.compute()
+        with _GATE_CACHE_LOCK:
+            _GATE_CACHE[key] = (fingerprint, outcome)
+            _GATE_CACHE.move_to_end(key)
+            while len(_GATE_CACHE) > _GATE_CACHE_SIZE:
+                _GATE_CACHE.popitem(last=False)
+        outcomes.append(outcome)
+    return outcomes, cached
+
+
+def _model_fingerprint(
+    model: Optional[Bead | BeadReview | EvidenceBundle | GroundingBundle],
+) -> Optional[str]:
+    return model_hash_tree(model).root if model is not None else None
+
+
+def _single_error(error: Optional[str]) -> GateOutcome:
+    return GateOutcome(errors=(error,) if error else ())
+
+
+class _BoundaryInputs:
+    """Changed paths and boundary evaluation shared by the boundary and discovery gates."""
+
+    def __init__(self, paths: Paths, bead: Bead) -> None:
+        self.paths = paths
+        self.bead = bead
+        self._changed_files: Optional[list[str]] = None
+        self._evaluation: Optional[BoundaryEvaluation] = None
+
+    def changed_files(self) -> list[str]:
+        if self._changed_files is None:
+            self._changed_files = list(detect_changed_files(self.paths))
+        return self._changed_files
+
+    def evaluate(
+        self, max_files: Optional[int] = None, max_subsystems: Optional[int] = None
+    ) -> BoundaryEvaluation:
+        if self._evaluation is None:
+            if self._changed_files is not None or self.bead.bead_type == BeadType.discovery:
+                # Policy A needs every changed path, so no early stop.
+                changed_files: Iterable[str] = self.changed_files()
+            else:
+                changed_files = detect_changed_files(self.paths)
+            self._evaluation = evaluate_boundary(
+                self.paths,
+                self.bead,
+                changed_files=changed_files,
+                max_files=max_files,
+                max_subsystems=max_subsystems,
+            )
+        return self._evaluation
+
+    def fingerprint(self, *extra: Any) -> Optional[list[Any]]:
+        """
+        Registry, bead and the working tree's `git status`; None when the registry cannot be
+        loaded or there is no git snapshot.
+
+        The status is the probe's memoized snapshot, so the changed paths are neither listed
+        nor streamed here and `evaluate` can still stop at the first limit it exceeds.
+        """
+
+        try:
+            _, registry_hash, registry_path = _load_boundary_registry_hashed(self.paths, self.bead)
+        except (FileNotFoundError, ValueError):
+            return None
+        snapshot = git_snapshot(self.paths)
+        if snapshot is None:
+            return None
+        status = sha256_canonical_json(
+            [
+                snapshot.head,
+                snapshot.changed_files,
+                snapshot.renamed_from,
+                snapshot.untracked_files,
+            ]
         )
+        return [
+            _model_fingerprint(self.bead),
+            registry_hash.hash,
+            registry_path.as_posix() if registry_path is not None else None,
+            status,
+            _discovery_allowlist(),
+            *extra,
+        ]
+
+    def registry_outcome(self, evaluation: BoundaryEvaluation) -> GateOutcome:
+        notes: list[str] = []
+        if self.bead.boundary_registry_ref is None and evaluation.registry_path is not None:
+            notes.append(f"boundary_registry_default={evaluation.registry_path.as_posix()}")
+        notes.append(f"boundary_registry_hash={evaluation.registry_hash.hash}")
+        return GateOutcome(info_notes=tuple(notes), links=(_boundary_link(evaluation.registry),))
+
+
+def _merge_outcomes(first: GateOutcome, second: GateOutcome) -> GateOutcome:
+    return GateOutcome(
+        errors=first.errors + second.errors,
+        info_notes=first.info_notes + second.info_notes,
+        links=first.links + second.links,
+        force_abort=first.force_abort or second.force_abort,
+    )
 
-    errors: list[str] = []
-    info_notes: list[str] = []
-    links: list[ArtifactLink] = []
-    boundary_eval: Optional[BoundaryEvaluation] = None
-    changed_files: Optional[list[str]] = None
+
+def _boundary_limits_gate(boundary: _BoundaryInputs) -> GateOutcome:
+    try:
+        max_files = _env_int("SDLC_MAX_FILES_TOUCHED", 8)
+        max_subsystems = _env_int("SDLC_MAX_SUBSYSTEMS_TOUCHED", 2)
+        evaluation = boundary.evaluate(max_files, max_subsystems)
+    except (FileNotFoundError, ValueError) as exc:
+        return GateOutcome(errors=(str(exc),))
+    notes = [
+        "boundary_evaluation="
+        f"files_touched:{evaluation.files_touched},"
+        f"subsystems_touched:{len(evaluation.touched_subsystems)}"
+        + ("" if evaluation.complete else ",partial")
+    ]
     force_abort = False
+    if evaluation.files_touched > max_files or len(evaluation.touched_subsystems) > max_subsystems:
+        notes.append(boundary_violation_notes(evaluation, max_files, max_subsystems))
+        notes.append("Boundary limit exceeded: forcing abort to aborted:needs-discovery")
+        force_abort = True
+    return _merge_outcomes(
+        boundary.registry_outcome(evaluation),
+        GateOutcome(info_notes=tuple(notes), force_abort=force_abort),
+    )
 
-    def ensure_boundary_eval() -> BoundaryEvaluation:
-        nonlocal boundary_eval, changed_files
-        if boundary_eval is None:
-            changed_files = detect_changed_files(paths)
-            boundary_eval = evaluate_boundary(paths, bead, changed_files=changed_files)
-            links.append(_boundary_link(boundary_eval.registry))
-            if bead.boundary_registry_ref is None and boundary_eval.registry_path is not None:
-                info_notes.append(
-                    f"boundary_registry_default={boundary_eval.registry_path.as_posix()}"
-                )
-            info_notes.append(f"boundary_registry_hash={boundary_eval.registry_hash.hash}")
-        return boundary_eval
 
-    artifact_error = ensure_bead_artifact_id(bead)
-    if artifact_error:
-        errors.append(artifact_error)
-
-    if bead.status == BeadStatus.draft and to_status == BeadStatus.sized.value:
-        pass
-    elif bead.status == BeadStatus.sized and to_status == BeadStatus.ready.value:
-        review = load_bead_review(paths, bead_id)
-        review_error = _require_review_for_ready(bead, review)
-        if review_error:
-            errors.append(review_error)
-        plan_error = _plan_gate_bucket_l(paths, bead_id, review)
-        if plan_error:
-            errors.append(plan_error)
-        if not errors:
-            assert review is not None
-            apply_acceptance_checks_from_review(bead, review)
-            _write_ready_acceptance_snapshot(paths, bead)
-    elif bead.status == BeadStatus.ready and to_status == BeadStatus.in_progress.value:
-        review = load_bead_review(paths, bead_id)
-        if review and not acceptance_checks_equal(
-            bead.acceptance_checks, review.tightened_acceptance_checks
-        ):
-            errors.append("Acceptance checks changed after ready")
-        snapshot = _load_ready_acceptance_snapshot(paths, bead_id)
-        if snapshot is None:
-            errors.append("Acceptance checks snapshot missing after ready")
-        else:
-            expected_hash = snapshot.get("acceptance_checks_hash")
-            if expected_hash != canonical_hash_for_acceptance_checks(bead.acceptance_checks).hash:
-                errors.append("Acceptance checks changed after ready")
-        dependency_result = _dependencies_gate(paths, bead)
-        if not dependency_result.ok:
-            errors.append(dependency_result.notes)
-        spec_error = _spec_gate(paths, bead)
-        if spec_error:
-            errors.append(spec_error)
-        profile_error = _execution_profile_gate(paths, bead)
-        if profile_error:
-            errors.append(profile_error)
-        grounding_error = _grounding_gate(paths, bead)
-        if grounding_error:
-            errors.append(grounding_error)
-    elif (
-        bead.status == BeadStatus.in_progress and to_status == BeadStatus.verification_pending.value
+def _discovery_policy_gate(boundary: _BoundaryInputs, report_registry: bool) -> GateOutcome:
+    try:
+        evaluation = boundary.evaluate()
+        changed_files = boundary.changed_files()
+    except (FileNotFoundError, ValueError) as exc:
+        return GateOutcome(errors=(str(exc),))
+    allowlist = _discovery_allowlist()
+    notes = [
+        (
+            "discovery_policy=Policy A;"
+            f"allowlist={allowlist};"
+            f"production_prefixes={evaluation.production_prefixes}"
+        )
+    ]
+    # One classification per path: production hit and allowlist membership together.
+    classifier = path_classifier(evaluation.registry, evaluation.registry_hash.hash, allowlist)
+    outside_allowlist: list[str] = []
+    production_hits: list[str] = []
+    for path in changed_files:
+        path_class = classifier.classify(path)
+        if not path_class.allowlisted:
+            outside_allowlist.append(normalize_path(path))
+        if path_class.production:
+            production_hits.append(normalize_path(path))
+    errors: list[str] = []
+    if outside_allowlist or production_hits:
+        parts = ["Discovery policy violation (Policy A)"]
+        if production_hits:
+            parts.append(f"production_paths_hit={sorted(set(production_hits))}")
+        if outside_allowlist:
+            parts.append(f"outside_allowlist={sorted(set(outside_allowlist))}")
+        parts.append(f"allowlist={allowlist}")
+        parts.append(f"boundary_registry_hash={evaluation.registry_hash.hash}")
+        errors.append("; ".join(parts))
+    outcome = GateOutcome(errors=tuple(errors), info_notes=tuple(notes))
+    if report_registry:
+        outcome = _merge_outcomes(boundary.registry_outcome(evaluation), outcome)
+    return outcome
+
+
+def _acceptance_snapshot_gate(ctx: BeadContext) -> GateOutcome:
+    bead = ctx.bead
+    errors: list[str] = []
+    review = ctx.review
+    if review and not acceptance_checks_equal(
+        bead.acceptance_checks, review.tightened_acceptance_checks
     ):
-        pass
+        errors.append("Acceptance checks changed after ready")
+    snapshot = ctx.ready_snapshot
+    if snapshot is None:
+        errors.append("Acceptance checks snapshot missing after ready")
+    else:
+        expected_hash = snapshot.get("acceptance_checks_hash")
+        if expected_hash != model_hash_tree(bead).fields["acceptance_checks"]:
+            errors.append("Acceptance checks changed after ready")
+    return GateOutcome(errors=tuple(errors))
+
+
+def _anti_stall_gate(paths: Paths, ctx: BeadContext) -> GateOutcome:
+    anti_stall = anti_stall_errors(paths, ctx.bead, ctx.decisions)
+    if not anti_stall:
+        return GateOutcome()
+    return GateOutcome(errors=(*anti_stall, "Anti-stall threshold exceeded: abort required"))
+
+
+def _transition_gates(paths: Paths, ctx: BeadContext, to_status: str) -> list[_Gate]:
+    """The gates of `ctx.bead.status -> to_status`, in the order their findings are reported."""
+
+    bead = ctx.bead
+    decisions = ctx.decisions
+    boundary = _BoundaryInputs(paths, bead)
+    gates: list[_Gate] = []
+    if bead.status == BeadStatus.sized and to_status == BeadStatus.ready.value:
+        gates.append(
+            _Gate(
+                "review",
+                lambda: _merge_outcomes(
+                    _single_error(_require_review_for_ready(bead, ctx.review)),
+                    _single_error(_plan_gate_bucket_l(ctx)),
+                ),
+                lambda: [_model_fingerprint(ctx.review), decisions.entry_count],
+            )
+        )
+    elif bead.status == BeadStatus.ready and to_status == BeadStatus.in_progress.value:
+        gates.append(
+            _Gate(
+                "acceptance_snapshot",
+                partial(_acceptance_snapshot_gate, ctx),
+                lambda: [
+                    model_hash_tree(bead).fields["acceptance_checks"],
+                    _model_fingerprint(ctx.review),
+                    ctx.ready_snapshot,
+                ],
+            )
+        )
+        gates.append(
+            _Gate(
+                "dependencies",
+                lambda: _single_error(_dependencies_gate(ctx).notes or None),
+                lambda: [
+                    list(bead.depends_on),
+                    {
+                        dependency_id: status.value if status is not None else None
+                        for dependency_id, status in ctx.dependencies.items()
+                    },
+                ],
+            )
+        )
+        gates.append(
+            _Gate(
+                "spec",
+                lambda: _single_error(_spec_gate(ctx)),
+                lambda: [_model_fingerprint(bead), ctx.openspec_ref_json],
+            )
+        )
+        # Reads the clock (exception expiry), so it is always re-evaluated.
+        gates.append(
+            _Gate("execution_profile", lambda: _single_error(_execution_profile_gate(ctx)))
+        )
+        gates.append(
+            _Gate(
+                "grounding",
+                lambda: _single_error(_grounding_gate(ctx)),
+                lambda: [_model_fingerprint(ctx.grounding)],
+            )
+        )
     elif bead.status == BeadStatus.verification_pending and to_status == BeadStatus.verified.value:
-        evidence_error = _evidence_gate(paths, bead)
-        if evidence_error:
-            errors.append(evidence_error)
-        try:
-            evaluation = ensure_boundary_eval()
-            max_files = _env_int("SDLC_MAX_FILES_TOUCHED", 8)
-            max_subsystems = _env_int("SDLC_MAX_SUBSYSTEMS_TOUCHED", 2)
-            info_notes.append(
-                "boundary_evaluation="
-                f"files_touched:{evaluation.files_touched},"
-                f"subsystems_touched:{len(evaluation.touched_subsystems)}"
+        gates.append(
+            _Gate(
+                "evidence",
+                lambda: _single_error(_evidence_gate(ctx)),
+                lambda: [_model_fingerprint(ctx.evidence)],
             )
-            if (
-                evaluation.files_touched > max_files
-                or len(evaluation.touched_subsystems) > max_subsystems
-            ):
-                info_notes.append(boundary_violation_notes(evaluation, max_files, max_subsystems))
-                info_notes.append(
-                    "Boundary limit exceeded: forcing abort to aborted:needs-discovery"
-                )
-                force_abort = True
-        except (FileNotFoundError, ValueError) as exc:
-            errors.append(str(exc))
-        anti_stall = anti_stall_errors(paths, bead)
-        if anti_stall:
-            errors.extend(anti_stall)
-            errors.append("Anti-stall threshold exceeded: abort required")
-    elif bead.status == BeadStatus.verified and to_status == BeadStatus.approval_pending.value:
-        pass
+        )
+        gates.append(
+            _Gate(
+                "boundary",
+                partial(_boundary_limits_gate, boundary),
+                lambda: boundary.fingerprint(
+                    _env_int("SDLC_MAX_FILES_TOUCHED", 8),
+                    _env_int("SDLC_MAX_SUBSYSTEMS_TOUCHED", 2),
+                ),
+            )
+        )
+        # Elapsed minutes depend on the clock, so it is always re-evaluated.
+        gates.append(_Gate("anti_stall", partial(_anti_stall_gate, paths, ctx)))
     elif bead.status == BeadStatus.approval_pending and to_status == BeadStatus.done.value:
-        approval_error = _approval_gate(paths, bead)
-        if approval_error:
-            errors.append(approval_error)
-    elif to_status in FAILURE_TARGETS:
-        pass
+        gates.append(
+            _Gate(
+                "approval",
+                lambda: _single_error(_approval_gate(ctx)),
+                lambda: [decisions.entry_count],
+            )
+        )
 
     if bead.bead_type == BeadType.discovery and to_status in {
         BeadStatus.in_progress.value,
         BeadStatus.verified.value,
     }:
-        try:
-            evaluation = ensure_boundary_eval()
-            allowlist = _discovery_allowlist()
-            info_notes.append(
-                "discovery_policy=Policy A;"
-                f"allowlist={allowlist};"
-                f"production_prefixes={evaluation.production_prefixes}"
+        # The registry link and notes are reported once, by the first gate that evaluates it.
+        report_registry = not any(gate.name == "boundary" for gate in gates)
+        gates.append(
+            _Gate(
+                "discovery_policy",
+                partial(_discovery_policy_gate, boundary, report_registry),
+                lambda: boundary.fingerprint(report_registry),
             )
-            normalized_files = [_normalize_prefix(path) for path in (changed_files or [])]
-            outside_allowlist = [
-                path
-                for path in normalized_files
-                if not any(path.startswith(prefix) for prefix in allowlist)
-            ]
-            production_hits = [
-                path
-                for path in normalized_files
-                if any(path.startswith(prefix) for prefix in evaluation.production_prefixes)
-            ]
-            if outside_allowlist or production_hits:
-                parts = ["Discovery policy violation (Policy A)"]
-                if production_hits:
-                    parts.append(f"production_paths_hit={sorted(set(production_hits))}")
-                if outside_allowlist:
-                    parts.append(f"outside_allowlist={sorted(set(outside_allowlist))}")
-                parts.append(f"allowlist={allowlist}")
-                parts.append(f"boundary_registry_hash={evaluation.registry_hash.hash}")
-                errors.append("; ".join(parts))
-        except (FileNotFoundError, ValueError) as exc:
-            errors.append(str(exc))
-
-    notes = "; ".join(errors) if errors else ""
-    if info_notes:
-        extra = "; ".join(info_notes)
-        notes = f"{notes}; {extra}".strip("; ").strip()
-
-    if force_abort:
-        _apply_transition(bead, BeadStatus.aborted_needs_discovery)
-        write_model(paths.bead_path(bead_id), bead)
-        return TransitionResult(
-            True,
-            notes,
-            applied_transition=f"{from_status} -> {BeadStatus.aborted_needs_discovery.value}",
-            phase=phase_hint,
-            links=links,
-            auto_abort=True,
         )
+    return gates
+
+
+def evaluate_transition(
+    paths: Paths,
+    bead: Bead,
+    transition: str,
+    actor: Optional[Actor] = None,
+    *,
+    context: Optional[BeadContext] = None,
+) -> TransitionEvaluation:
+    """
+    Run every gate of `transition` for `bead` without changing any state.
+
+    Authority is only checked when `actor` is given. Pass `context` to reuse artifacts already
+    loaded for the bead; otherwise the ones the gates need are loaded here.
+    """
+
+    from_status, _, to_status = transition.partition("->")
+    from_status = from_status.strip()
+    to_status = to_status.strip()
+    if from_status != bead.status.value:
+        return TransitionEvaluation(
+            from_status,
+            to_status,
+            _phase_for_transition(from_status, to_status),
+            errors=[
+                (
+                    "Illegal transition: bead is "
+                    f"'{bead.status.value}', request was '{from_status} -> {to_status}'"
+                )
+            ],
+        )
+    if not allowed_transition(from_status, to_status):
+        return TransitionEvaluation(
+            from_status,
+            to_status,
+            _phase_for_transition(from_status, to_status),
+            errors=[f"Illegal transition: '{from_status} -> {to_status}' is not allowed"],
+        )
+
+    phase_hint = _phase_hint(bead)
+    authority = TRANSITION_AUTHORITY.get((from_status, to_status))
+    if actor is not None and authority is not None and actor.kind not in authority:
+        return TransitionEvaluation(
+            from_status,
+            to_status,
+            phase_hint,
+            errors=[
+                (
+                    f"Authority violation: {actor.kind} may not request "
+                    f"'{from_status}->{to_status}' (requires: {sorted(authority)})"
+                )
+            ],
+        )
+
+    ctx = context if context is not None else load_bead_context(paths, bead.bead_id, to_status)
+    evaluation = TransitionEvaluation(from_status, to_status, phase_hint, context=ctx)
+
+    artifact_error = ensure_bead_artifact_id(bead)
+    if artifact_error:
+        evaluation.errors.append(artifact_error)
+
+    outcomes, cached = _run_gates(
+        paths, bead.bead_id, evaluation.transition, _transition_gates(paths, ctx, to_status)
+    )
+    for outcome in outcomes:
+        evaluation.errors.extend(outcome.errors)
+        evaluation.info_notes.extend(outcome.info_notes)
+        evaluation.links.extend(outcome.links)
+        evaluation.force_abort = evaluation.force_abort or outcome.force_abort
+    if cached:
+        evaluation.info_notes.append("gates_from_cache=" + ",".join(cached))
+    return evaluation
 
-    if errors:
-        return TransitionResult(False, notes, phase=phase_hint, links=links)
 
-    _apply_transition(bead, BeadStatus(to_status))
-    write_model(paths.bead_path(bead_id), bead)
+def request_transition(
+    paths: Paths,
+    bead_id: str,
+    transition: str,
+    actor: Actor,
+    *,
+    if_match: Optional[str] = None,
+) -> TransitionResult:
+    """
+    Evaluate and apply `transition`. The bead is written with a compare-and-swap against the
+    version it was loaded at (or `if_match`, when the caller holds an older token); a
+    concurrent change yields a result with `conflict=True` and nothing written.
+    """
+
+    bead, etag = load_bead_versioned(paths, bead_id)
+    if if_match is not None and if_match != etag:
+        return TransitionResult(
+            False,
+            str(BeadConflictError(bead_id, if_match, etag)),
+            phase=_phase_hint(bead),
+            conflict=True,
+            etag=etag,
+        )
+    evaluation = evaluate_transition(paths, bead, transition, actor)
+    from_status, to_status = evaluation.from_status, evaluation.to_status
+    notes = evaluation.notes
+    links = evaluation.links
+    ctx = evaluation.context
+    if ctx is None:
+        # Rejected before any gate ran (illegal transition or authority).
+        return TransitionResult(False, notes, phase=evaluation.phase, etag=etag)
+
+    if not evaluation.ok and not evaluation.force_abort:
+        return TransitionResult(
+            False, notes, phase=evaluation.phase, links=links, context=ctx, etag=etag
+        )
+
+    if evaluation.force_abort:
+        new_status = BeadStatus.aborted_needs_discovery
+    else:
+        new_status = BeadStatus(to_status)
+        if (from_status, to_status) == (BeadStatus.sized.value, BeadStatus.ready.value):
+            assert ctx.review is not None
+            apply_acceptance_checks_from_review(bead, ctx.review)
+    _apply_transition(bead, new_status)
+    try:
+        new_etag = write_bead(paths, bead, expected_etag=etag)
+    except BeadConflictError as exc:
+        return TransitionResult(
+            False,
+            f"{exc}; {notes}".strip("; "),
+            phase=evaluation.phase,
+            links=links,
+            context=ctx,
+            conflict=True,
+            etag=exc.actual,
+        )
+    if new_status == BeadStatus.ready:
+        _write_ready_acceptance_snapshot(paths, bead)
     return TransitionResult(
         True,
         notes,
-        applied_transition=f"{from_status} -> {to_status}",
-        phase=phase_hint,
+        applied_transition=f"{from_status} -> {new_status.value}",
+        phase=evaluation.phase,
         links=links,
+        auto_abort=evaluation.force_abort,
+        context=ctx,
+        etag=new_etag,
     )
 
 
+@dataclass
+class TransitionReadiness:
+    transition: str
+    ok: bool
+    # Gate failures only; `notes` also carries the informational notes.
+    blockers: list[str]
+    notes: str
+    # The transition would pass its gates but the engine would abort instead.
+    auto_abort: bool = False
+    # Actor kinds allowed to request it (None: any).
+    authority: Optional[list[str]] = None
+
+
+@dataclass
+class BeadReadiness:
+    bead_id: str
+    status: Optional[str]
+    transitions: list[TransitionReadiness] = field(default_factory=list)
+    # Set when the bead could not be loaded.
+    error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return any(item.ok and not item.auto_abort for item in self.transitions)
+
+
+def next_transitions(status: str, include_failure_targets: bool = False) -> list[str]:
+    """Allowed targets from `status`: the forward step first, then (optionally) failure targets."""
+
+    targets: list[str] = []
+    forward = TRANSITIONS.get(status)
+    if forward is not None:
+        targets.append(forward)
+    if include_failure_targets:
+        targets.extend(
+            target for target in sorted(FAILURE_TARGETS) if allowed_transition(status, target)
+        )
+    return targets
+
+
+def readiness_report(
+    paths: Paths,
+    bead_ids: Optional[Iterable[str]] = None,
+    *,
+    actor: Optional[Actor] = None,
+    include_failure_targets: bool = False,
+) -> list[BeadReadiness]:
+    """
+    Evaluate every gate of every allowed next transition for many beads, writing nothing.
+
+    Defaults to all beads under runs/. The batch runs in one git probe scope (one `git status`),
+    reads the decision ledger through the shared incremental reader and reuses the cached
+    boundary registry and path classifier, so per-bead cost is the bead's own artifacts.
+    """
+
+    report: list[BeadReadiness] = []
+    with git_probe_scope():
+        for bead_id in list_bead_ids(paths) if bead_ids is None else bead_ids:
+            try:
+                bead = load_bead(paths, bead_id)
+            except (FileNotFoundError, ValueError) as exc:
+                report.append(BeadReadiness(bead_id, None, error=str(exc)))
+                continue
+            status = bead.status.value
+            targets = next_transitions(status, include_failure_targets)
+            entry = BeadReadiness(bead_id, status)
+            if targets:
+                ctx = load_bead_context(paths, bead_id, targets[0], bead=bead)
+                for target in targets:
+                    evaluation = evaluate_transition(
+                        paths, bead, f"{status} -> {target}", actor, context=ctx
+                    )
+                    authority = TRANSITION_AUTHORITY.get((status, target))
+                    entry.transitions.append(
+                        TransitionReadiness(
+                            transition=evaluation.transition,
+                            ok=evaluation.ok,
+                            blockers=list(evaluation.errors),
+                            notes=evaluation.notes,
+                            auto_abort=evaluation.force_abort,
+                            authority=sorted(authority) if authority is not None else None,
+                        )
+                    )
+            report.append(entry)
+    return report
+
+
 def build_execution_record(
     bead_id: str,
     phase: RunPhase,
@@ -838,7 +1463,7 @@ def collect_evidence_skeleton(bead: Bead, actor: Actor) -> EvidenceBundle:
 def evidence_validation_errors(
     bead: Bead,
     evidence: EvidenceBundle,
-    decision_entries: Iterable[DecisionLedgerEntry],
+    decision_entries: DecisionInputs,
 ) -> list[str]:
     errors: list[str] = []
 
@@ -894,14 +1519,21 @@ def _find_item_for_check(
     return None
 
 
+def _waived_acceptance_checks(bead_id: str, decisions: DecisionInputs) -> set[str]:
+    if isinstance(decisions, BeadDecisionState):
+        return decisions.waived_acceptance_checks
+    waived: set[str] = set()
+    for entry in decisions:
+        if entry.decision_type == DecisionType.exception and entry.bead_id == bead_id:
+            waived.update(entry.waived_acceptance_checks)
+    return waived
+
+
 def acceptance_coverage_errors(
-    bead: Bead, evidence: EvidenceBundle, decision_entries: Iterable[DecisionLedgerEntry]
+    bead: Bead, evidence: EvidenceBundle, decision_entries: DecisionInputs
 ) -> list[str]:
     errors: list[str] = []
-    waived: set[str] = set()
-    for entry in decision_entries:
-        if entry.decision_type == DecisionType.exception and entry.bead_id == bead.bead_id:
-            waived.update(entry.waived_acceptance_checks)
+    waived = _waived_acceptance_checks(bead.bead_id, decision_entries)
 
     for check in bead.acceptance_checks:
         if check.name in waived:
@@ -957,13 +1589,16 @@ def validate_evidence_bundle(
     evidence = load_evidence(paths, bead_id)
     if evidence is None:
         return None, ["EvidenceBundle missing"]
-    errors = evidence_validation_errors(bead, evidence, load_decision_ledger(paths))
+    errors = evidence_validation_errors(bead, evidence, load_decision_state(paths, bead_id))
     if errors:
         return evidence, errors
     if mark_validated:
         evidence.status = EvidenceStatus.validated
         evidence.for_bead_hash = canonical_hash_for_model(bead)
         write_model(paths.evidence_path(bead_id), evidence)
+        _write_evidence_bead_snapshot(paths, bead)
+        # The writes may change `git status`; the validation record must see the new state.
+        invalidate_git_probe(paths)
     return evidence, []
 
 
@@ -978,15 +1613,21 @@ def invalidate_evidence_if_stale(paths: Paths, bead_id: str, actor: Actor) -> Op
     bead = load_bead(paths, bead_id)
     bead_hash = canonical_hash_for_model(bead)
     if evidence.for_bead_hash is None or evidence.for_bead_hash.hash != bead_hash.hash:
-        reasons.append("bead hash changed")
+        changed = (
+            _changed_bead_fields(paths, bead, evidence.for_bead_hash.hash)
+            if evidence.for_bead_hash is not None
+            else None
+        )
+        if changed:
+            reasons.append(f"bead hash changed (fields: {', '.join(changed)})")
+        else:
+            reasons.append("bead hash changed")
 
     head = git_head(paths)
     dirty = git_is_dirty(paths)
     validation_record = None
     expected_artifact_path = f"runs/{bead_id}/evidence.json"
-    for record in reversed(load_execution_records(paths)):
-        if record.bead_id != bead_id:
-            continue
+    for record in iter_execution_records_for_bead_reversed(paths, bead_id):
         if record.phase != RunPhase.verify:
             continue
         if record.exit_code != 0:
@@ -1032,6 +1673,54 @@ def invalidate_evidence_if_stale(paths: Paths, bead_id: str, actor: Actor) -> Op
     return evidence.invalidated_reason
 
 
+@dataclass
+class StatusDrift:
+    bead_id: str
+    # Status in runs/<bead_id>/bead.json (None when the file is missing or unreadable).
+    file_status: Optional[str]
+    # Status replayed from the journal's applied transitions.
+    projected_status: str
+    last_transition: str
+    repaired: bool = False
+
+
+def audit_bead_status(paths: Paths, *, repair: bool = False) -> list[StatusDrift]:
+    """
+    Compare each journaled bead's bead.json status with the journal projection.
+
+    Drift means bead.json was written without its transition being journaled (or the other way
+    round), e.g. after a crash between the two writes. With `repair`, bead.json is rewritten
+    with the projected status. Beads that never had a transition journaled are not checked.
+    """
+
+    drifts: list[StatusDrift] = []
+    for bead_id, projected in sorted(load_projection(paths).current().beads.items()):
+        etag: Optional[str] = None
+        try:
+            bead: Optional[Bead]
+            bead, etag = load_bead_versioned(paths, bead_id)
+        except (FileNotFoundError, ValueError):
+            bead = None
+        file_status = bead.status.value if bead is not None else None
+        if file_status == projected.status:
+            continue
+        drift = StatusDrift(bead_id, file_status, projected.status, projected.last_transition)
+        if repair and bead is not None:
+            try:
+                status = BeadStatus(projected.status)
+            except ValueError:
+                status = None
+            if status is not None:
+                bead.status = status
+                try:
+                    write_bead(paths, bead, expected_etag=etag)
+                    drift.repaired = True
+                except BeadConflictError:
+                    pass  # changed meanwhile; the next audit looks again
+        drifts.append(drift)
+    return drifts
+
+
 def generate_grounding_bundle(paths: Paths, bead_id: str, actor: Actor) -> None:
     bead = load_bead(paths, bead_id)
     items = []
@@ -1073,36 +1762,11 @@ def append_decision_entry(paths: Paths, entry: DecisionLedgerEntry) -> None:
 
 
 def find_active_exception_decision(paths: Paths, bead_id: str) -> Optional[DecisionLedgerEntry]:
-    most_recent: Optional[DecisionLedgerEntry] = None
-    now = now_utc()
-    for entry in load_decision_ledger(paths):
-        if entry.decision_type != DecisionType.exception:
-            continue
-        if entry.bead_id != bead_id:
-            continue
-        if entry.expires_at is not None and entry.expires_at <= now:
-            continue
-        if not entry.summary.strip():
-            continue
-        if most_recent is None or entry.created_at > most_recent.created_at:
-            most_recent = entry
-    return most_recent
+    return load_decision_state(paths, bead_id).active_exception(now_utc())
 
 
 def find_approval_decision(paths: Paths, bead_id: str) -> Optional[DecisionLedgerEntry]:
-    most_recent: Optional[DecisionLedgerEntry] = None
-    for entry in load_decision_ledger(paths):
-        if entry.decision_type != DecisionType.approval:
-            continue
-        if entry.bead_id != bead_id:
-            continue
-        if entry.created_by.kind != "human":
-            continue
-        if not entry.summary.strip():
-            continue
-        if most_recent is None or entry.created_at > most_recent.created_at:
-            most_recent = entry
-    return most_recent
+    return load_decision_state(paths, bead_id).latest_approval
 
 
 def record_transition_attempt(
@@ -1134,14 +1798,23 @@ def record_transition_attempt(
         notes_md = f"{engine_note}; {notes_md}" if notes_md else engine_note
     if result.ok and result.applied_transition:
         transition = result.applied_transition.strip()
+        ctx = result.context
         if transition == "ready -> in_progress":
-            bead = load_bead(paths, bead_id)
+            bead = ctx.bead if ctx is not None else load_bead(paths, bead_id)
             if bead.execution_profile == ExecutionProfile.exception:
-                entry = find_active_exception_decision(paths, bead_id)
+                entry = (
+                    ctx.decisions.active_exception(now_utc())
+                    if ctx is not None
+                    else find_active_exception_decision(paths, bead_id)
+                )
                 if entry is not None:
                     links.append(decision_ledger_link(entry))
         elif transition == "approval_pending -> done":
-            entry = find_approval_decision(paths, bead_id)
+            entry = (
+                ctx.decisions.latest_approval
+                if ctx is not None
+                else find_approval_decision(paths, bead_id)
+            )
             if entry is not None:
                 links.append(decision_ledger_link(entry))
     record = build_execution_record(
@@ -0,0 +1,430 @@
+"""
+One-shot git state probe (HEAD, branch, dirty flag, changed files).
+
+Journaling a transition used to spawn `git rev-parse HEAD` and `git status --porcelain`
+separately, and boundary checks spawned another `git rev-parse` + `git diff` on top; on a
+large monorepo each `git status` can take seconds. A `GitProbe` answers all of these from a
+single `git status --porcelain=v2 --branch -z` call and keeps the result:
+
+- inside `git_probe_scope()` (one CLI command, one HTTP request) probes are shared, so the
+  snapshot is taken at most once per scope; call `invalidate()` after anything that may
+  change the working tree (running codex, acceptance checks)
+- outside a scope every `git_probe()` call returns a fresh probe, i.e. nothing is memoized
+
+Changed paths can also be streamed (`iter_changed_paths`, `iter_diff_paths`): git's `-z`
+output is split on NUL as it arrives, so arbitrary file names survive and a consumer that has
+seen enough (e.g. a boundary limit already exceeded) can stop and have git killed. Renames
+yield both the new and the original path.
+
+Faster modes:
+- `SDLC_GIT_UNTRACKED=no|normal|all` is passed to `--untracked-files` (default `normal`, as
+  plain `git status`). With `no`, untracked files no longer count towards "dirty" and are not
+  reported as changed.
+- `snapshot_async()` takes the same snapshot from an asyncio subprocess, so async callers can
+  fill the scope's probe without blocking the event loop.
+- HEAD alone is resolved by reading `.git/HEAD` (plus loose refs / packed-refs) without a
+  subprocess; anything unusual falls back to `git rev-parse HEAD`. Set
+  `SDLC_GIT_HEAD_FROM_FILE=0` to always ask git.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import subprocess
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Generator, Iterator, Optional
+
+_OID_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+_UNTRACKED_MODES = ("no", "normal", "all")
+_STREAM_CHUNK = 64 * 1024
+
+
+def untracked_mode() -> str:
+    raw = os.getenv("SDLC_GIT_UNTRACKED", "normal").strip().lower() or "normal"
+    if raw not in _UNTRACKED_MODES:
+        raise ValueError(f"Unsupported SDLC_GIT_UNTRACKED: {raw}")
+    return raw
+
+
+def head_from_file_enabled() -> bool:
+    return os.getenv("SDLC_GIT_HEAD_FROM_FILE", "1").strip().lower() not in {"0", "false", "no"}
+
+
+@dataclass(frozen=True)
+class GitSnapshot:
+    head: Optional[str]
+    branch: Optional[str]
+    # Tracked paths whose index or worktree state differs from HEAD (new path for renames).
+    changed_files: list[str] = field(default_factory=list)
+    untracked_files: list[str] = field(default_factory=list)
+    # new path -> original path, for renames.
+    renamed_from: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changed_files or self.untracked_files)
+
+    def touched_paths(self) -> Iterator[str]:
+        """Every path the working tree touches, in `git status` order."""
+
+        for path in self.changed_files:
+            yield path
+            orig = self.renamed_from.get(path)
+            if orig is not None:
+                yield orig
+        yield from self.untracked_files
+
+
+# (kind, path-or-value, original path) with kind one of "oid", "branch", "changed", "untracked".
+_StatusEntry = tuple[str, str, Optional[str]]
+
+
+def _status_entries(tokens: Iterator[str]) -> Iterator[_StatusEntry]:
+    for entry in tokens:
+        if not entry:
+            continue
+        kind = entry[0]
+        if entry.startswith("# branch.oid "):
+            yield "oid", entry[len("# branch.oid ") :], None
+        elif entry.startswith("# branch.head "):
+            yield "branch", entry[len("# branch.head ") :], None
+        elif kind == "1":
+            yield "changed", entry.split(" ", 8)[8], None
+        elif kind == "2":
+            fields = entry.split(" ", 9)
+            # The original path follows as its own NUL-terminated field; a copy ("C<score>")
+            # leaves it untouched.
+            orig = next(tokens, None)
+            yield "changed", fields[9], orig if fields[8].startswith("R") else None
+        elif kind == "u":
+            yield "changed", entry.split(" ", 10)[10], None
+        elif kind == "?":
+            yield "untracked", entry[2:], None
+
+
+class _SnapshotBuilder:
+    def __init__(self) -> None:
+        self.head: Optional[str] = None
+        self.branch: Optional[str] = None
+        self.changed: list[str] = []
+        self.untracked: list[str] = []
+        self.renamed_from: dict[str, str] = {}
+
+    def add(self, entry: _StatusEntry) -> None:
+        kind, value, orig = entry
+        if kind == "oid":
+            self.head = value if value != "(initial)" else None
+        elif kind == "branch":
+            self.branch = value if value != "(detached)" else None
+        elif kind == "changed":
+            self.changed.append(value)
+            if orig is not None:
+                self.renamed_from[value] = orig
+        elif kind == "untracked":
+            self.untracked.append(value)
+
+    def build(self) -> GitSnapshot:
+        return GitSnapshot(
+            head=self.head,
+            branch=self.branch,
+            changed_files=self.changed,
+            untracked_files=self.untracked,
+            renamed_from=self.renamed_from,
+        )
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="surrogateescape")
+
+
+def parse_porcelain_v2(output: bytes) -> GitSnapshot:
+    """Parse `git status --porcelain=v2 --branch -z` output."""
+
+    builder = _SnapshotBuilder()
+    for entry in _status_entries(iter(_decode(output).split("\0"))):
+        builder.add(entry)
+    return builder.build()
+
+
+class _GitStream:
+    """NUL-separated fields of a git command's stdout, read incrementally."""
+
+    def __init__(self, repo_root: Path, args: list[str]) -> None:
+        self.returncode: Optional[int] = None
+        self._proc = subprocess.Popen(
+            ["git", *args],
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def tokens(self) -> Generator[str, None, None]:
+        assert self._proc.stdout is not None
+        pending = b""
+        try:
+            while True:
+                chunk = os.read(self._proc.stdout.fileno(), _STREAM_CHUNK)
+                if not chunk:
+                    break
+                *fields, pending = (pending + chunk).split(b"\0")
+                for raw in fields:
+                    yield _decode(raw)
+            if pending:
+                yield _decode(pending)
+            self.returncode = self._proc.wait()
+        finally:
+            if self.returncode is None:
+                # The consumer stopped early: do not let git keep walking the tree.
+                self._proc.kill()
+                self._proc.wait()
+            self._proc.stdout.close()
+
+
+def iter_diff_paths(repo_root: Path, rev_range: str) -> Iterator[str]:
+    """Paths changed in `rev_range` (e.g. `<sha>..HEAD`), streamed; renames yield both sides."""
+
+    tokens = _GitStream(repo_root, ["diff", "--name-status", "-z", "-M", rev_range]).tokens()
+    try:
+        for status in tokens:
+            if not status:
+                continue
+            path = next(tokens, None)
+            if path is None:
+                break
+            if status[0] in "RC":
+                new_path = next(tokens, None)
+                if new_path is not None:
+                    yield new_path
+                if status[0] == "C":
+                    # A copy leaves its source untouched.
+                    continue
+            yield path
+    finally:
+        tokens.close()
+
+
+def _git_dir(repo_root: Path) -> Optional[Path]:
+    dot_git = repo_root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        # Worktrees and submodules: ".git" is a file pointing at the real git dir.
+        content = dot_git.read_text(encoding="utf-8").strip()
+        if content.startswith("gitdir:"):
+            return (repo_root / content[len("gitdir:") :].strip()).resolve()
+    return None
+
+
+def read_head_file(repo_root: Path) -> Optional[str]:
+    """HEAD's commit id read straight from the git dir, or None if git must be asked."""
+
+    git_dir = _git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref:"):
+            return head if _OID_RE.match(head) else None
+        ref = head[len("ref:") :].strip()
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.exists():
+            common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+        for base in (git_dir, common_dir):
+            loose = base / ref
+            if loose.is_file():
+                value = loose.read_text(encoding="utf-8").strip()
+                return value if _OID_RE.match(value) else None
+        packed = common_dir / "packed-refs"
+        if packed.exists():
+            for line in packed.read_text(encoding="utf-8").splitlines():
+                if line.startswith(("#", "^")):
+                    continue
+                oid, _, name = line.partition(" ")
+                if name == ref:
+                    return oid if _OID_RE.match(oid) else None
+    except OSError:
+        return None
+    # Unborn branch, reftable storage, ...: let git decide.
+    return None
+
+
+class GitProbe:
+    def __init__(
+        self,
+        repo_root: Path,
+        *,
+        untracked: Optional[str] = None,
+        head_from_file: Optional[bool] = None,
+    ) -> None:
+        self.repo_root = repo_root
+        self.untracked = untracked if untracked is not None else untracked_mode()
+        self.head_from_file = head_from_file_enabled() if head_from_file is None else head_from_file
+        self.git_calls = 0
+        self._lock = threading.Lock()
+        self._snapshot: Optional[GitSnapshot] = None
+        self._snapshot_taken = False
+        self._head: Optional[str] = None
+        self._head_known = False
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._snapshot_taken = False
+            self._head = None
+            self._head_known = False
+
+    def snapshot(self) -> Optional[GitSnapshot]:
+        """The working-tree snapshot, or None outside a git repository."""
+
+        with self._lock:
+            if not self._snapshot_taken:
+                self._keep_snapshot(self._status())
+            return self._snapshot
+
+    async def snapshot_async(self) -> Optional[GitSnapshot]:
+        """`snapshot()` for the event loop: git runs as an asyncio subprocess."""
+
+        with self._lock:
+            if self._snapshot_taken:
+                return self._snapshot
+        snapshot = await self._status_async()
+        with self._lock:
+            if not self._snapshot_taken:
+                self._keep_snapshot(snapshot)
+            return self._snapshot
+
+    def head(self) -> Optional[str]:
+        with self._lock:
+            if not self._head_known:
+                head = read_head_file(self.repo_root) if self.head_from_file else None
+                self._head = head if head is not None else self._rev_parse_head()
+                self._head_known = True
+            return self._head
+
+    def dirty(self) -> Optional[bool]:
+        snapshot = self.snapshot()
+        return snapshot.dirty if snapshot is not None else None
+
+    def changed_files(self) -> list[str]:
+        snapshot = self.snapshot()
+        return list(snapshot.changed_files) if snapshot is not None else []
+
+    def iter_changed_paths(self) -> Iterator[str]:
+        """
+        Paths touched by the working tree vs HEAD (tracked changes, both sides of renames,
+        then untracked files), streamed from `git status` unless a snapshot is already held.
+        Nothing is yielded outside a git repository or before the first commit.
+        """
+
+        with self._lock:
+            taken, snapshot = self._snapshot_taken, self._snapshot
+        if taken:
+            if snapshot is not None and snapshot.head is not None:
+                yield from snapshot.touched_paths()
+            return
+        self.git_calls += 1
+        stream = _GitStream(self.repo_root, self._status_args())
+        tokens = stream.tokens()
+        builder = _SnapshotBuilder()
+        try:
+            for entry in _status_entries(tokens):
+                builder.add(entry)
+                kind, value, orig = entry
+                if kind == "oid" and builder.head is None:
+                    return
+                if kind in ("changed", "untracked"):
+                    yield value
+                    if orig is not None:
+                        yield orig
+        finally:
+            tokens.close()
+        # Fully consumed: keep what we saw, exactly as snapshot() would have.
+        with self._lock:
+            if not self._snapshot_taken:
+                self._keep_snapshot(builder.build() if stream.returncode == 0 else None)
+
+    def _keep_snapshot(self, snapshot: Optional[GitSnapshot]) -> None:
+        # Caller holds the lock.
+        self._snapshot = snapshot
+        self._snapshot_taken = True
+        if snapshot is not None:
+            self._head = snapshot.head
+            self._head_known = True
+
+    def _status_args(self) -> list[str]:
+        return [
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "-z",
+            f"--untracked-files={self.untracked}",
+        ]
+
+    def _run(self, args: list[str]) -> bytes:
+        self.git_calls += 1
+        return subprocess.check_output(
+            ["git", *args], cwd=self.repo_root, stderr=subprocess.DEVNULL
+        )
+
+    def _status(self) -> Optional[GitSnapshot]:
+        try:
+            output = self._run(self._status_args())
+        except subprocess.CalledProcessError:
+            return None
+        return parse_porcelain_v2(output)
+
+    async def _status_async(self) -> Optional[GitSnapshot]:
+        self.git_calls += 1
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *self._status_args(),
+            cwd=self.repo_root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        output, _ = await proc.communicate()
+        if proc.returncode != 0:
+            return None
+        return parse_porcelain_v2(output)
+
+    def _rev_parse_head(self) -> Optional[str]:
+        try:
+            return self._run(["rev-parse", "HEAD"]).decode("utf-8").strip()
+        except subprocess.CalledProcessError:
+            return None
+
+
+_SCOPE: ContextVar[Optional[dict[Path, GitProbe]]] = ContextVar(
+    "sdlc_git_probe_scope", default=None
+)
+
+
+@contextmanager
+def git_probe_scope() -> Iterator[None]:
+    """Share (and thereby memoize) probes until the block exits; nested scopes reuse the outer."""
+
+    if _SCOPE.get() is not None:
+        yield
+        return
+    token = _SCOPE.set({})
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+def git_probe(repo_root: Path) -> GitProbe:
+    probes = _SCOPE.get()
+    if probes is None:
+        return GitProbe(repo_root)
+    probe = probes.get(repo_root)
+    if probe is None:
+        probe = probes.setdefault(repo_root, GitProbe(repo_root))
+    return probe
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import itertools
 import json
 import os
 import tempfile
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Optional
-
-import subprocess
+from typing import Any, Iterable, Iterator, Optional
 
 from pydantic import BaseModel
 
+from . import framing, journal_index, segments
+from .artifact_cache import artifact_cache
+from .bd_store import BdIssueStore, bd_store, bead_payload_from_issue
+from .codec import sha256_canonical_json, sha256_canonical_model
+from .dep_graph import DependencyGraph, dependency_graph
+from .git_probe import GitSnapshot, git_probe, iter_diff_paths
+from .ledger import BeadDecisionState, ledger_reader
+from .mirror import Mirror, SyncStats
 from .models import (
     Bead,
     BeadReview,
@@ -20,6 +29,9 @@ from .models import (
     ExecutionRecord,
     GroundingBundle,
 )
+from .jobs import JobQueue, job_queue
+from .projection import BeadProjection, bead_projection
+from .writer import locked, log_writer
 
 
 @dataclass(frozen=True)
@@ -34,6 +46,34 @@ class Paths:
     def journal_path(self) -> Path:
         return self.runs_dir / "journal.jsonl"
 
+    @property
+    def journal_index_path(self) -> Path:
+        return self.runs_dir / "journal.index.jsonl"
+
+    @property
+    def bd_index_path(self) -> Path:
+        return self.runs_dir / "bd_issues.index.json"
+
+    @property
+    def deps_index_path(self) -> Path:
+        return self.runs_dir / "deps.index.json"
+
+    @property
+    def projection_dir(self) -> Path:
+        return self.runs_dir / "projection.snapshots"
+
+    @property
+    def jobs_dir(self) -> Path:
+        return self.runs_dir / "jobs"
+
+    @property
+    def jobs_events_path(self) -> Path:
+        return self.runs_dir / "jobs.events.jsonl"
+
+    @property
+    def mirror_path(self) -> Path:
+        return self.runs_dir / "mirror.sqlite3"
+
     @property
     def decision_ledger_path(self) -> Path:
         return self.repo_root / "decision_ledger.jsonl"
@@ -102,165 +142,515 @@ def atomic_write_text(path: Path, content: str, *, encoding: str = "utf-8") -> N
                 pass
 
 
-def append_jsonl(path: Path, payload: Any) -> None:
+def append_jsonl(path: Path, payload: Any) -> tuple[int, int]:
+    """
+    Append one JSON line to `path`; returns the (offset, length) in bytes of that line.
+
+    Goes through the shared group-commit writer: the line is written with a single write under
+    an advisory lock, so concurrent writers (threads or processes) never interleave.
+    """
     ensure_parent(path)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, separators=(",", ":"), ensure_ascii=False) + "\n")
+    data = (json.dumps(payload, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+    return log_writer(path).append(data)
+
+
+def iter_lines_reversed(path: Path, *, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yield non-blank lines of `path` newest-first, reading backwards from EOF in blocks.
+
+    Callers that stop iterating early only pay for the blocks they consumed, so "latest N"
+    or "most recent matching" queries cost time proportional to the answer.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            handle.seek(position)
+            lines = (handle.read(read_size) + remainder).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier block.
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
 
 
 def load_bead(paths: Paths, bead_id: str) -> Bead:
-    bead_path = paths.bead_path(bead_id)
-    if bead_path.exists():
-        return Bead.model_validate_json(bead_path.read_text(encoding="utf-8"))
+    bead = artifact_cache().load(paths.bead_path(bead_id), Bead)
+    if bead is not None:
+        return bead
     return _load_bead_from_bd(paths, bead_id)
 
 
-def _load_bead_from_bd(paths: Paths, bead_id: str) -> Bead:
-    issues_path = paths.repo_root / "beads" / "issues.jsonl"
-    if not issues_path.exists():
-        issues_path = paths.repo_root / "beads" / "issues.json"
-    if not issues_path.exists():
-        issues_path = paths.repo_root / ".beads" / "issues.jsonl"
-    if not issues_path.exists():
-        raise FileNotFoundError("No bead artifact or bd issues store found")
+# Version token of a bead that has no runs/<bead_id>/bead.json (yet).
+ABSENT_ETAG = "absent"
 
-    bead_data: Optional[dict[str, Any]] = None
-    with issues_path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line.strip():
-                continue
-            data = json.loads(line)
-            if data.get("id") == bead_id:
-                bead_data = data
-                break
 
+class BeadConflictError(RuntimeError):
+    """runs/<bead_id>/bead.json changed since it was loaded; reload and retry."""
+
+    def __init__(self, bead_id: str, expected: str, actual: str) -> None:
+        super().__init__(
+            f"Conflict: bead {bead_id} changed since it was loaded "
+            f"(expected version {expected}, found {actual}); reload and retry"
+        )
+        self.bead_id = bead_id
+        self.expected = expected
+        self.actual = actual
+
+
+def bead_etag(paths: Paths, bead_id: str) -> str:
+    """Version token of bead.json: the canonical hash of its content (ABSENT_ETAG if missing)."""
+    bead = artifact_cache().load(paths.bead_path(bead_id), Bead)
+    return sha256_canonical_model(bead) if bead is not None else ABSENT_ETAG
+
+
+def load_bead_versioned(paths: Paths, bead_id: str) -> tuple[Bead, str]:
+    """`load_bead` plus the version token to pass back to `write_bead(expected_etag=...)`."""
+    bead = artifact_cache().load(paths.bead_path(bead_id), Bead)
+    if bead is None:
+        return _load_bead_from_bd(paths, bead_id), ABSENT_ETAG
+    return bead, sha256_canonical_model(bead)
+
+
+def list_bead_ids(paths: Paths) -> list[str]:
+    """Ids of the beads materialized under runs/ (directories holding a bead.json), sorted."""
+    if not paths.runs_dir.is_dir():
+        return []
+    return sorted(
+        child.name for child in paths.runs_dir.iterdir() if (child / "bead.json").is_file()
+    )
+
+
+def _load_bead_from_bd(paths: Paths, bead_id: str) -> Bead:
+    store = load_bd_store(paths)
+    if store is None:
+        raise FileNotFoundError("No bead artifact or bd issues store found")
+    bead_data = store.issue(bead_id)
     if bead_data is None:
         raise FileNotFoundError(f"Bead {bead_id} not found in bd store")
+    return Bead.model_validate(bead_payload_from_issue(bead_data))
+
 
-    created_at = bead_data.get("created_at") or bead_data.get("created")
-    if created_at is None:
-        created_at = now_utc().isoformat()
+def load_bd_store(paths: Paths) -> Optional[BdIssueStore]:
+    """The shared, indexed bd issues store for this repo (None if there is no store)."""
+    return bd_store(paths.repo_root, paths.bd_index_path)
 
-    acceptance = bead_data.get("acceptance") or bead_data.get("acceptance_criteria") or ""
-    description = bead_data.get("description") or bead_data.get("body") or ""
-    title = bead_data.get("title") or bead_id
-    status = bead_data.get("status") or "draft"
 
-    owner = bead_data.get("owner") or bead_data.get("assignee")
-    priority = bead_data.get("priority")
-    if isinstance(priority, str) and priority.upper().startswith("P"):
+def load_bd_issues(paths: Paths) -> list[dict[str, Any]]:
+    store = load_bd_store(paths)
+    return store.issues() if store is not None else []
+
+
+@dataclass
+class BdImportSummary:
+    imported: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    # Materialized beads not written by a previous import, or edited since: never overwritten.
+    skipped: list[str] = field(default_factory=list)
+    invalid: list[str] = field(default_factory=list)
+
+
+def _sha256_file(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def import_bd_issues(
+    paths: Paths,
+    *,
+    bead_ids: Optional[Iterable[str]] = None,
+    status: Optional[str] = None,
+    workers: int = 8,
+) -> BdImportSummary:
+    """
+    Materialize bd issues into runs/<bead_id>/bead.json in bulk (parallel atomic writes).
+
+    `runs/bd_import.json` records, per bead, the hash of the bd issue and of the bead.json it
+    produced. A bead is rewritten only when its bd issue changed and bead.json is untouched
+    since the import; beads created or edited by Loom are left alone.
+    """
+    wanted = set(bead_ids) if bead_ids is not None else None
+    manifest_path = paths.runs_dir / "bd_import.json"
+    manifest: dict[str, dict[str, str]] = load_json(manifest_path) if manifest_path.exists() else {}
+    summary = BdImportSummary()
+
+    def materialize(issue: dict[str, Any]) -> tuple[str, str, Optional[dict[str, str]]]:
+        bead_id = str(issue.get("id"))
+        recorded = manifest.get(bead_id)
         try:
-            priority = int(priority[1:]) + 1
+            bead = Bead.model_validate(bead_payload_from_issue(issue))
         except ValueError:
-            priority = 3
-    if isinstance(priority, int):
-        priority = max(1, min(5, priority))
-    else:
-        priority = 3
-
-    bead_payload = {
-        "schema_name": "sdlc.bead",
-        "schema_version": 1,
-        "artifact_id": bead_id,
-        "created_at": created_at,
-        "created_by": {
-            "kind": "system",
-            "name": "bd",
-        },
-        "bead_id": bead_id,
-        "title": title,
-        "bead_type": bead_data.get("bead_type", "implementation"),
-        "status": status,
-        "priority": priority,
-        "owner": owner,
-        "requirements_md": description,
-        "acceptance_criteria_md": acceptance,
-        "context_md": bead_data.get("notes") or bead_data.get("context") or "",
-        "acceptance_checks": [],
-    }
-
-    return Bead.model_validate(bead_payload)
+            return bead_id, "invalid", recorded
+        issue_hash = sha256_canonical_json(issue)
+        bead_path = paths.bead_path(bead_id)
+        current = _sha256_file(bead_path)
+        if current is not None:
+            if recorded is None or current != recorded.get("bead_sha256"):
+                return bead_id, "skipped", recorded
+            if recorded.get("issue_hash") == issue_hash:
+                return bead_id, "unchanged", recorded
+        write_model(bead_path, bead)
+        entry = {"issue_hash": issue_hash, "bead_sha256": _sha256_file(bead_path) or ""}
+        return bead_id, "imported" if current is None else "updated", entry
+
+    selected = [
+        issue
+        for issue in load_bd_issues(paths)
+        if isinstance(issue.get("id"), str)
+        and (wanted is None or issue["id"] in wanted)
+        and (status is None or (issue.get("status") or "draft") == status)
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for bead_id, outcome, entry in pool.map(materialize, selected):
+            getattr(summary, outcome).append(bead_id)
+            if entry is not None:
+                manifest[bead_id] = entry
+    if summary.imported or summary.updated:
+        dump_json(manifest_path, manifest)
+    return summary
 
 
 def load_bead_review(paths: Paths, bead_id: str) -> Optional[BeadReview]:
-    review_path = paths.bead_dir(bead_id) / "bead_review.json"
-    if not review_path.exists():
-        return None
-    return BeadReview.model_validate_json(review_path.read_text(encoding="utf-8"))
+    return artifact_cache().load(paths.bead_dir(bead_id) / "bead_review.json", BeadReview)
 
 
 def load_grounding(paths: Paths, bead_id: str) -> Optional[GroundingBundle]:
-    path = paths.grounding_path(bead_id)
-    if not path.exists():
-        return None
-    return GroundingBundle.model_validate_json(path.read_text(encoding="utf-8"))
+    return artifact_cache().load(paths.grounding_path(bead_id), GroundingBundle)
 
 
 def load_evidence(paths: Paths, bead_id: str) -> Optional[EvidenceBundle]:
-    path = paths.evidence_path(bead_id)
-    if not path.exists():
-        return None
-    return EvidenceBundle.model_validate_json(path.read_text(encoding="utf-8"))
+    return artifact_cache().load(paths.evidence_path(bead_id), EvidenceBundle)
 
 
 def write_model(path: Path, model: BaseModel) -> None:
     dump_json(path, model.model_dump(mode="json"))
 
 
+def write_bead(paths: Paths, bead: Bead, *, expected_etag: Optional[str] = None) -> str:
+    """
+    Write runs/<bead_id>/bead.json and record it in the dependency graph; returns the new
+    version token.
+
+    With `expected_etag` the write is a compare-and-swap: under the bead's lock the file must
+    still have that version, otherwise BeadConflictError is raised and nothing is written.
+    Writes to different beads take different locks.
+    """
+    path = paths.bead_path(bead.bead_id)
+    with locked(path):
+        if expected_etag is not None:
+            actual = bead_etag(paths, bead.bead_id)
+            if actual != expected_etag:
+                raise BeadConflictError(bead.bead_id, expected_etag, actual)
+        write_model(path, bead)
+    dependency_graph(paths.runs_dir, paths.deps_index_path).note_written(bead, path)
+    if paths.mirror_path.exists():
+        _mirror(paths).note_bead(bead.bead_id)
+    return sha256_canonical_model(bead)
+
+
+def load_dependency_graph(
+    paths: Paths, bead_ids: Optional[Iterable[str]] = None
+) -> DependencyGraph:
+    """
+    The shared dependency graph over runs/, caught up with bead.json changes on disk.
+
+    With `bead_ids` only those beads are re-checked (the rest of the graph may be stale).
+    """
+    graph = dependency_graph(paths.runs_dir, paths.deps_index_path)
+    if bead_ids is None:
+        graph.refresh()
+    else:
+        graph.revalidate(bead_ids)
+    return graph
+
+
 def write_execution_record(paths: Paths, record: ExecutionRecord) -> None:
-    append_jsonl(paths.journal_path, record.model_dump(mode="json"))
+    offset, length = append_jsonl(paths.journal_path, record.model_dump(mode="json"))
+    journal_index.record_appended(
+        paths.journal_path, paths.journal_index_path, record.bead_id, offset, length
+    )
+    if segments.maybe_roll(paths.journal_path) is not None:
+        # The index only covers the active journal, which is now empty.
+        rebuild_journal_index(paths)
 
 
 def write_decision_entry(paths: Paths, entry: DecisionLedgerEntry) -> None:
-    append_jsonl(paths.decision_ledger_path, entry.model_dump(mode="json"))
+    offset, length = append_jsonl(paths.decision_ledger_path, entry.model_dump(mode="json"))
+    # Entries held by the shared reader must not alias objects the caller may still mutate.
+    reader = ledger_reader(paths.decision_ledger_path)
+    reader.note_appended(entry.model_copy(deep=True), offset, length)
+    segments.maybe_roll(paths.decision_ledger_path)
+
+
+def _mirror(paths: Paths) -> Mirror:
+    return Mirror(
+        paths.mirror_path,
+        journal_path=paths.journal_path,
+        ledger_path=paths.decision_ledger_path,
+        runs_dir=paths.runs_dir,
+    )
+
+
+def open_mirror(paths: Paths) -> Optional[Mirror]:
+    """The SQLite mirror, synced to the source files, or None if it has not been created."""
+    if not paths.mirror_path.exists():
+        return None
+    mirror = _mirror(paths)
+    mirror.refresh()
+    return mirror
+
+
+def rebuild_mirror(paths: Paths) -> SyncStats:
+    return _mirror(paths).rebuild()
+
+
+def seal_logs(paths: Paths) -> list[segments.SegmentInfo]:
+    """Seal the active journal and decision ledger into new segments (if non-empty)."""
+    sealed: list[segments.SegmentInfo] = []
+    for log_path in (paths.journal_path, paths.decision_ledger_path):
+        info = segments.seal_active(log_path)
+        if info is not None:
+            sealed.append(info)
+    rebuild_journal_index(paths)
+    return sealed
+
+
+def verify_logs(paths: Paths) -> list[framing.LogIntegrityReport]:
+    """Checksum/sequence report for the active journal and decision ledger (no validation)."""
+    return [framing.verify_log(path) for path in (paths.journal_path, paths.decision_ledger_path)]
+
+
+def repair_logs(paths: Paths) -> dict[Path, int]:
+    """Truncate torn tails of the active journal and decision ledger; returns bytes removed."""
+    removed: dict[Path, int] = {}
+    for log_path in (paths.journal_path, paths.decision_ledger_path):
+        with locked(log_path):
+            removed[log_path] = framing.repair_torn_tail(log_path)
+    if removed[paths.journal_path]:
+        rebuild_journal_index(paths)
+    return removed
+
+
+def load_decision_state(paths: Paths, bead_id: str) -> BeadDecisionState:
+    """Materialized per-bead decision aggregates (approval, exceptions, interventions)."""
+    return ledger_reader(paths.decision_ledger_path).bead_state(bead_id)
 
 
 def load_decision_ledger(paths: Paths) -> Iterable[DecisionLedgerEntry]:
-    if not paths.decision_ledger_path.exists():
-        return []
+    """
+    Return all ledger entries (oldest first) from the shared incremental reader.
+
+    Only lines appended since the previous call in this process are parsed.
+    """
+    return ledger_reader(paths.decision_ledger_path).entries()
+
+
+def _bead_needle(bead_id: str) -> bytes:
+    # Cheap byte filter before parsing; most lines belong to other beads.
+    return json.dumps(bead_id).encode("utf-8")
+
+
+def _sealed_lines_newest_first(log_path: Path, bead_id: str) -> Iterator[bytes]:
+    needle = _bead_needle(bead_id)
+    for segment in reversed(segments.sealed_segments(log_path)):
+        if not segment.may_contain(bead_id):
+            continue
+        lines = [line for line in segments.iter_segment_lines(log_path, segment) if needle in line]
+        yield from reversed(lines)
+
+
+def load_recent_decision_entries(
+    paths: Paths, bead_id: str, *, limit: int
+) -> list[DecisionLedgerEntry]:
+    """Return the latest `limit` ledger entries for `bead_id` (oldest first)."""
+    needle = _bead_needle(bead_id)
     entries: list[DecisionLedgerEntry] = []
-    with paths.decision_ledger_path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line.strip():
-                continue
-            entries.append(DecisionLedgerEntry.model_validate_json(line))
+    if limit <= 0:
+        return entries
+    active = (line for line in iter_lines_reversed(paths.decision_ledger_path) if needle in line)
+    for line in itertools.chain(
+        active, _sealed_lines_newest_first(paths.decision_ledger_path, bead_id)
+    ):
+        entry = DecisionLedgerEntry.model_validate_json(framing.unframe(line))
+        if entry.bead_id != bead_id:
+            continue
+        entries.append(entry)
+        if len(entries) >= limit:
+            break
+    entries.reverse()
     return entries
 
 
-def load_execution_records(paths: Paths) -> list[ExecutionRecord]:
-    if not paths.journal_path.exists():
+def _read_execution_records(path: Path) -> list[ExecutionRecord]:
+    if not path.exists():
         return []
     records: list[ExecutionRecord] = []
-    with paths.journal_path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
             if not line.strip():
                 continue
-            records.append(ExecutionRecord.model_validate_json(line))
+            if not line.endswith(b"\n"):
+                # Torn tail from a writer that died mid-append (or one still in progress).
+                break
+            records.append(ExecutionRecord.model_validate_json(framing.unframe(line)))
     return records
 
 
-def git_head(paths: Paths) -> Optional[str]:
-    try:
-        return (
-            subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=paths.repo_root,
-                stderr=subprocess.DEVNULL,
+def load_execution_records(paths: Paths) -> list[ExecutionRecord]:
+    """All ExecutionRecords (oldest first) across sealed journal segments and the active file."""
+    records = [
+        ExecutionRecord.model_validate_json(framing.unframe(line))
+        for line in segments.iter_sealed_lines(paths.journal_path)
+    ]
+    records.extend(_read_execution_records(paths.journal_path))
+    return records
+
+
+def _active_records_for_bead(
+    paths: Paths, bead_id: str, limit: Optional[int]
+) -> list[ExecutionRecord]:
+    if not paths.journal_path.exists():
+        return []
+    for attempt in range(2):
+        index = journal_index.load_journal_index(paths.journal_path, paths.journal_index_path)
+        spans = index.spans_for(bead_id)
+        if limit is not None:
+            spans = spans[-limit:] if limit > 0 else []
+        try:
+            records = [
+                ExecutionRecord.model_validate_json(framing.unframe(raw))
+                for raw in journal_index.read_spans(paths.journal_path, spans)
+            ]
+        except ValueError:
+            records = []
+        else:
+            if all(record.bead_id == bead_id for record in records):
+                return records
+        if attempt == 0:
+            # Journal was rewritten underneath the index; rebuild and retry once.
+            rebuild_journal_index(paths)
+    records = [r for r in _read_execution_records(paths.journal_path) if r.bead_id == bead_id]
+    if limit is not None:
+        records = records[-limit:] if limit > 0 else []
+    return records
+
+
+def load_execution_records_for_bead(
+    paths: Paths, bead_id: str, *, limit: Optional[int] = None
+) -> list[ExecutionRecord]:
+    """
+    Load one bead's ExecutionRecords (oldest first).
+
+    The active journal is read via the byte-offset index; sealed segments are consulted
+    newest-first and only when their manifest lists the bead. With `limit`, only the most
+    recent `limit` records are read and validated.
+    """
+    if limit is not None and limit <= 0:
+        return []
+    records = _active_records_for_bead(paths, bead_id, limit)
+    if limit is not None and len(records) >= limit:
+        return records
+    older: list[ExecutionRecord] = []
+    for line in _sealed_lines_newest_first(paths.journal_path, bead_id):
+        if limit is not None and len(older) + len(records) >= limit:
+            break
+        record = ExecutionRecord.model_validate_json(framing.unframe(line))
+        if record.bead_id == bead_id:
+            older.append(record)
+    older.reverse()
+    return older + records
+
+
+def iter_execution_records_for_bead_reversed(
+    paths: Paths, bead_id: str
+) -> Iterator[ExecutionRecord]:
+    """
+    Yield one bead's ExecutionRecords newest-first, validating lazily.
+
+    Intended for "most recent record matching X" lookups that stop at the first hit.
+    """
+    yield from _iter_active_records_reversed(paths, bead_id)
+    for line in _sealed_lines_newest_first(paths.journal_path, bead_id):
+        record = ExecutionRecord.model_validate_json(framing.unframe(line))
+        if record.bead_id == bead_id:
+            yield record
+
+
+def _iter_active_records_reversed(paths: Paths, bead_id: str) -> Iterator[ExecutionRecord]:
+    if not paths.journal_path.exists():
+        return
+    index = journal_index.load_journal_index(paths.journal_path, paths.journal_index_path)
+    spans = index.spans_for(bead_id)
+    spans.reverse()
+    yielded = 0
+    for raw in journal_index.read_spans(paths.journal_path, spans):
+        try:
+            record: Optional[ExecutionRecord] = ExecutionRecord.model_validate_json(
+                framing.unframe(raw)
             )
-            .decode("utf-8")
-            .strip()
-        )
-    except subprocess.CalledProcessError:
-        return None
+        except ValueError:
+            record = None
+        if record is None or record.bead_id != bead_id:
+            # Stale index: continue from the rebuilt per-bead list.
+            records = _active_records_for_bead(paths, bead_id, None)
+            yield from reversed(records[: max(0, len(records) - yielded)])
+            return
+        yielded += 1
+        yield record
+
+
+def load_projection(paths: Paths) -> BeadProjection:
+    """The shared journal projection (bead status replayed from applied transitions)."""
+    return bead_projection(paths.journal_path, paths.projection_dir)
+
+
+def load_job_queue(paths: Paths) -> JobQueue:
+    """The shared background job queue persisting to runs/jobs/."""
+    return job_queue(paths.jobs_dir, paths.jobs_events_path)
+
+
+def rebuild_journal_index(paths: Paths) -> int:
+    index = journal_index.rebuild_journal_index(paths.journal_path, paths.journal_index_path)
+    return index.record_count
+
+
+def git_head(paths: Paths) -> Optional[str]:
+    return git_probe(paths.repo_root).head()
 
 
 def git_is_dirty(paths: Paths) -> Optional[bool]:
-    try:
-        output = subprocess.check_output(
-            ["git", "status", "--porcelain"],
-            cwd=paths.repo_root,
-            stderr=subprocess.DEVNULL,
-        )
-    except subprocess.CalledProcessError:
-        return None
-    return bool(output.strip())
+    return git_probe(paths.repo_root).dirty()
+
+
+def git_snapshot(paths: Paths) -> Optional[GitSnapshot]:
+    """HEAD, branch and changed files from one `git status` (memoized within a probe scope)."""
+
+    return git_probe(paths.repo_root).snapshot()
+
+
+def iter_changed_paths(paths: Paths, since: Optional[str] = None) -> Iterator[str]:
+    """
+    Stream changed paths: the working tree vs HEAD, or the commits in `<since>..HEAD`.
+
+    Renames yield both paths; working-tree changes include untracked files unless
+    `SDLC_GIT_UNTRACKED=no`.
+    """
+
+    if since:
+        return iter_diff_paths(paths.repo_root, f"{since}..HEAD")
+    return git_probe(paths.repo_root).iter_changed_paths()
+
+
+def invalidate_git_probe(paths: Paths) -> None:
+    """Forget memoized git state after something may have changed the working tree."""
+
+    git_probe(paths.repo_root).invalidate()
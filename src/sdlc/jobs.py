@@ -0,0 +1,567 @@
+"""
+Background jobs for the long-running agent actions (plan, OpenSpec propose, implement, verify).
+
+Those actions run codex subprocesses and LLM calls for minutes; inside an HTTP request they
+hold a worker and time out behind proxies. A `JobQueue` runs them on its own threads instead:
+
+- `submit()` persists the job and returns immediately; the job id is the handle for status,
+  progress, log and cancellation
+- at most `SDLC_JOB_WORKERS` jobs (default 4) run at once per process, and at most the
+  per-kind limit of one kind (`SDLC_JOB_LIMITS`, e.g. `implement=1,verify=1,plan=2`;
+  implement and verify default to 1 because they share the working tree); further jobs wait
+  in submission order
+- per-kind limits hold across processes: a running job holds an `flock` on one of its kind's
+  slot files (`runs/jobs/<kind>.slot<n>.lock`), so several server workers, or the CLI through
+  `job_slot`, never run more than the limit on the same tree. A job whose slots are all held
+  elsewhere stays queued and is retried every `_SLOT_POLL_SECONDS`. Without `fcntl` the limits
+  are per process
+- every job is a JSON file under `runs/jobs/` (rewritten atomically on each state change)
+  with its log next to it, so any server worker or a restarted server can answer queries;
+  updates re-read the file under its `locked()` lock, so a progress write in one process
+  cannot overwrite a cancel recorded by another;
+  jobs left queued/running by a process that no longer exists are marked failed on load
+- lifecycle events (queued, started, progress, finished) are appended to
+  `runs/jobs.events.jsonl`, which `/api/events` streams as `job` events
+
+Cancellation is cooperative. A queued job is cancelled at once. A running job sees the
+request at its next checkpoint (`raise_if_cancelled`, `report_progress`) or, while it waits
+on a subprocess through `communicate`, within a second, with the subprocess killed. A cancel
+recorded by another process is picked up from the job file.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import subprocess
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from .writer import locked, log_writer
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to per-process limits
+    fcntl = None  # type: ignore[assignment]
+
+_DEFAULT_LIMITS = {"implement": 1, "verify": 1}
+_CANCEL_POLL_SECONDS = 1.0
+_SLOT_POLL_SECONDS = 0.5
+
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
+FINISHED = frozenset({JobStatus.succeeded, JobStatus.failed, JobStatus.cancelled})
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once its cancellation has been requested."""
+
+
+def job_workers() -> int:
+    raw = os.getenv("SDLC_JOB_WORKERS", "").strip()
+    if not raw:
+        return 4
+    value = int(raw)
+    if value < 1:
+        raise ValueError("SDLC_JOB_WORKERS must be >= 1")
+    return value
+
+
+def job_limits() -> dict[str, int]:
+    """Per-kind concurrency limits: the defaults overridden by `SDLC_JOB_LIMITS`."""
+
+    limits = dict(_DEFAULT_LIMITS)
+    raw = os.getenv("SDLC_JOB_LIMITS", "").strip()
+    for part in raw.split(","):
+        if not part.strip():
+            continue
+        kind, sep, value = part.partition("=")
+        if not sep or not value.strip().isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid SDLC_JOB_LIMITS entry: {part.strip()!r}")
+        limits[kind.strip()] = int(value)
+    return limits
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _acquire_slot(jobs_dir: Path, kind: str, limit: int) -> Optional[int]:
+    """Lock a free one of `kind`'s `limit` slot files; its fd, or None when all are held."""
+
+    jobs_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(limit):
+        fd = os.open(jobs_dir / f"{kind}.slot{index}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            continue
+        return fd
+    return None
+
+
+def _release_slot(fd: int) -> None:
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def job_slot(jobs_dir: Path, kind: str) -> Iterator[None]:
+    """
+    Hold one of `kind`'s slots while running outside a queue (the CLI agent commands), waiting
+    for one to free up; kinds without a limit run at once.
+    """
+
+    limit = job_limits().get(kind)
+    if limit is None or fcntl is None:
+        yield
+        return
+    fd = _acquire_slot(jobs_dir, kind, limit)
+    while fd is None:
+        time.sleep(_SLOT_POLL_SECONDS)
+        fd = _acquire_slot(jobs_dir, kind, limit)
+    try:
+        yield
+    finally:
+        _release_slot(fd)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@dataclass
+class Job:
+    job_id: str
+    kind: str
+    bead_id: Optional[str]
+    status: JobStatus
+    created_at: str
+    pid: int
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    progress: float = 0.0
+    message: str = ""
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+
+    def to_json(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["status"] = self.status.value
+        return payload
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> Job:
+        data = dict(payload)
+        data["status"] = JobStatus(data["status"])
+        return cls(**data)
+
+
+JobFunc = Callable[["JobHandle"], Optional[dict[str, Any]]]
+
+
+class JobHandle:
+    """What a running job sees: progress/log reporting and its cancellation state."""
+
+    def __init__(self, queue: JobQueue, job_id: str) -> None:
+        self.queue = queue
+        self.job_id = job_id
+        self._cancel = threading.Event()
+        self._checked_file_at = 0.0
+
+    def cancelled(self) -> bool:
+        if self._cancel.is_set():
+            return True
+        now = time.monotonic()
+        if now - self._checked_file_at >= _CANCEL_POLL_SECONDS:
+            # A cancel may have been recorded by another process.
+            self._checked_file_at = now
+            job = self.queue.get(self.job_id)
+            if job is not None and job.cancel_requested:
+                self._cancel.set()
+        return self._cancel.is_set()
+
+    def request_cancel(self) -> None:
+        self._cancel.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled():
+            raise JobCancelled(self.job_id)
+
+    def progress(self, fraction: float, message: str = "") -> None:
+        self.raise_if_cancelled()
+        self.queue._update_progress(self.job_id, max(0.0, min(1.0, fraction)), message)
+
+    def log(self, line: str) -> None:
+        self.queue._append_log(self.job_id, line)
+
+
+_CURRENT: contextvars.ContextVar[Optional[JobHandle]] = contextvars.ContextVar(
+    "sdlc_current_job", default=None
+)
+
+
+def current_job() -> Optional[JobHandle]:
+    """The job running in this thread, if any."""
+
+    return _CURRENT.get()
+
+
+def report_progress(fraction: float, message: str = "") -> None:
+    """Report progress of the current job (no-op outside a job); raises if it was cancelled."""
+
+    job = current_job()
+    if job is not None:
+        job.progress(fraction, message)
+
+
+def raise_if_cancelled() -> None:
+    job = current_job()
+    if job is not None:
+        job.raise_if_cancelled()
+
+
+def communicate(proc: subprocess.Popen[bytes], input: Optional[bytes] = None) -> bytes:
+    """
+    `proc.communicate(input)` returning stdout; inside a job, `proc` is killed and
+    `JobCancelled` raised once the job is cancelled.
+    """
+
+    job = current_job()
+    if job is None:
+        stdout, _ = proc.communicate(input)
+        return stdout or b""
+    while True:
+        try:
+            stdout, _ = proc.communicate(input, timeout=_CANCEL_POLL_SECONDS)
+            return stdout or b""
+        except subprocess.TimeoutExpired:
+            # The input is already being fed; retries must not pass it again.
+            input = None
+            if job.cancelled():
+                proc.kill()
+                proc.communicate()
+                raise JobCancelled(job.job_id) from None
+
+
+class JobQueue:
+    def __init__(self, jobs_dir: Path, events_path: Optional[Path] = None) -> None:
+        self.jobs_dir = jobs_dir
+        self.events_path = events_path
+        self.workers = job_workers()
+        self.limits = job_limits()
+        self._lock = threading.Lock()
+        self._pending: deque[tuple[str, JobFunc]] = deque()
+        self._handles: dict[str, JobHandle] = {}
+        self._running: dict[str, str] = {}  # job id -> kind
+        self._slots: dict[str, int] = {}  # job id -> fd of the slot lock it holds
+        self._retry: Optional[threading.Timer] = None
+        self._recovered = False
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sdlc-job")
+
+    # ---- submission / control ----
+
+    def submit(self, kind: str, func: JobFunc, *, bead_id: Optional[str] = None) -> Job:
+        """Persist a queued job and schedule `func(handle)`; its return value is the result."""
+
+        self._recover()
+        job = Job(
+            job_id=f"job-{uuid.uuid4().hex[:12]}",
+            kind=kind,
+            bead_id=bead_id,
+            status=JobStatus.queued,
+            created_at=_now(),
+            pid=os.getpid(),
+        )
+        with self._lock:
+            self._store(job)
+            self._handles[job.job_id] = JobHandle(self, job.job_id)
+            self._pending.append((job.job_id, func))
+        self._emit("job_queued", job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; returns the job (unchanged when it already finished)."""
+
+        with self._lock, locked(self._job_path(job_id)):
+            job = self._load(job_id)
+            if job is None or job.status in FINISHED:
+                return job
+            job.cancel_requested = True
+            queued_here = any(pending_id == job_id for pending_id, _ in self._pending)
+            if queued_here:
+                self._pending = deque(item for item in self._pending if item[0] != job_id)
+                job.status = JobStatus.cancelled
+                job.finished_at = _now()
+                self._handles.pop(job_id, None)
+            handle = self._handles.get(job_id)
+            if handle is not None:
+                handle.request_cancel()
+            self._store(job)
+        self._emit("job_cancelled" if queued_here else "job_cancel_requested", job)
+        return job
+
+    # ---- queries ----
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._recover()
+        with self._lock:
+            return self._load(job_id)
+
+    def list_jobs(
+        self,
+        *,
+        bead_id: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        kind: Optional[str] = None,
+    ) -> list[Job]:
+        """Jobs newest first, optionally filtered."""
+
+        self._recover()
+        jobs: list[Job] = []
+        for path in self._job_paths():
+            job = self._read(path)
+            if job is None:
+                continue
+            if bead_id is not None and job.bead_id != bead_id:
+                continue
+            if status is not None and job.status != status:
+                continue
+            if kind is not None and job.kind != kind:
+                continue
+            jobs.append(job)
+        jobs.sort(key=lambda job: (job.created_at, job.job_id), reverse=True)
+        return jobs
+
+    def log_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.log"
+
+    def read_log(self, job_id: str, offset: int = 0) -> tuple[str, int]:
+        """Log text from byte `offset` on, and the offset to continue from."""
+
+        try:
+            with self.log_path(job_id).open("rb") as handle:
+                handle.seek(offset)
+                data = handle.read()
+        except FileNotFoundError:
+            return "", offset
+        return data.decode("utf-8", errors="replace"), offset + len(data)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until the job finishes (polling its file); for tests and the CLI."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job.status in FINISHED:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(0.02)
+
+    # ---- scheduling ----
+
+    def _dispatch(self) -> None:
+        started: list[tuple[str, JobFunc, JobHandle]] = []
+        with self._lock:
+            skipped: deque[tuple[str, JobFunc]] = deque()
+            while self._pending and len(self._running) < self.workers:
+                job_id, func = self._pending.popleft()
+                job = self._load(job_id)
+                if job is None:
+                    continue
+                running_kind = sum(1 for kind in self._running.values() if kind == job.kind)
+                if running_kind >= self.limits.get(job.kind, self.workers):
+                    skipped.append((job_id, func))
+                    continue
+                limit = self.limits.get(job.kind)
+                if limit is not None and fcntl is not None:
+                    fd = _acquire_slot(self.jobs_dir, job.kind, limit)
+                    if fd is None:
+                        # Held by another process: nothing here will free it, so poll.
+                        skipped.append((job_id, func))
+                        self._schedule_retry()
+                        continue
+                    self._slots[job_id] = fd
+                self._running[job_id] = job.kind
+                started.append((job_id, func, self._handles[job_id]))
+            skipped.extend(self._pending)
+            self._pending = skipped
+        for job_id, func, handle in started:
+            # Pool threads do not inherit the submitter's context (e.g. its git probe scope).
+            self._executor.submit(self._run, job_id, func, handle)
+
+    def _run(self, job_id: str, func: JobFunc, handle: JobHandle) -> None:
+        job = self._transition(job_id, JobStatus.running, started_at=_now())
+        if job is not None:
+            self._emit("job_started", job)
+        token = _CURRENT.set(handle)
+        status = JobStatus.succeeded
+        result: Optional[dict[str, Any]] = None
+        error: Optional[str] = None
+        try:
+            handle.raise_if_cancelled()
+            result = func(handle)
+        except JobCancelled:
+            status = JobStatus.cancelled
+        except Exception as exc:  # noqa: BLE001
+            status = JobStatus.failed
+            error = f"{type(exc).__name__}: {exc}"
+            handle.log(traceback.format_exc())
+        finally:
+            _CURRENT.reset(token)
+        updates: dict[str, Any] = {"finished_at": _now(), "result": result, "error": error}
+        if status == JobStatus.succeeded:
+            updates["progress"] = 1.0
+        job = self._transition(job_id, status, **updates)
+        with self._lock:
+            self._running.pop(job_id, None)
+            self._handles.pop(job_id, None)
+            fd = self._slots.pop(job_id, None)
+            if fd is not None:
+                _release_slot(fd)
+        if job is not None:
+            self._emit(f"job_{status.value}", job)
+        self._dispatch()
+
+    def _schedule_retry(self) -> None:
+        # Called with self._lock held.
+        if self._retry is None:
+            self._retry = threading.Timer(_SLOT_POLL_SECONDS, self._retry_dispatch)
+            self._retry.daemon = True
+            self._retry.start()
+
+    def _retry_dispatch(self) -> None:
+        with self._lock:
+            self._retry = None
+        self._dispatch()
+
+    def _transition(self, job_id: str, status: JobStatus, **updates: Any) -> Optional[Job]:
+        with self._lock, locked(self._job_path(job_id)):
+            job = self._load(job_id)
+            if job is None:
+                return None
+            job.status = status
+            for name, value in updates.items():
+                setattr(job, name, value)
+            self._store(job)
+            return job
+
+    def _update_progress(self, job_id: str, fraction: float, message: str) -> None:
+        with self._lock, locked(self._job_path(job_id)):
+            job = self._load(job_id)
+            if job is None:
+                return
+            job.progress = fraction
+            job.message = message
+            self._store(job)
+        if message:
+            self._append_log(job_id, message)
+        self._emit("job_progress", job)
+
+    # ---- persistence ----
+
+    def _job_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _job_paths(self) -> list[Path]:
+        if not self.jobs_dir.is_dir():
+            return []
+        return sorted(self.jobs_dir.glob("job-*.json"))
+
+    def _read(self, path: Path) -> Optional[Job]:
+        try:
+            return Job.from_json(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _load(self, job_id: str) -> Optional[Job]:
+        return self._read(self._job_path(job_id))
+
+    def _store(self, job: Job) -> None:
+        path = self._job_path(job.job_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(job.to_json(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _append_log(self, job_id: str, line: str) -> None:
+        path = self.log_path(job_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(line if line.endswith("\n") else line + "\n")
+
+    def _emit(self, event: str, job: Job) -> None:
+        if self.events_path is None:
+            return
+        payload = {"event": event, "created_at": _now(), **job.to_json()}
+        self.events_path.parent.mkdir(parents=True, exist_ok=True)
+        data = (json.dumps(payload, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+        log_writer(self.events_path).append(data)
+
+    def _recover(self) -> None:
+        """Fail jobs left queued/running by a process that is gone (once per queue)."""
+
+        with self._lock:
+            if self._recovered:
+                return
+            self._recovered = True
+            orphans: list[Job] = []
+            for path in self._job_paths():
+                with locked(path):
+                    job = self._read(path)
+                    if job is None or job.status in FINISHED:
+                        continue
+                    if job.pid == os.getpid() or _pid_alive(job.pid):
+                        continue
+                    job.status = JobStatus.failed
+                    job.error = "interrupted: the process running this job exited"
+                    job.finished_at = _now()
+                    self._store(job)
+                orphans.append(job)
+        for job in orphans:
+            self._emit("job_failed", job)
+
+
+_QUEUES: dict[Path, JobQueue] = {}
+_QUEUES_LOCK = threading.Lock()
+
+
+def job_queue(jobs_dir: Path, events_path: Optional[Path] = None) -> JobQueue:
+    """Return the process-wide queue persisting to `jobs_dir`."""
+
+    with _QUEUES_LOCK:
+        queue = _QUEUES.get(jobs_dir)
+        if queue is None:
+            queue = JobQueue(jobs_dir, events_path)
+            _QUEUES[jobs_dir] = queue
+        return queue
@@ -0,0 +1,180 @@
+"""
+Per-bead byte-offset index for the execution journal.
+
+`runs/journal.jsonl` is shared by every bead, so answering "records for bead X" used to
+mean parsing and validating the whole file. The sidecar index (`runs/journal.index.jsonl`)
+maps bead_id -> (offset, length) of each journal line so per-bead reads can seek directly.
+
+- `write_execution_record` appends one index line per journal line.
+- Journal lines written without an index entry (older tooling, a crash between the two
+  appends) are picked up lazily by scanning only the un-indexed tail of the journal.
+- If the journal shrinks below what the index covers, the index is rebuilt from scratch.
+
+The parsed index is cached per process and advanced incrementally as the sidecar grows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+from . import framing
+
+Span = tuple[int, int]
+
+
+@dataclass
+class JournalIndex:
+    spans: dict[str, list[Span]] = field(default_factory=dict)
+    # Byte position in the sidecar up to which entries have been parsed.
+    index_bytes_read: int = 0
+    # Byte position in the journal up to which lines have been scanned/indexed.
+    journal_scanned_to: int = 0
+    _seen_offsets: set[int] = field(default_factory=set)
+
+    def add(self, bead_id: str, offset: int, length: int) -> bool:
+        if offset in self._seen_offsets:
+            return False
+        self._seen_offsets.add(offset)
+        spans = self.spans.setdefault(bead_id, [])
+        spans.append((offset, length))
+        if len(spans) > 1 and spans[-2][0] > offset:
+            # Concurrent appenders may persist index lines out of journal order.
+            spans.sort()
+        self.journal_scanned_to = max(self.journal_scanned_to, offset + length)
+        return True
+
+    def spans_for(self, bead_id: str) -> list[Span]:
+        return list(self.spans.get(bead_id, []))
+
+    @property
+    def record_count(self) -> int:
+        return len(self._seen_offsets)
+
+
+_CACHE: dict[Path, JournalIndex] = {}
+_LOCK = threading.Lock()
+
+
+def _index_line(bead_id: str, offset: int, length: int) -> bytes:
+    payload = {"bead_id": bead_id, "offset": offset, "length": length}
+    return (json.dumps(payload, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def append_index_entries(index_path: Path, entries: list[tuple[str, int, int]]) -> None:
+    if not entries:
+        return
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    data = b"".join(_index_line(bead_id, offset, length) for bead_id, offset, length in entries)
+    with index_path.open("ab") as handle:
+        handle.write(data)
+
+
+def _bead_id_from_line(line: bytes) -> Optional[str]:
+    try:
+        payload = json.loads(framing.unframe(line))
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    bead_id = payload.get("bead_id")
+    return bead_id if isinstance(bead_id, str) else None
+
+
+def _read_index_tail(index_path: Path, index: JournalIndex) -> None:
+    if not index_path.exists():
+        return
+    with index_path.open("rb") as handle:
+        handle.seek(index.index_bytes_read)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                # Partially written entry; pick it up on the next read.
+                break
+            index.index_bytes_read += len(line)
+            try:
+                payload = json.loads(line)
+                index.add(str(payload["bead_id"]), int(payload["offset"]), int(payload["length"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+
+def _scan_journal_tail(journal_path: Path, index: JournalIndex) -> list[tuple[str, int, int]]:
+    new_entries: list[tuple[str, int, int]] = []
+    with journal_path.open("rb") as handle:
+        handle.seek(index.journal_scanned_to)
+        offset = index.journal_scanned_to
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            length = len(line)
+            bead_id = _bead_id_from_line(line) if line.strip() else None
+            if bead_id is not None and index.add(bead_id, offset, length):
+                new_entries.append((bead_id, offset, length))
+            offset += length
+            index.journal_scanned_to = max(index.journal_scanned_to, offset)
+    return new_entries
+
+
+def _refresh(journal_path: Path, index_path: Path, index: JournalIndex) -> JournalIndex:
+    if index_path.exists() and index_path.stat().st_size < index.index_bytes_read:
+        index = JournalIndex()
+    _read_index_tail(index_path, index)
+    journal_size = journal_path.stat().st_size if journal_path.exists() else 0
+    if journal_size < index.journal_scanned_to:
+        return _rebuild(journal_path, index_path)
+    if journal_size > index.journal_scanned_to:
+        # Our own catch-up entries are re-read (and deduplicated) on the next refresh.
+        append_index_entries(index_path, _scan_journal_tail(journal_path, index))
+    return index
+
+
+def _rebuild(journal_path: Path, index_path: Path) -> JournalIndex:
+    index = JournalIndex()
+    entries: list[tuple[str, int, int]] = []
+    if journal_path.exists():
+        entries = _scan_journal_tail(journal_path, index)
+    tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path.write_bytes(b"".join(_index_line(*entry) for entry in entries))
+    os.replace(tmp_path, index_path)
+    index.index_bytes_read = index_path.stat().st_size
+    return index
+
+
+def load_journal_index(journal_path: Path, index_path: Path) -> JournalIndex:
+    with _LOCK:
+        index = _refresh(journal_path, index_path, _CACHE.get(index_path) or JournalIndex())
+        _CACHE[index_path] = index
+        return index
+
+
+def rebuild_journal_index(journal_path: Path, index_path: Path) -> JournalIndex:
+    with _LOCK:
+        index = _rebuild(journal_path, index_path)
+        _CACHE[index_path] = index
+        return index
+
+
+def record_appended(
+    journal_path: Path, index_path: Path, bead_id: str, offset: int, length: int
+) -> None:
+    """Persist the index entry for a journal line that was just appended."""
+
+    if offset > 0 and not index_path.exists():
+        # The journal predates the index: index everything, not just this line.
+        rebuild_journal_index(journal_path, index_path)
+        return
+    append_index_entries(index_path, [(bead_id, offset, length)])
+
+
+def read_spans(journal_path: Path, spans: list[Span]) -> Iterator[bytes]:
+    if not spans:
+        return
+    with journal_path.open("rb") as handle:
+        for offset, length in spans:
+            handle.seek(offset)
+            yield handle.read(length)
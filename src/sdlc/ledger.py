@@ -0,0 +1,255 @@
+"""
+Incremental, process-wide reader for `decision_ledger.jsonl`.
+
+Every engine gate that consults the ledger used to re-read and re-validate the whole file,
+and a single `request_transition` could do that several times. `DecisionLedgerReader`
+remembers the file identity (inode, size, mtime) and the byte offset it has parsed up to:
+
+- unchanged file: the cached entries are returned without touching the file contents
+- appended file (same inode, larger): only the new tail is parsed and validated
+- replaced/truncated file: the cache is dropped and the file is parsed from the start
+
+Each parsed entry is also folded into a per-bead `BeadDecisionState`, so gates (approval,
+execution-profile exception, anti-stall interventions, bucket-L justification, waived
+acceptance checks) read a materialized aggregate instead of rescanning every entry.
+
+When the ledger is segmented (see `segments.py`), sealed segments are parsed once and
+cached by name; the aggregates are refolded from those cached entries whenever a segment is
+sealed, so `entries()` covers sealed segments followed by the active file.
+
+Readers are shared per ledger path via `ledger_reader()`, so the CLI and every request
+handled by a server process reuse the same parsed entries. Entries are shared objects and
+must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from . import framing, segments
+from .models import DecisionLedgerEntry, DecisionType
+
+JUSTIFICATION_DECISION_TYPES = frozenset(
+    {DecisionType.assumption, DecisionType.tradeoff, DecisionType.scope_change}
+)
+
+
+@dataclass
+class BeadDecisionState:
+    """Aggregates over one bead's ledger entries, updated as entries are appended."""
+
+    latest_approval: Optional[DecisionLedgerEntry] = None
+    # First (in ledger order) assumption/tradeoff/scope_change entry with a summary.
+    justification: Optional[DecisionLedgerEntry] = None
+    intervention_counts: Counter[DecisionType] = field(default_factory=Counter)
+    waived_acceptance_checks: set[str] = field(default_factory=set)
+    # (expires_at timestamp or inf, ledger sequence, entry), ordered by expiry.
+    _exceptions_by_expiry: list[tuple[float, int, DecisionLedgerEntry]] = field(
+        default_factory=list
+    )
+    _sequence: int = 0
+
+    def apply(self, entry: DecisionLedgerEntry) -> None:
+        self._sequence += 1
+        self.intervention_counts[entry.decision_type] += 1
+        has_summary = bool(entry.summary.strip())
+        if entry.decision_type == DecisionType.approval:
+            if entry.created_by.kind == "human" and has_summary:
+                latest = self.latest_approval
+                if latest is None or entry.created_at > latest.created_at:
+                    self.latest_approval = entry
+        elif entry.decision_type == DecisionType.exception:
+            self.waived_acceptance_checks.update(entry.waived_acceptance_checks)
+            if has_summary:
+                expires = entry.expires_at.timestamp() if entry.expires_at else math.inf
+                bisect.insort(self._exceptions_by_expiry, (expires, self._sequence, entry))
+        if (
+            self.justification is None
+            and entry.decision_type in JUSTIFICATION_DECISION_TYPES
+            and has_summary
+        ):
+            self.justification = entry
+
+    def active_exception(self, now: datetime) -> Optional[DecisionLedgerEntry]:
+        """Most recently created exception that has not expired at `now`."""
+
+        start = bisect.bisect_right(self._exceptions_by_expiry, (now.timestamp(), math.inf))
+        most_recent: Optional[tuple[int, DecisionLedgerEntry]] = None
+        for _, sequence, entry in self._exceptions_by_expiry[start:]:
+            if most_recent is None:
+                most_recent = (sequence, entry)
+                continue
+            current = most_recent[1]
+            if entry.created_at > current.created_at or (
+                entry.created_at == current.created_at and sequence < most_recent[0]
+            ):
+                most_recent = (sequence, entry)
+        return most_recent[1] if most_recent else None
+
+    @property
+    def entry_count(self) -> int:
+        """Number of ledger entries applied for this bead (its offset into the ledger)."""
+
+        return self._sequence
+
+    def intervention_count(self, decision_types: Iterable[DecisionType]) -> int:
+        return sum(self.intervention_counts[decision_type] for decision_type in decision_types)
+
+    def copy(self) -> BeadDecisionState:
+        return BeadDecisionState(
+            latest_approval=self.latest_approval,
+            justification=self.justification,
+            intervention_counts=Counter(self.intervention_counts),
+            waived_acceptance_checks=set(self.waived_acceptance_checks),
+            _exceptions_by_expiry=list(self._exceptions_by_expiry),
+            _sequence=self._sequence,
+        )
+
+
+class DecisionLedgerReader:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: list[DecisionLedgerEntry] = []
+        self._by_bead: dict[str, BeadDecisionState] = {}
+        self._offset = 0
+        self._identity: Optional[tuple[int, int, int]] = None
+        self._trailing: Optional[DecisionLedgerEntry] = None
+        self._sealed: dict[str, list[DecisionLedgerEntry]] = {}
+        self._sealed_identity: Optional[tuple[tuple[str, int], ...]] = None
+
+    def _reset(self) -> None:
+        """Drop active-file state, keeping only the (cached) sealed segment entries."""
+
+        self._entries = []
+        self._by_bead = {}
+        self._offset = 0
+        self._identity = None
+        self._trailing = None
+        for entries in self._sealed.values():
+            for entry in entries:
+                self._append(entry)
+
+    @property
+    def parsed_bytes(self) -> int:
+        return self._offset
+
+    def entries(self) -> list[DecisionLedgerEntry]:
+        with self._lock:
+            self._refresh()
+            entries = list(self._entries)
+            if self._trailing is not None:
+                entries.append(self._trailing)
+            return entries
+
+    def bead_state(self, bead_id: str) -> BeadDecisionState:
+        """Materialized decision aggregates for `bead_id` (a private copy)."""
+
+        with self._lock:
+            self._refresh()
+            state = self._by_bead.get(bead_id)
+            state = state.copy() if state is not None else BeadDecisionState()
+            if self._trailing is not None and self._trailing.bead_id == bead_id:
+                state.apply(self._trailing)
+            return state
+
+    def note_appended(self, entry: DecisionLedgerEntry, offset: int, length: int) -> None:
+        """Fold an entry this process just appended, if the cache was current before it."""
+
+        with self._lock:
+            if self._identity is None or offset != self._offset or self._trailing is not None:
+                return
+            self._append(entry)
+            self._offset += length
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                self._reset()
+                return
+            self._identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _append(self, entry: DecisionLedgerEntry) -> None:
+        self._entries.append(entry)
+        if entry.bead_id is not None:
+            self._by_bead.setdefault(entry.bead_id, BeadDecisionState()).apply(entry)
+
+    def _refresh_sealed(self) -> None:
+        identity = segments.manifest_identity(self.path)
+        if identity == self._sealed_identity:
+            return
+        sealed: dict[str, list[DecisionLedgerEntry]] = {}
+        for segment in segments.sealed_segments(self.path):
+            cached = self._sealed.get(segment.name)
+            if cached is None:
+                cached = [
+                    DecisionLedgerEntry.model_validate_json(framing.unframe(line))
+                    for line in segments.iter_segment_lines(self.path, segment)
+                ]
+            sealed[segment.name] = cached
+        self._sealed = sealed
+        self._sealed_identity = identity
+        # A new segment is the former active file: re-read the active file from the start.
+        self._reset()
+
+    def _refresh(self) -> None:
+        self._refresh_sealed()
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self._identity is not None:
+                self._reset()
+            return
+        identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if self._identity is not None:
+            same_file = self._identity[0] == stat.st_ino
+            if not same_file or stat.st_size < self._offset:
+                self._reset()
+            elif stat.st_size == self._identity[1] and identity != self._identity:
+                # Rewritten in place with the same size: nothing can be trusted.
+                self._reset()
+        if identity != self._identity or stat.st_size > self._offset:
+            self._trailing = self._read_tail()
+            self._identity = identity
+
+    def _read_tail(self) -> Optional[DecisionLedgerEntry]:
+        """Parse complete lines after the current offset; return a parsed unterminated tail."""
+
+        with self.path.open("rb") as handle:
+            handle.seek(self._offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    # An unterminated last line is returned but not cached: it may still be
+                    # mid-append, and caching it would duplicate it once the newline lands.
+                    if not line.strip():
+                        return None
+                    try:
+                        return DecisionLedgerEntry.model_validate_json(framing.unframe(line))
+                    except ValueError:
+                        return None
+                if line.strip():
+                    self._append(DecisionLedgerEntry.model_validate_json(framing.unframe(line)))
+                self._offset += len(line)
+        return None
+
+
+_READERS: dict[Path, DecisionLedgerReader] = {}
+_READERS_LOCK = threading.Lock()
+
+
+def ledger_reader(path: Path) -> DecisionLedgerReader:
+    """Return the process-wide reader for the ledger at `path`."""
+
+    with _READERS_LOCK:
+        reader = _READERS.get(path)
+        if reader is None:
+            reader = DecisionLedgerReader(path)
+            _READERS[path] = reader
+        return reader
@@ -0,0 +1,451 @@
+"""
+Optional SQLite mirror of the journal, decision ledger and `runs/<bead_id>/bead.json` files.
+
+The JSONL logs and bead JSON files remain the source of truth; the mirror is a disposable,
+indexed copy for list/filter/timeline queries:
+
+- `execution_records` indexed by (bead_id), (phase, created_at), (exit_code), (created_at)
+- `decision_entries` indexed by (bead_id), (decision_type, created_at), (created_at)
+- `beads` (runs/ artifacts only) indexed by (status, priority) and (created_at)
+
+The mirror is enabled by creating it (`sdlc mirror rebuild`). Reads call `refresh()`, which
+catches up incrementally: each log's sync position (sealed segment numbers, active inode and
+byte offset) is stored in `sync_state`, and a plain read of it against a few `stat` calls
+decides whether anything changed, so readers only take the write lock (`BEGIN IMMEDIATE`)
+when a log actually moved. Newly sealed segments continue from the stored position (the
+segment that was the active file is read from the old offset on); only a replaced or
+truncated log triggers a resync of its table. `write_bead` upserts its bead row directly;
+the scan that stats every bead.json (to pick up edits made outside `write_bead`) runs at
+most every `SDLC_MIRROR_BEAD_SCAN_SECONDS` (default 5) per process. Syncs serialize on
+`BEGIN IMMEDIATE`, so concurrent server workers and CLI processes never double-insert.
+
+Rows hold the JSON documents as written (no pydantic validation on sync); `created_at` is
+stored as epoch seconds so range filters compare numerically.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from . import framing, segments
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    log TEXT PRIMARY KEY,
+    sealed TEXT NOT NULL,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS execution_records (
+    id INTEGER PRIMARY KEY,
+    bead_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    exit_code INTEGER,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_execution_bead ON execution_records (bead_id, id);
+CREATE INDEX IF NOT EXISTS ix_execution_phase ON execution_records (phase, created_at);
+CREATE INDEX IF NOT EXISTS ix_execution_exit ON execution_records (exit_code);
+CREATE INDEX IF NOT EXISTS ix_execution_created ON execution_records (created_at);
+CREATE TABLE IF NOT EXISTS decision_entries (
+    id INTEGER PRIMARY KEY,
+    bead_id TEXT,
+    decision_type TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_decision_bead ON decision_entries (bead_id, id);
+CREATE INDEX IF NOT EXISTS ix_decision_type ON decision_entries (decision_type, created_at);
+CREATE INDEX IF NOT EXISTS ix_decision_created ON decision_entries (created_at);
+CREATE TABLE IF NOT EXISTS beads (
+    bead_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    bead_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    owner TEXT,
+    created_at REAL,
+    source_identity TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_beads_status ON beads (status, priority, created_at);
+CREATE INDEX IF NOT EXISTS ix_beads_created ON beads (created_at);
+"""
+
+
+def _timestamp(value: Any) -> float:
+    if not isinstance(value, str):
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _execution_row(payload: dict[str, Any], raw: str) -> tuple[Any, ...]:
+    return (
+        payload["bead_id"],
+        payload["phase"],
+        payload.get("exit_code"),
+        _timestamp(payload.get("created_at")),
+        raw,
+    )
+
+
+def _decision_row(payload: dict[str, Any], raw: str) -> tuple[Any, ...]:
+    return (
+        payload.get("bead_id"),
+        payload["decision_type"],
+        _timestamp(payload.get("created_at")),
+        raw,
+    )
+
+
+@dataclass(frozen=True)
+class _LogTable:
+    name: str
+    table: str
+    insert_sql: str
+    row: Callable[[dict[str, Any], str], tuple[Any, ...]]
+
+
+_JOURNAL = _LogTable(
+    name="journal",
+    table="execution_records",
+    insert_sql=(
+        "INSERT INTO execution_records (bead_id, phase, exit_code, created_at, payload) "
+        "VALUES (?, ?, ?, ?, ?)"
+    ),
+    row=_execution_row,
+)
+_LEDGER = _LogTable(
+    name="decision_ledger",
+    table="decision_entries",
+    insert_sql=(
+        "INSERT INTO decision_entries (bead_id, decision_type, created_at, payload) "
+        "VALUES (?, ?, ?, ?)"
+    ),
+    row=_decision_row,
+)
+
+
+@dataclass
+class SyncStats:
+    execution_records: int = 0
+    decision_entries: int = 0
+    beads: int = 0
+
+
+def bead_scan_seconds() -> float:
+    raw = os.getenv("SDLC_MIRROR_BEAD_SCAN_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else 5.0
+    except ValueError:
+        return 5.0
+
+
+# Per mirror database: when this process last scanned every bead.json (monotonic seconds).
+_LAST_BEAD_SCAN: dict[Path, float] = {}
+_LAST_BEAD_SCAN_LOCK = threading.Lock()
+
+
+class Mirror:
+    def __init__(self, db_path: Path, *, journal_path: Path, ledger_path: Path, runs_dir: Path):
+        self.db_path = db_path
+        self.journal_path = journal_path
+        self.ledger_path = ledger_path
+        self.runs_dir = runs_dir
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def sync(self) -> SyncStats:
+        """Bring the mirror up to date with the logs and every bead file (incremental)."""
+
+        with closing(self._connect()) as conn:
+            return self._sync(conn, scan_beads=True)
+
+    def refresh(self) -> SyncStats:
+        """
+        Catch up before a read: nothing is written unless a log moved, and bead files are
+        scanned at most every `SDLC_MIRROR_BEAD_SCAN_SECONDS`.
+        """
+
+        now = time.monotonic()
+        with _LAST_BEAD_SCAN_LOCK:
+            last = _LAST_BEAD_SCAN.get(self.db_path)
+            scan_beads = last is None or now - last >= bead_scan_seconds()
+            if scan_beads:
+                _LAST_BEAD_SCAN[self.db_path] = now
+        with closing(self._connect()) as conn:
+            if not scan_beads and not self._logs_stale(conn):
+                return SyncStats()
+            return self._sync(conn, scan_beads=scan_beads)
+
+    def note_bead(self, bead_id: str) -> None:
+        """Mirror `runs/<bead_id>/bead.json` right after it was written."""
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._upsert_bead(conn, bead_id, None)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _sync(self, conn: sqlite3.Connection, *, scan_beads: bool) -> SyncStats:
+        stats = SyncStats()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stats.execution_records = self._sync_log(conn, _JOURNAL, self.journal_path)
+            stats.decision_entries = self._sync_log(conn, _LEDGER, self.ledger_path)
+            if scan_beads:
+                stats.beads = self._sync_beads(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return stats
+
+    def _logs_stale(self, conn: sqlite3.Connection) -> bool:
+        states = {
+            row["log"]: (row["sealed"], row["inode"], row["offset"])
+            for row in conn.execute("SELECT log, sealed, inode, offset FROM sync_state")
+        }
+        return any(
+            states.get(spec.name) != _log_position(log_path)
+            for spec, log_path in ((_JOURNAL, self.journal_path), (_LEDGER, self.ledger_path))
+        )
+
+    def _sync_log(self, conn: sqlite3.Connection, spec: _LogTable, log_path: Path) -> int:
+        state = conn.execute(
+            "SELECT sealed, inode, offset FROM sync_state WHERE log = ?", (spec.name,)
+        ).fetchone()
+        stored = _sealed_numbers(state["sealed"]) if state is not None else None
+        while True:
+            sealed, inode, size = _log_position(log_path)
+            numbers = json.loads(sealed)
+            reset = (
+                state is None
+                or stored is None
+                or numbers[: len(stored)] != stored
+                or (
+                    len(numbers) == len(stored)
+                    and (inode != state["inode"] or size < state["offset"])
+                )
+            )
+            # Newly sealed segments start with the active file we had read up to `offset`.
+            start = (0, 0) if reset else (len(stored or []), state["offset"])
+            position = start
+            lines: list[bytes] = []
+            for stream, end, line in segments.iter_lines_from(log_path, *start):
+                lines.append(line)
+                position = (stream, end)
+            if _log_position(log_path)[0] == sealed:
+                break
+            # A segment was sealed while we read: the streams shifted, read again.
+        if reset:
+            conn.execute(f"DELETE FROM {spec.table}")
+        rows = list(self._rows(spec, iter(lines)))
+        offset = position[1] if position[0] == len(numbers) else 0
+        conn.executemany(spec.insert_sql, rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state (log, sealed, inode, offset) VALUES (?, ?, ?, ?)",
+            (spec.name, sealed, inode, offset),
+        )
+        return len(rows)
+
+    @staticmethod
+    def _rows(spec: _LogTable, lines: Iterator[bytes]) -> Iterator[tuple[Any, ...]]:
+        for line in lines:
+            if not line.strip():
+                continue
+            document = framing.unframe(line)
+            raw = document.decode("utf-8")
+            yield spec.row(json.loads(raw), raw)
+
+    def _sync_beads(self, conn: sqlite3.Connection) -> int:
+        known = {
+            row["bead_id"]: row["source_identity"]
+            for row in conn.execute("SELECT bead_id, source_identity FROM beads")
+        }
+        seen: set[str] = set()
+        changed = 0
+        if self.runs_dir.exists():
+            for child in self.runs_dir.iterdir():
+                written = self._upsert_bead(conn, child.name, known.get(child.name))
+                if written is None:
+                    continue
+                seen.add(child.name)
+                changed += int(written)
+        removed = [bead_id for bead_id in known if bead_id not in seen]
+        conn.executemany("DELETE FROM beads WHERE bead_id = ?", [(b,) for b in removed])
+        return changed + len(removed)
+
+    def _upsert_bead(
+        self, conn: sqlite3.Connection, bead_id: str, known_identity: Optional[str]
+    ) -> Optional[bool]:
+        """
+        Mirror one bead.json unless its identity is `known_identity`; returns whether the row
+        was written, or None when the file does not exist. Unparseable files are skipped.
+        """
+
+        bead_path = self.runs_dir / bead_id / "bead.json"
+        try:
+            stat = bead_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        identity = f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+        if known_identity == identity:
+            return False
+        try:
+            raw = bead_path.read_text(encoding="utf-8")
+            payload = json.loads(raw)
+            row = (
+                payload["bead_id"],
+                payload["title"],
+                payload["bead_type"],
+                payload["status"],
+                int(payload.get("priority", 3)),
+                payload.get("owner"),
+                _timestamp(payload.get("created_at")),
+                identity,
+                raw,
+            )
+        except (ValueError, KeyError, TypeError):
+            return False
+        if row[0] != bead_id:
+            return False
+        conn.execute(
+            "INSERT OR REPLACE INTO beads (bead_id, title, bead_type, status, priority, "
+            "owner, created_at, source_identity, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            row,
+        )
+        return True
+
+    def rebuild(self) -> SyncStats:
+        """Drop the mirror and rebuild it from the source files."""
+
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+        return self.sync()
+
+    def query_execution_records(
+        self,
+        *,
+        bead_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        exit_code: Optional[int] = None,
+        since: Optional[datetime] = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Latest `limit` matching records, oldest first."""
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (("bead_id", bead_id), ("phase", phase), ("exit_code", exit_code)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since.timestamp())
+        return self._latest("execution_records", clauses, params, limit)
+
+    def query_decision_entries(
+        self,
+        *,
+        bead_id: Optional[str] = None,
+        decision_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Latest `limit` matching ledger entries, oldest first."""
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (("bead_id", bead_id), ("decision_type", decision_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since.timestamp())
+        return self._latest("decision_entries", clauses, params, limit)
+
+    def _latest(
+        self, table: str, clauses: list[str], params: list[Any], limit: int
+    ) -> list[dict[str, Any]]:
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT payload FROM {table} {where} ORDER BY id DESC LIMIT ?"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, (*params, limit)).fetchall()
+        return [json.loads(row["payload"]) for row in reversed(rows)]
+
+    def query_beads(
+        self, *, status: Optional[str] = None, q: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """Bead summary columns (status, priority, created_at order) for runs/ artifacts."""
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if q:
+            clauses.append("(instr(lower(bead_id), ?) > 0 OR instr(lower(title), ?) > 0)")
+            params.extend([q.lower(), q.lower()])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT bead_id, title, bead_type, status, priority, owner, "
+            "json_extract(payload, '$.created_at') AS created_at FROM beads "
+            f"{where} ORDER BY status, priority, created_at"
+        )
+        with closing(self._connect()) as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def bead_ids(self) -> set[str]:
+        with closing(self._connect()) as conn:
+            return {row["bead_id"] for row in conn.execute("SELECT bead_id FROM beads")}
+
+
+def _log_position(log_path: Path) -> tuple[str, int, int]:
+    """(sealed segment numbers as JSON, active inode, active size) as stored in sync_state."""
+
+    numbers = [segment.number for segment in segments.sealed_segments(log_path)]
+    try:
+        stat = os.stat(log_path)
+        inode, size = stat.st_ino, stat.st_size
+    except FileNotFoundError:
+        inode, size = 0, 0
+    return json.dumps(numbers), inode, size
+
+
+def _sealed_numbers(raw: str) -> Optional[list[int]]:
+    """Segment numbers stored by `_log_position`; None for an older format (resync)."""
+
+    try:
+        numbers = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(numbers, list) or not all(isinstance(n, int) for n in numbers):
+        return None
+    return numbers
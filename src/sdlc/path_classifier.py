@@ -0,0 +1,143 @@
+"""
+Compiled classifier for changed paths against a boundary registry and the discovery allowlist.
+
+Boundary checks used to test every changed file against every subsystem prefix with
+`str.startswith`, and the discovery Policy A gate repeated similar scans for production
+prefixes and the allowlist. A `PathClassifier` is compiled once per (registry hash,
+allowlist) and answers all three questions for a path in one pass:
+
+- plain prefixes (`src/`, `README.md`) go into a table keyed by prefix length, so a lookup is
+  one dict probe per distinct prefix length instead of one `startswith` per prefix
+- patterns containing `*`, `?` or `[` are globs, matched with `fnmatch` semantics against the
+  whole path (`*` also crosses `/`); a glob ending in `/` matches everything below it
+
+Paths and prefixes are normalized as before (leading `./` characters stripped). A path is a
+production hit when it belongs to any subsystem, i.e. matches any registry prefix.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+from .codec import sha256_canonical_model
+from .models import BoundaryRegistry
+
+_GLOB_CHARS = frozenset("*?[")
+_MAX_CACHED = 32
+
+
+def normalize_path(path: str) -> str:
+    return path.lstrip("./")
+
+
+def is_glob(pattern: str) -> bool:
+    return any(ch in _GLOB_CHARS for ch in pattern)
+
+
+@dataclass(frozen=True)
+class PathClass:
+    subsystems: frozenset[str]
+    allowlisted: bool
+
+    @property
+    def production(self) -> bool:
+        return bool(self.subsystems)
+
+
+class _PatternSet:
+    """Prefix table + compiled globs, mapping a path to the labels of every matching entry."""
+
+    def __init__(self, entries: Iterable[tuple[str, str]]) -> None:
+        self._prefixes: dict[str, set[str]] = {}
+        globs: dict[str, set[str]] = {}
+        for pattern, label in entries:
+            normalized = normalize_path(pattern)
+            if not normalized:
+                continue
+            if is_glob(normalized):
+                if normalized.endswith("/"):
+                    normalized += "*"
+                globs.setdefault(normalized, set()).add(label)
+            else:
+                self._prefixes.setdefault(normalized, set()).add(label)
+        self._lengths = sorted({len(prefix) for prefix in self._prefixes})
+        self._globs = [
+            (re.compile(fnmatch.translate(glob)), frozenset(labels))
+            for glob, labels in sorted(globs.items())
+        ]
+        self.patterns = sorted([*self._prefixes, *globs])
+
+    def match(self, path: str) -> set[str]:
+        labels: set[str] = set()
+        prefixes = self._prefixes
+        for length in self._lengths:
+            if length > len(path):
+                break
+            hit = prefixes.get(path[:length])
+            if hit is not None:
+                labels.update(hit)
+        for regex, glob_labels in self._globs:
+            if regex.match(path):
+                labels.update(glob_labels)
+        return labels
+
+    def any(self, path: str) -> bool:
+        prefixes = self._prefixes
+        for length in self._lengths:
+            if length > len(path):
+                break
+            if path[:length] in prefixes:
+                return True
+        return any(regex.match(path) for regex, _ in self._globs)
+
+
+class PathClassifier:
+    def __init__(self, registry: BoundaryRegistry, allowlist: Sequence[str] = ()) -> None:
+        self._subsystems = _PatternSet(
+            (prefix, subsystem.name)
+            for subsystem in registry.subsystems
+            for prefix in subsystem.paths
+        )
+        self._allowlist = _PatternSet((prefix, "") for prefix in allowlist)
+
+    @property
+    def production_prefixes(self) -> list[str]:
+        return list(self._subsystems.patterns)
+
+    def subsystems_for(self, path: str) -> set[str]:
+        return self._subsystems.match(normalize_path(path))
+
+    def classify(self, path: str) -> PathClass:
+        normalized = normalize_path(path)
+        return PathClass(
+            subsystems=frozenset(self._subsystems.match(normalized)),
+            allowlisted=self._allowlist.any(normalized),
+        )
+
+
+_CACHE: dict[tuple[str, tuple[str, ...]], PathClassifier] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def path_classifier(
+    registry: BoundaryRegistry,
+    registry_hash: Optional[str] = None,
+    allowlist: Sequence[str] = (),
+) -> PathClassifier:
+    """The compiled classifier for `registry` (+ `allowlist`), cached by registry hash."""
+
+    if registry_hash is None:
+        registry_hash = sha256_canonical_model(registry)
+    key = (registry_hash, tuple(allowlist))
+    with _CACHE_LOCK:
+        classifier = _CACHE.get(key)
+        if classifier is None:
+            if len(_CACHE) >= _MAX_CACHED:
+                _CACHE.clear()
+            classifier = PathClassifier(registry, allowlist)
+            _CACHE[key] = classifier
+        return classifier
@@ -0,0 +1,272 @@
+"""
+Event-sourced bead status: a projection of the journal's applied transitions.
+
+`runs/<bead_id>/bead.json` is overwritten in place by every transition, but each applied
+transition is also journaled (`ExecutionRecord.applied_transition`, e.g. "ready -> in_progress").
+Replaying those records in order rebuilds every bead's status, and replaying them up to a
+timestamp answers "what was the state at time T".
+
+To keep replay short, the projection stores a snapshot every `SDLC_PROJECTION_SNAPSHOT_EVERY`
+records (default 500) under `runs/projection.snapshots/`. A snapshot holds the full projected
+state plus the journal position it covers (see `segments.iter_lines_from`), so a replay starts
+from the latest usable snapshot and reads only the records after it. Snapshots whose position
+lies beyond the current journal (e.g. after it was truncated or replaced) are ignored.
+
+Records are read as plain JSON (no model validation), and time-travel queries stop at the first
+record newer than T, i.e. they assume the journal is in append (= created_at) order.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from . import framing, segments
+
+_SNAPSHOT_VERSION = 1
+_MAX_SNAPSHOTS = 20
+
+Position = tuple[int, int]
+
+
+def snapshot_every() -> int:
+    raw = os.getenv("SDLC_PROJECTION_SNAPSHOT_EVERY", "").strip()
+    if not raw:
+        return 500
+    value = int(raw)
+    if value < 1:
+        raise ValueError("SDLC_PROJECTION_SNAPSHOT_EVERY must be >= 1")
+    return value
+
+
+@dataclass
+class ProjectedBead:
+    status: str
+    last_transition: str
+    updated_at: str
+    transitions: int = 0
+
+
+@dataclass
+class ProjectionState:
+    records: int = 0
+    position: Position = (0, 0)
+    last_created_at: Optional[str] = None
+    beads: dict[str, ProjectedBead] = field(default_factory=dict)
+
+    def apply(self, payload: dict[str, Any]) -> None:
+        created_at = payload.get("created_at")
+        if isinstance(created_at, str):
+            self.last_created_at = created_at
+        transition = payload.get("applied_transition")
+        bead_id = payload.get("bead_id")
+        if not isinstance(transition, str) or not isinstance(bead_id, str):
+            return
+        _, arrow, to_status = transition.partition("->")
+        if not arrow or not to_status.strip():
+            return
+        previous = self.beads.get(bead_id)
+        self.beads[bead_id] = ProjectedBead(
+            status=to_status.strip(),
+            last_transition=transition.strip(),
+            updated_at=created_at if isinstance(created_at, str) else "",
+            transitions=(previous.transitions if previous is not None else 0) + 1,
+        )
+
+    def status_of(self, bead_id: str) -> Optional[str]:
+        bead = self.beads.get(bead_id)
+        return bead.status if bead is not None else None
+
+    def copy(self) -> ProjectionState:
+        return ProjectionState(
+            records=self.records,
+            position=self.position,
+            last_created_at=self.last_created_at,
+            beads=dict(self.beads),
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "records": self.records,
+            "position": list(self.position),
+            "last_created_at": self.last_created_at,
+            "beads": {
+                bead_id: {
+                    "status": bead.status,
+                    "last_transition": bead.last_transition,
+                    "updated_at": bead.updated_at,
+                    "transitions": bead.transitions,
+                }
+                for bead_id, bead in sorted(self.beads.items())
+            },
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> ProjectionState:
+        stream, offset = (int(v) for v in payload["position"])
+        last_created_at = payload.get("last_created_at")
+        return cls(
+            records=int(payload["records"]),
+            position=(stream, offset),
+            last_created_at=str(last_created_at) if last_created_at is not None else None,
+            beads={
+                str(bead_id): ProjectedBead(
+                    status=str(data["status"]),
+                    last_transition=str(data["last_transition"]),
+                    updated_at=str(data["updated_at"]),
+                    transitions=int(data.get("transitions", 0)),
+                )
+                for bead_id, data in payload["beads"].items()
+            },
+        )
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _reachable(position: Position, sizes: list[Optional[int]]) -> bool:
+    stream, offset = position
+    if stream >= len(sizes):
+        return False
+    size = sizes[stream]
+    return size is None or offset <= size
+
+
+class BeadProjection:
+    def __init__(self, journal_path: Path, snapshot_dir: Optional[Path] = None) -> None:
+        self.journal_path = journal_path
+        self.snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+        self._current: Optional[ProjectionState] = None
+        self.records_replayed = 0
+
+    # ---- queries ----
+
+    def current(self) -> ProjectionState:
+        """State after every journaled record (the in-memory head is caught up incrementally)."""
+
+        with self._lock:
+            sizes = segments.stream_sizes(self.journal_path)
+            state = self._current
+            if state is None or not _reachable(state.position, sizes):
+                state = self._latest_snapshot(sizes, None)
+            state = self._replay(state, None)
+            self._current = state
+            return state.copy()
+
+    def at(self, when: datetime) -> ProjectionState:
+        """State as of `when`: every record created at or before it has been applied."""
+
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        with self._lock:
+            sizes = segments.stream_sizes(self.journal_path)
+            start = self._latest_snapshot(sizes, when)
+            head = self._current
+            if (
+                head is not None
+                and head.records > start.records
+                and _reachable(head.position, sizes)
+                and (head.last_created_at is None or _parse_time(head.last_created_at) <= when)
+            ):
+                start = head.copy()
+            return self._replay(start, when)
+
+    def write_snapshot(self) -> Optional[Path]:
+        """Snapshot the current state now (regardless of the interval)."""
+
+        state = self.current()
+        with self._lock:
+            return self._store(state)
+
+    # ---- internals ----
+
+    def _replay(self, state: ProjectionState, until: Optional[datetime]) -> ProjectionState:
+        every = snapshot_every()
+        start_stream, start_offset = state.position
+        for line_stream, line_offset, line in segments.iter_lines_from(
+            self.journal_path, start_stream, start_offset
+        ):
+            try:
+                payload = json.loads(framing.unframe(line))
+            except ValueError:
+                payload = None
+            if isinstance(payload, dict):
+                created_at = payload.get("created_at")
+                if (
+                    until is not None
+                    and isinstance(created_at, str)
+                    and _parse_time(created_at) > until
+                ):
+                    break
+                state.apply(payload)
+            state.records += 1
+            state.position = (line_stream, line_offset)
+            self.records_replayed += 1
+            if state.records % every == 0:
+                self._store(state)
+        return state
+
+    def _snapshot_paths(self) -> list[Path]:
+        if self.snapshot_dir is None or not self.snapshot_dir.is_dir():
+            return []
+        return sorted(self.snapshot_dir.glob("*.json"))
+
+    def _latest_snapshot(
+        self, sizes: list[Optional[int]], until: Optional[datetime]
+    ) -> ProjectionState:
+        for path in reversed(self._snapshot_paths()):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+                if payload.get("version") != _SNAPSHOT_VERSION:
+                    continue
+                state = ProjectionState.from_json(payload)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                continue
+            if not _reachable(state.position, sizes):
+                continue
+            if (
+                until is not None
+                and state.last_created_at is not None
+                and _parse_time(state.last_created_at) > until
+            ):
+                continue
+            return state
+        return ProjectionState()
+
+    def _store(self, state: ProjectionState) -> Optional[Path]:
+        if self.snapshot_dir is None:
+            return None
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_dir / f"{state.records:012d}.json"
+        if not path.exists():
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(state.to_json(), separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+        for stale in self._snapshot_paths()[:-_MAX_SNAPSHOTS]:
+            stale.unlink(missing_ok=True)
+        return path
+
+
+_PROJECTIONS: dict[tuple[Path, Optional[Path]], BeadProjection] = {}
+_PROJECTIONS_LOCK = threading.Lock()
+
+
+def bead_projection(journal_path: Path, snapshot_dir: Optional[Path] = None) -> BeadProjection:
+    """Return the process-wide projection of `journal_path`."""
+
+    with _PROJECTIONS_LOCK:
+        key = (journal_path, snapshot_dir)
+        projection = _PROJECTIONS.get(key)
+        if projection is None:
+            projection = BeadProjection(journal_path, snapshot_dir)
+            _PROJECTIONS[key] = projection
+        return projection
@@ -0,0 +1,400 @@
+"""
+Segmented storage for append-only JSONL logs (journal + decision ledger).
+
+The active log keeps its historical path (e.g. `runs/journal.jsonl`) so writers, tailers
+and external tooling are unaffected. Once it reaches `SDLC_SEGMENT_MAX_BYTES` it is sealed:
+
+1. the active file is renamed into `<log>.segments/NNNNNN.jsonl` (atomic, same directory
+   tree), so the next append starts a fresh active file
+2. the sealed file is optionally compressed (`SDLC_SEGMENT_COMPRESSION`: gzip (default),
+   zstd, none)
+3. `<log>.segments/manifest.json` records the segment's record count, created_at range and
+   bead_id set, so per-bead and time-bounded reads can skip irrelevant segments
+
+Only step 1 holds the log's append lock; steps 2-3 run under a separate roll lock, so
+writers keep appending while a segment is compressed. Sealed segments are immutable. A crash
+between steps leaves an uncompressed segment that is not in the manifest yet; readers still
+include it and the next seal adopts it.
+
+Segmentation is opt-in: with `SDLC_SEGMENT_MAX_BYTES` unset, logs stay single files.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+import io
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, cast
+
+from . import framing
+from .writer import locked
+
+MANIFEST_NAME = "manifest.json"
+_SEGMENT_RE = re.compile(r"^(\d{6})\.jsonl(\.gz|\.zst)?$")
+_ROLL_LOCK = threading.Lock()
+
+
+@dataclass
+class SegmentInfo:
+    name: str
+    record_count: int = 0
+    bytes_raw: int = 0
+    first_created_at: Optional[str] = None
+    last_created_at: Optional[str] = None
+    # None means "unknown" (orphan segment not yet in the manifest): never skip it.
+    bead_ids: Optional[list[str]] = field(default=None)
+    # Last framed sequence number in the segment (None when unframed or unknown).
+    last_seq: Optional[int] = None
+
+    @property
+    def number(self) -> int:
+        return _segment_number(self.name)
+
+    def may_contain(self, bead_id: Optional[str]) -> bool:
+        return bead_id is None or self.bead_ids is None or bead_id in self.bead_ids
+
+    def may_overlap(self, since: Optional[datetime]) -> bool:
+        if since is None or self.last_created_at is None:
+            return True
+        return datetime.fromisoformat(self.last_created_at) >= since
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "record_count": self.record_count,
+            "bytes_raw": self.bytes_raw,
+            "first_created_at": self.first_created_at,
+            "last_created_at": self.last_created_at,
+            "bead_ids": self.bead_ids,
+            "last_seq": self.last_seq,
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> SegmentInfo:
+        return cls(
+            name=str(payload["name"]),
+            record_count=int(payload.get("record_count", 0)),
+            bytes_raw=int(payload.get("bytes_raw", 0)),
+            first_created_at=payload.get("first_created_at"),
+            last_created_at=payload.get("last_created_at"),
+            bead_ids=payload.get("bead_ids"),
+            last_seq=payload.get("last_seq"),
+        )
+
+
+def segments_dir(log_path: Path) -> Path:
+    return log_path.with_name(f"{log_path.stem}.segments")
+
+
+def segment_max_bytes() -> Optional[int]:
+    raw = os.getenv("SDLC_SEGMENT_MAX_BYTES")
+    if raw is None or not raw.strip():
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def segment_compression() -> str:
+    value = os.getenv("SDLC_SEGMENT_COMPRESSION", "gzip").strip().lower()
+    if value not in {"gzip", "zstd", "none"}:
+        raise ValueError(f"Unsupported SDLC_SEGMENT_COMPRESSION: {value}")
+    return value
+
+
+def _zstd_module() -> Any:
+    for name in ("compression.zstd", "zstandard"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    raise RuntimeError("zstd segment compression requires Python 3.14+ or 'zstandard'")
+
+
+def _open_segment(path: Path) -> BinaryIO:
+    if path.suffix == ".gz":
+        return cast(BinaryIO, gzip.open(path, "rb"))
+    if path.suffix == ".zst":
+        module = _zstd_module()
+        raw = path.open("rb")
+        if hasattr(module, "ZstdDecompressor"):
+            reader = module.ZstdDecompressor().stream_reader(raw, closefd=True)
+            return io.BufferedReader(reader)
+        return module.open(raw, "rb")  # type: ignore[no-any-return]
+    return path.open("rb")
+
+
+def _compress(source: Path, compression: str) -> Path:
+    if compression == "none":
+        return source
+    if compression == "gzip":
+        target = source.with_name(source.name + ".gz")
+        tmp = target.with_name(f".{target.name}.tmp")
+        with source.open("rb") as src, gzip.open(tmp, "wb") as dst:
+            while chunk := src.read(1024 * 1024):
+                dst.write(chunk)
+    else:
+        module = _zstd_module()
+        target = source.with_name(source.name + ".zst")
+        tmp = target.with_name(f".{target.name}.tmp")
+        data = source.read_bytes()
+        if hasattr(module, "ZstdCompressor") and hasattr(module.ZstdCompressor, "compress"):
+            compressed = module.ZstdCompressor().compress(data)
+        else:
+            compressed = module.compress(data)
+        tmp.write_bytes(compressed)
+    os.replace(tmp, target)
+    source.unlink()
+    return target
+
+
+def _write_manifest(directory: Path, segments: list[SegmentInfo]) -> None:
+    payload = {"segments": [segment.to_json() for segment in segments]}
+    tmp = directory / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, directory / MANIFEST_NAME)
+
+
+def _read_manifest(directory: Path) -> list[SegmentInfo]:
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return []
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return [SegmentInfo.from_json(item) for item in payload.get("segments", [])]
+
+
+def _segment_number(name: str) -> int:
+    match = _SEGMENT_RE.match(name)
+    return int(match.group(1)) if match else 0
+
+
+def sealed_segments(log_path: Path) -> list[SegmentInfo]:
+    """Sealed segments in append order, including orphans not yet recorded in the manifest."""
+
+    directory = segments_dir(log_path)
+    if not directory.exists():
+        return []
+    segments = _read_manifest(directory)
+    known_numbers = {_segment_number(segment.name) for segment in segments}
+    orphans: dict[int, str] = {}
+    for child in sorted(directory.iterdir()):
+        match = _SEGMENT_RE.match(child.name)
+        if match is None or int(match.group(1)) in known_numbers:
+            continue
+        # If compression finished but the raw file was not removed yet, the compressed copy
+        # is complete; sorted() visits the raw name first, so later names win.
+        orphans[int(match.group(1))] = child.name
+    segments.extend(SegmentInfo(name=name) for name in orphans.values())
+    segments.sort(key=lambda segment: _segment_number(segment.name))
+    return segments
+
+
+def manifest_identity(log_path: Path) -> tuple[tuple[str, int], ...]:
+    """Cheap fingerprint of the sealed segment set (changes whenever a segment is sealed)."""
+
+    directory = segments_dir(log_path)
+    if not directory.exists():
+        return ()
+    return tuple(
+        (child.name, child.stat().st_size)
+        for child in sorted(directory.iterdir())
+        if _SEGMENT_RE.match(child.name)
+    )
+
+
+def iter_segment_lines(log_path: Path, segment: SegmentInfo) -> Iterator[bytes]:
+    path = segments_dir(log_path) / segment.name
+    with _open_segment(path) as handle:
+        for line in handle:
+            if line.strip():
+                yield line
+
+
+def iter_sealed_lines(
+    log_path: Path,
+    *,
+    bead_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> Iterator[bytes]:
+    """Yield lines from sealed segments (oldest first), skipping segments via the manifest."""
+
+    for segment in sealed_segments(log_path):
+        if not segment.may_contain(bead_id) or not segment.may_overlap(since):
+            continue
+        yield from iter_segment_lines(log_path, segment)
+
+
+def iter_lines_from(
+    log_path: Path, stream: int = 0, offset: int = 0
+) -> Iterator[tuple[int, int, bytes]]:
+    """
+    Yield `(stream, end_offset, line)` for every complete line after position `(stream, offset)`.
+
+    Streams are the sealed segments in append order followed by the active file; offsets count
+    raw (uncompressed) bytes, so a position taken in the active file stays valid once that
+    file is sealed into the next segment. A torn tail of the active file is not yielded.
+    """
+
+    sealed = sealed_segments(log_path)
+    for index, segment in enumerate(sealed):
+        if index < stream:
+            continue
+        position = offset if index == stream else 0
+        with _open_segment(segments_dir(log_path) / segment.name) as handle:
+            remaining = position
+            while remaining > 0:
+                skipped = len(handle.read(min(remaining, 1024 * 1024)))
+                if skipped == 0:
+                    break
+                remaining -= skipped
+            for line in handle:
+                position += len(line)
+                if line.strip():
+                    yield index, position, line
+    active = len(sealed)
+    if stream > active or not log_path.exists():
+        return
+    position = offset if stream == active else 0
+    with log_path.open("rb") as handle:
+        handle.seek(position)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+            if line.strip():
+                yield active, position, line
+
+
+def stream_sizes(log_path: Path) -> list[Optional[int]]:
+    """Raw size of each stream (see `iter_lines_from`); None when a segment's size is unknown."""
+
+    sizes: list[Optional[int]] = [
+        segment.bytes_raw if segment.bead_ids is not None else None
+        for segment in sealed_segments(log_path)
+    ]
+    try:
+        sizes.append(log_path.stat().st_size)
+    except FileNotFoundError:
+        sizes.append(0)
+    return sizes
+
+
+def last_sealed_seq(log_path: Path) -> Optional[int]:
+    """Latest framed sequence number across sealed segments (None if there is none)."""
+
+    for segment in reversed(sealed_segments(log_path)):
+        if segment.bead_ids is None:
+            segment = _describe(segments_dir(log_path) / segment.name, segment.name)
+        if segment.last_seq is not None:
+            return segment.last_seq
+    return None
+
+
+def _describe(path: Path, name: str) -> SegmentInfo:
+    info = SegmentInfo(name=name, bead_ids=[])
+    bead_ids: set[str] = set()
+    with _open_segment(path) as handle:
+        for line in handle:
+            info.bytes_raw += len(line)
+            if not line.strip():
+                continue
+            info.record_count += 1
+            try:
+                seq, document = framing.parse(line)
+                payload = json.loads(document)
+            except ValueError:
+                continue
+            if seq is not None:
+                info.last_seq = seq
+            if not isinstance(payload, dict):
+                continue
+            if isinstance(payload.get("bead_id"), str):
+                bead_ids.add(payload["bead_id"])
+            created_at = payload.get("created_at")
+            if isinstance(created_at, str):
+                if info.first_created_at is None:
+                    info.first_created_at = created_at
+                info.last_created_at = created_at
+    info.bead_ids = sorted(bead_ids)
+    return info
+
+
+def _adopt(path: Path, compression: str) -> SegmentInfo:
+    info = _describe(path, path.name)
+    if path.suffix == ".jsonl":
+        info.name = _compress(path, compression).name
+    else:
+        path.with_suffix("").unlink(missing_ok=True)
+    return info
+
+
+def _roll_lock_path(log_path: Path) -> Path:
+    return segments_dir(log_path) / MANIFEST_NAME
+
+
+def seal_active(
+    log_path: Path, *, compression: Optional[str] = None, min_bytes: int = 1
+) -> Optional[SegmentInfo]:
+    """
+    Seal the active log into a new segment once it holds at least `min_bytes` (no-op when it
+    is missing, empty or smaller).
+
+    Only the rename holds the append lock; compression and the manifest update run afterwards
+    under the roll lock, so writers are not stalled while a segment is compressed.
+    """
+
+    compression = compression or segment_compression()
+    directory = segments_dir(log_path)
+    if not directory.exists() and _active_size(log_path) < min_bytes:
+        return None
+    # Rollers serialize on the roll lock (threads and processes); the size is re-checked
+    # under it so a roller that lost the race does not seal the fresh active file.
+    with _ROLL_LOCK, locked(_roll_lock_path(log_path)):
+        sealed_name: Optional[str] = None
+        with locked(log_path):
+            if _active_size(log_path) >= max(min_bytes, 1):
+                next_number = (
+                    max((_segment_number(s.name) for s in sealed_segments(log_path)), default=0) + 1
+                )
+                sealed_name = f"{next_number:06d}.jsonl"
+                os.replace(log_path, directory / sealed_name)
+        # The new segment and any left by an interrupted seal are orphans until adopted.
+        segments = _read_manifest(directory)
+        adopted = [
+            _adopt(directory / orphan.name, compression)
+            for orphan in sealed_segments(log_path)
+            if orphan.bead_ids is None
+        ]
+        if adopted:
+            segments.extend(adopted)
+            segments.sort(key=lambda segment: _segment_number(segment.name))
+            _write_manifest(directory, segments)
+        if sealed_name is None:
+            return None
+        number = _segment_number(sealed_name)
+        return next(info for info in adopted if _segment_number(info.name) == number)
+
+
+def _active_size(log_path: Path) -> int:
+    try:
+        return log_path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def maybe_roll(log_path: Path) -> Optional[SegmentInfo]:
+    """Seal the active log if segmentation is enabled and it has reached the size limit."""
+
+    limit = segment_max_bytes()
+    if limit is None or _active_size(log_path) < limit:
+        return None
+    return seal_active(log_path, min_bytes=limit)
@@ -7,6 +7,8 @@ Design goals:
 - Journaling is preserved (ExecutionRecord written for transition attempts, and
   optionally for other actions like grounding/evidence collection).
 - SSE endpoint streams appended ExecutionRecord + DecisionLedgerEntry lines.
+- Endpoints that run the engine are `async def` and go through `async_engine` (git as asyncio
+  subprocesses, blocking file IO on a bounded pool) instead of holding Starlette's threadpool.
 
 Run (from repo root):
   uv run uvicorn sdlc.server:app --reload --port 8000
@@ -17,18 +19,23 @@ or set SDLC_REPO_ROOT if you run elsewhere:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import json
 import logging
 import os
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, List, Optional
 
-from fastapi import Body, Depends, FastAPI, HTTPException, Query
+from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from . import async_engine, framing, segments
+from .bd_store import bead_payload_from_issue
 from .engine import (
     append_decision_entry,
     build_execution_record,
@@ -37,23 +44,30 @@ from .engine import (
     create_approval_entry,
     decision_ledger_link,
     generate_grounding_bundle,
-    invalidate_evidence_if_stale,
     record_decision_action,
     record_transition_attempt,
     request_transition,
-    validate_evidence_bundle,
 )
+from .git_probe import git_probe_scope
+from .jobs import FINISHED, Job, JobHandle, JobStatus
 from .io import (
     Paths,
     git_head,
     git_is_dirty,
+    import_bd_issues,
+    load_bd_issues,
     load_bead,
     load_bead_review,
     load_decision_ledger,
+    load_dependency_graph,
+    load_projection,
     load_evidence,
     load_execution_records,
+    load_execution_records_for_bead,
     load_grounding,
-    now_utc,
+    load_job_queue,
+    load_recent_decision_entries,
+    open_mirror,
     write_model,
     write_execution_record,
 )
@@ -62,6 +76,7 @@ from .models import (
     Bead,
     BeadReview,
     BeadStatus,
+    DecisionType,
     EvidenceBundle,
     FileRef,
     GitRef,
@@ -69,6 +84,8 @@ from .models import (
     OpenSpecRef,
     RunPhase,
 )
+from .dep_graph import DependencyGraph
+from .mirror import Mirror
 from .phase import phase_for_transition_str
 
 BEAD_ID_RE = re.compile(r"^work-[a-z0-9]+(\.[a-z0-9]+)?$")
@@ -95,6 +112,7 @@ class BeadSummary(BaseModel):
     priority: int = 3
     owner: Optional[str] = None
     created_at: Optional[str] = None  # serialized ISO string for easy UI use
+    blocked_by: List[str] = Field(default_factory=list)  # depends_on entries not done yet
 
 
 class ArtifactStatus(BaseModel):
@@ -119,6 +137,7 @@ class TransitionResponse(BaseModel):
     requested_transition: str
     applied_transition: Optional[str] = None
     auto_abort: bool = False
+    etag: Optional[str] = None
     execution_record: Optional[dict[str, Any]] = None  # JSON-serializable ExecutionRecord dump
 
 
@@ -138,6 +157,73 @@ class ActionResponse(BaseModel):
     produced_artifacts: List[str] = Field(default_factory=list)
 
 
+class BdImportRequest(BaseModel):
+    bead_ids: Optional[List[str]] = None
+    status: Optional[str] = None
+
+
+class BdImportResponse(BaseModel):
+    imported: List[str] = Field(default_factory=list)
+    updated: List[str] = Field(default_factory=list)
+    unchanged: List[str] = Field(default_factory=list)
+    skipped: List[str] = Field(default_factory=list)
+    invalid: List[str] = Field(default_factory=list)
+
+
+class TransitionReadinessOut(BaseModel):
+    transition: str
+    ok: bool
+    blockers: List[str] = Field(default_factory=list)
+    notes: str = ""
+    auto_abort: bool = False
+    authority: Optional[List[str]] = None
+
+
+class BeadReadinessOut(BaseModel):
+    bead_id: str
+    status: Optional[str] = None
+    ready: bool = False
+    transitions: List[TransitionReadinessOut] = Field(default_factory=list)
+    error: Optional[str] = None
+
+
+class JobOut(BaseModel):
+    job_id: str
+    kind: str
+    bead_id: Optional[str]
+    status: JobStatus
+    created_at: str
+    pid: int
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    progress: float = 0.0
+    message: str = ""
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+
+
+class JobLogOut(BaseModel):
+    job_id: str
+    offset: int
+    next_offset: int
+    text: str
+
+
+class ProjectedBeadOut(BaseModel):
+    bead_id: str
+    status: str
+    last_transition: str
+    updated_at: str
+    transitions: int = 0
+
+
+class ProjectionResponse(BaseModel):
+    records: int
+    last_created_at: Optional[str] = None
+    beads: List[ProjectedBeadOut] = Field(default_factory=list)
+
+
 # ----------------------------
 # Utilities / dependencies
 # ----------------------------
@@ -147,7 +233,7 @@ def _default_actor(kind: str = "human") -> Actor:
     return Actor(kind=kind, name=os.getenv("USER", "unknown"))  # type: ignore[arg-type]
 
 
-def get_paths() -> Paths:
+async def get_paths() -> Paths:
     root = os.getenv("SDLC_REPO_ROOT")
     repo_root = Path(root).resolve() if root else Path.cwd().resolve()
     return Paths(repo_root)
@@ -160,6 +246,22 @@ def _decision_action_phase_for_bead(paths: Paths, bead_id: str) -> RunPhase:
     return RunPhase.verify
 
 
+def _quote_etag(etag: str) -> str:
+    return f'"{etag}"'
+
+
+def _etag_value(header: Optional[str]) -> Optional[str]:
+    """The token from an If-Match header (quotes and weak prefix stripped; `*` means any)."""
+    if header is None:
+        return None
+    value = header.strip()
+    if value == "*":
+        return None
+    if value.startswith("W/"):
+        value = value[2:]
+    return value.strip('"')
+
+
 def _safe_read_json(path: Path) -> Optional[dict[str, Any]]:
     """
     Defensive read: if a file is mid-write or truncated, avoid crashing the UI.
@@ -185,134 +287,48 @@ def _runs_bead_ids(paths: Paths) -> set[str]:
     return ids
 
 
-def _bd_issues_path(paths: Paths) -> Optional[Path]:
-    candidates = [
-        paths.repo_root / "beads" / "issues.jsonl",
-        paths.repo_root / "beads" / "issues.json",
-        paths.repo_root / ".beads" / "issues.jsonl",
-    ]
-    for cand in candidates:
-        if cand.exists():
-            return cand
-    return None
-
-
 def _iter_bd_issue_dicts(paths: Paths) -> Iterable[dict[str, Any]]:
-    """
-    Attempts to parse bd issues store in a tolerant way:
-    - JSONL (preferred)
-    - JSON list/dict (fallback)
-    - "JSONL but named .json" (fallback)
-    """
-    p = _bd_issues_path(paths)
-    if p is None:
-        return []
-
-    text = p.read_text(encoding="utf-8")
-
-    # Try whole-file JSON first
-    try:
-        payload = json.loads(text)
-        if isinstance(payload, list):
-            return [x for x in payload if isinstance(x, dict)]
-        if isinstance(payload, dict):
-            # common patterns: {"issues":[...]} or similar
-            for key in ("issues", "items", "data"):
-                val = payload.get(key)
-                if isinstance(val, list):
-                    return [x for x in val if isinstance(x, dict)]
-            # if it's a single issue dict
-            return [payload]
-    except Exception:
-        logger.exception("Failed to parse bd issues store as JSON", extra={"path": str(p)})
-        pass
-
-    # Fallback: parse line-by-line JSONL
-    out: list[dict[str, Any]] = []
-    for line in text.splitlines():
-        if not line.strip():
-            continue
-        try:
-            obj = json.loads(line)
-        except Exception:
-            logger.exception("Failed to parse bd issues JSONL line", extra={"path": str(p)})
-            continue
-        if isinstance(obj, dict):
-            out.append(obj)
-    return out
+    """bd store issues via the shared indexed adapter (format sniffed once, appends read only)."""
+    return load_bd_issues(paths)
 
 
 def _bead_from_bd_issue(data: dict[str, Any]) -> Optional[Bead]:
     bead_id = data.get("id")
     if not isinstance(bead_id, str) or not BEAD_ID_RE.match(bead_id):
         return None
-
-    created_at = data.get("created_at") or data.get("created")
-    if not created_at:
-        created_at = now_utc().isoformat()
-
-    acceptance = data.get("acceptance") or data.get("acceptance_criteria") or ""
-    description = data.get("description") or data.get("body") or ""
-    title = data.get("title") or bead_id
-    status = data.get("status") or "draft"
-
-    owner = data.get("owner") or data.get("assignee")
-    priority: Any = data.get("priority")
-
-    if isinstance(priority, str) and priority.upper().startswith("P"):
-        try:
-            priority = int(priority[1:]) + 1
-        except ValueError:
-            priority = 3
-    if isinstance(priority, int):
-        priority = max(1, min(5, priority))
-    else:
-        priority = 3
-
-    bead_payload = {
-        "schema_name": "sdlc.bead",
-        "schema_version": 1,
-        "artifact_id": bead_id,
-        "created_at": created_at,
-        "created_by": {"kind": "system", "name": "bd"},
-        "bead_id": bead_id,
-        "title": title,
-        "bead_type": data.get("bead_type", "implementation"),
-        "status": status,
-        "priority": priority,
-        "owner": owner,
-        "requirements_md": description,
-        "acceptance_criteria_md": acceptance,
-        "context_md": data.get("notes") or data.get("context") or "",
-        "acceptance_checks": [],
-    }
     try:
-        return Bead.model_validate(bead_payload)
+        return Bead.model_validate(bead_payload_from_issue(data))
     except Exception:
         logger.exception("Failed to convert bd issue to Bead", extra={"bead_id": str(bead_id)})
         return None
 
 
-def _list_beads(paths: Paths) -> List[Bead]:
-    by_id: Dict[str, Bead] = {}
-
-    # 1) Prefer Loom-managed artifacts in runs/
-    for bead_id in sorted(_runs_bead_ids(paths)):
-        try:
-            by_id[bead_id] = load_bead(paths, bead_id)
-        except Exception:
-            logger.exception("Failed to load bead from runs", extra={"bead_id": bead_id})
-            continue
-
-    # 2) Also include bd store items not yet materialized into runs/<id>/bead.json
+def _bd_only_summaries(
+    paths: Paths,
+    materialized: set[str],
+    graph: DependencyGraph,
+    *,
+    status: Optional[str],
+    q: Optional[str],
+) -> Iterator[tuple[tuple[str, int, datetime], BeadSummary]]:
+    """bd store items not materialized into runs/<id>/bead.json yet, filtered like the rest."""
+    needle = q.lower() if q else None
     for issue in _iter_bd_issue_dicts(paths):
         bead = _bead_from_bd_issue(issue)
-        if bead is None:
+        if bead is None or bead.bead_id in materialized:
             continue
-        if bead.bead_id not in by_id:
-            by_id[bead.bead_id] = bead
-
-    return list(by_id.values())
+        if status and bead.status.value != status:
+            continue
+        if needle and needle not in bead.bead_id.lower() and needle not in bead.title.lower():
+            continue
+        materialized.add(bead.bead_id)
+        summary = _bead_summary(bead)
+        summary.blocked_by = [
+            dependency_id
+            for dependency_id in dict.fromkeys(bead.depends_on)
+            if graph.status(dependency_id) != BeadStatus.done.value
+        ]
+        yield (bead.status.value, bead.priority, bead.created_at), summary
 
 
 def _journal_simple_action(
@@ -344,7 +360,23 @@ def _journal_simple_action(
 # FastAPI app
 # ----------------------------
 
+
+class GitProbeScopeMiddleware:
+    """Memoize git state per HTTP request (one `git status` however many records are written)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with git_probe_scope():
+            await self.app(scope, receive, send)
+
+
 app = FastAPI(title="Loom SDLC API", version="0.1")
+app.add_middleware(GitProbeScopeMiddleware)
 
 # If your frontend runs on a different origin, this is convenient for dev.
 # Tighten this for real usage.
@@ -376,46 +408,147 @@ def list_beads(
     status: Optional[str] = Query(None, description="Filter by bead status (exact match)"),
     q: Optional[str] = Query(None, description="Substring match against id/title"),
     limit: int = Query(200, ge=1, le=2000),
+    unblocked: bool = Query(False, description="Only beads whose dependencies are all done"),
     paths: Paths = Depends(get_paths),
 ) -> List[BeadSummary]:
-    beads = _list_beads(paths)
-
-    def matches(b: Bead) -> bool:
-        if status and b.status.value != status:
-            return False
-        if q:
-            needle = q.lower()
-            if needle not in b.bead_id.lower() and needle not in b.title.lower():
-                return False
-        return True
-
-    filtered = [b for b in beads if matches(b)]
+    graph = load_dependency_graph(paths)
+    mirror = open_mirror(paths)
+    if mirror is not None:
+        rows = _bead_summary_rows_from_mirror(mirror, paths, graph, status=status, q=q)
+    else:
+        rows = _bead_summary_rows_from_graph(paths, graph, status=status, q=q)
+    if unblocked:
+        rows = [row for row in rows if not row[1].blocked_by]
     # Stable sort: status then priority then created_at (best-effort)
-    filtered.sort(key=lambda b: (b.status.value, b.priority, b.created_at))
-    out: List[BeadSummary] = []
-    for b in filtered[:limit]:
-        out.append(
-            BeadSummary(
-                bead_id=b.bead_id,
-                title=b.title,
-                bead_type=b.bead_type.value,
-                status=b.status.value,
-                priority=b.priority,
-                owner=b.owner,
-                created_at=b.created_at.isoformat() if getattr(b, "created_at", None) else None,
-            )
+    rows.sort(key=lambda item: item[0])
+    return [summary for _, summary in rows[:limit]]
+
+
+def _bead_summary(b: Bead) -> BeadSummary:
+    return BeadSummary(
+        bead_id=b.bead_id,
+        title=b.title,
+        bead_type=b.bead_type.value,
+        status=b.status.value,
+        priority=b.priority,
+        owner=b.owner,
+        created_at=b.created_at.isoformat() if getattr(b, "created_at", None) else None,
+    )
+
+
+def _bead_summary_rows_from_graph(
+    paths: Paths, graph: DependencyGraph, *, status: Optional[str], q: Optional[str]
+) -> list[tuple[tuple[str, int, datetime], BeadSummary]]:
+    """runs/ beads straight from the dependency graph (no bead.json loads), plus bd-only items."""
+    rows: list[tuple[tuple[str, int, datetime], BeadSummary]] = []
+    needle = q.lower() if q else None
+    materialized: set[str] = set()
+    for node in graph.nodes():
+        if not BEAD_ID_RE.match(node.bead_id):
+            continue
+        materialized.add(node.bead_id)
+        if status and node.status != status:
+            continue
+        if needle and needle not in node.bead_id.lower() and needle not in node.title.lower():
+            continue
+        summary = BeadSummary(
+            bead_id=node.bead_id,
+            title=node.title,
+            bead_type=node.bead_type,
+            status=node.status,
+            priority=node.priority,
+            owner=node.owner,
+            created_at=node.created_at,
+            blocked_by=graph.blockers(node.bead_id),
         )
-    return out
+        rows.append(
+            ((node.status, node.priority, datetime.fromisoformat(node.created_at)), summary)
+        )
+    rows.extend(_bd_only_summaries(paths, materialized, graph, status=status, q=q))
+    return rows
+
+
+def _bead_summary_rows_from_mirror(
+    mirror: Mirror, paths: Paths, graph: DependencyGraph, *, status: Optional[str], q: Optional[str]
+) -> list[tuple[tuple[str, int, datetime], BeadSummary]]:
+    """Indexed query over runs/ beads, merged with bd store items not materialized yet."""
+    rows: list[tuple[tuple[str, int, datetime], BeadSummary]] = []
+    for row in mirror.query_beads(status=status, q=q):
+        created_at = datetime.fromisoformat(row["created_at"])
+        summary = BeadSummary(
+            bead_id=row["bead_id"],
+            title=row["title"],
+            bead_type=row["bead_type"],
+            status=row["status"],
+            priority=row["priority"],
+            owner=row["owner"],
+            created_at=created_at.isoformat(),
+            blocked_by=graph.blockers(row["bead_id"]),
+        )
+        rows.append(((summary.status, summary.priority, created_at), summary))
+    rows.extend(_bd_only_summaries(paths, mirror.bead_ids(), graph, status=status, q=q))
+    return rows
+
+
+@app.get("/api/readiness", response_model=List[BeadReadinessOut])
+async def readiness(
+    bead_id: Optional[List[str]] = Query(None, description="Beads to evaluate (default: all)"),
+    failure_targets: bool = Query(False, description="Also evaluate failure transitions"),
+    paths: Paths = Depends(get_paths),
+) -> List[BeadReadinessOut]:
+    """Gate results for every allowed next transition of many beads; nothing is written."""
+    if bead_id is None:
+        bead_ids: Iterable[str] = sorted(await async_engine.run_blocking(_runs_bead_ids, paths))
+    else:
+        for candidate in bead_id:
+            if not BEAD_ID_RE.match(candidate):
+                raise HTTPException(status_code=400, detail="Invalid bead_id format")
+        bead_ids = bead_id
+    report = await async_engine.readiness_report(
+        paths, bead_ids, include_failure_targets=failure_targets
+    )
+    return [BeadReadinessOut(ready=item.ready, **dataclasses.asdict(item)) for item in report]
+
+
+@app.get("/api/projection", response_model=ProjectionResponse)
+def projection(
+    at: Optional[datetime] = Query(None, description="State as of this ISO timestamp"),
+    paths: Paths = Depends(get_paths),
+) -> ProjectionResponse:
+    """Bead statuses replayed from the journal (starting from the latest snapshot)."""
+    replay = load_projection(paths)
+    state = replay.at(at) if at is not None else replay.current()
+    return ProjectionResponse(
+        records=state.records,
+        last_created_at=state.last_created_at,
+        beads=[
+            ProjectedBeadOut(bead_id=bead_id, **dataclasses.asdict(bead))
+            for bead_id, bead in sorted(state.beads.items())
+        ],
+    )
+
+
+@app.post("/api/bd/import", response_model=BdImportResponse)
+def bd_import(
+    req: Optional[BdImportRequest] = Body(None),
+    paths: Paths = Depends(get_paths),
+) -> BdImportResponse:
+    """Materialize bd issues into runs/ in bulk (skips unchanged and Loom-managed beads)."""
+    req = req or BdImportRequest()
+    summary = import_bd_issues(paths, bead_ids=req.bead_ids, status=req.status)
+    return BdImportResponse(**dataclasses.asdict(summary))
 
 
 @app.get("/api/beads/{bead_id}", response_model=Bead)
-def get_bead(bead_id: str, paths: Paths = Depends(get_paths)) -> Bead:
+async def get_bead(bead_id: str, response: Response, paths: Paths = Depends(get_paths)) -> Bead:
     if not BEAD_ID_RE.match(bead_id):
         raise HTTPException(status_code=400, detail="Invalid bead_id format")
     try:
-        return load_bead(paths, bead_id)
+        bead, etag = await async_engine.load_bead_versioned(paths, bead_id)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Bead not found")
+    response.headers["ETag"] = _quote_etag(etag)
+    return bead
 
 
 @app.get("/api/beads/{bead_id}/artifacts", response_model=BeadArtifactsIndex)
@@ -442,24 +575,48 @@ def bead_artifacts(bead_id: str, paths: Paths = Depends(get_paths)) -> BeadArtif
     return BeadArtifactsIndex(bead_id=bead_id, artifacts=artifacts)
 
 
-@app.post("/api/beads/{bead_id}/agent/plan", response_model=ActionResponse)
-def agent_plan(
+# ----------------------------
+# Agent actions (background jobs)
+# ----------------------------
+
+
+def _job_out(job: Job) -> JobOut:
+    return JobOut(**job.to_json())
+
+
+async def _submit_job(
+    paths: Paths, kind: str, bead_id: str, func: Callable[[JobHandle], dict[str, Any]]
+) -> JobOut:
+    if not BEAD_ID_RE.match(bead_id):
+        raise HTTPException(status_code=400, detail="Invalid bead_id format")
+    queue = load_job_queue(paths)
+    job = await async_engine.run_blocking(queue.submit, kind, func, bead_id=bead_id)
+    return _job_out(job)
+
+
+@app.post("/api/beads/{bead_id}/agent/plan", response_model=JobOut, status_code=202)
+async def agent_plan(
     bead_id: str,
     actor: Optional[Actor] = Body(None),
     paths: Paths = Depends(get_paths),
-) -> ActionResponse:
-    from .agents import run_plan
+) -> JobOut:
+    """Queue a planner run; poll `/api/jobs/{job_id}` (or watch `job` events) for the result."""
 
-    actor = actor or Actor(kind="agent", name="sdlc-web")
-    run_plan(paths, bead_id, actor)
-    return ActionResponse(
-        ok=True,
-        notes="Planner run completed",
-        produced_artifacts=[
-            f"runs/{bead_id}/agent_plan.json",
-            f"runs/{bead_id}/codex_prompt.md",
-        ],
-    )
+    agent_actor = actor or Actor(kind="agent", name="sdlc-web")
+
+    def run(job: JobHandle) -> dict[str, Any]:
+        from .agents import run_plan
+
+        run_plan(paths, bead_id, agent_actor)
+        return {
+            "notes": "Planner run completed",
+            "produced_artifacts": [
+                f"runs/{bead_id}/agent_plan.json",
+                f"runs/{bead_id}/codex_prompt.md",
+            ],
+        }
+
+    return await _submit_job(paths, "plan", bead_id, run)
 
 
 class OpenSpecProposeRequest(BaseModel):
@@ -470,81 +627,139 @@ class OpenSpecProposeRequest(BaseModel):
     openspec_ref_id: Optional[str] = None
 
 
-@app.post("/api/beads/{bead_id}/agent/openspec-propose", response_model=ActionResponse)
-def agent_openspec_propose(
+@app.post("/api/beads/{bead_id}/agent/openspec-propose", response_model=JobOut, status_code=202)
+async def agent_openspec_propose(
     bead_id: str,
     req: OpenSpecProposeRequest = Body(...),
     paths: Paths = Depends(get_paths),
-) -> ActionResponse:
-    from .agents import run_openspec_propose
-    from .agents.config import AgentSettings
-
-    settings = AgentSettings()
-    draft = run_openspec_propose(
-        paths,
-        bead_id,
-        req.change_id,
-        actor=Actor(kind="agent", name="sdlc-web"),
-        interactive=False,
-        council=req.council,
-        overwrite=req.overwrite,
-        openspec_ref_id=req.openspec_ref_id,
-        answers=req.answers,
-        settings=settings,
-    )
-    produced = [
-        f"runs/{bead_id}/agent_openspec.json",
-        f"runs/{bead_id}/agent_openspec.md",
-        f"openspec/changes/{req.change_id}/proposal.md",
-        f"openspec/changes/{req.change_id}/tasks.md",
-    ]
-    if draft.design_md:
-        produced.append(f"openspec/changes/{req.change_id}/design.md")
-    produced.extend([df.path for df in draft.delta_files])
-    # Note: OpenSpecRef path is included in the execution record; caller can discover via filesystem.
-    return ActionResponse(
-        ok=True, notes="OpenSpec proposal drafted", produced_artifacts=sorted(set(produced))
-    )
-
-
-@app.post("/api/beads/{bead_id}/agent/implement", response_model=ActionResponse)
-def agent_implement(
+) -> JobOut:
+    def run(job: JobHandle) -> dict[str, Any]:
+        from .agents import run_openspec_propose
+        from .agents.config import AgentSettings
+
+        draft = run_openspec_propose(
+            paths,
+            bead_id,
+            req.change_id,
+            actor=Actor(kind="agent", name="sdlc-web"),
+            interactive=False,
+            council=req.council,
+            overwrite=req.overwrite,
+            openspec_ref_id=req.openspec_ref_id,
+            answers=req.answers,
+            settings=AgentSettings(),
+        )
+        produced = [
+            f"runs/{bead_id}/agent_openspec.json",
+            f"runs/{bead_id}/agent_openspec.md",
+            f"openspec/changes/{req.change_id}/proposal.md",
+            f"openspec/changes/{req.change_id}/tasks.md",
+        ]
+        if draft.design_md:
+            produced.append(f"openspec/changes/{req.change_id}/design.md")
+        produced.extend([df.path for df in draft.delta_files])
+        # OpenSpecRef path is in the execution record; callers can discover it via filesystem.
+        return {"notes": "OpenSpec proposal drafted", "produced_artifacts": sorted(set(produced))}
+
+    return await _submit_job(paths, "openspec_propose", bead_id, run)
+
+
+@app.post("/api/beads/{bead_id}/agent/implement", response_model=JobOut, status_code=202)
+async def agent_implement(
     bead_id: str,
     auto_transition: bool = Body(False),
     actor: Optional[Actor] = Body(None),
     paths: Paths = Depends(get_paths),
-) -> ActionResponse:
-    from .agents import run_implement
+) -> JobOut:
+    agent_actor = actor or Actor(kind="agent", name="sdlc-web")
 
-    actor = actor or Actor(kind="agent", name="sdlc-web")
-    code = run_implement(paths, bead_id, actor, auto_transition=auto_transition)
-    if code != 0:
-        raise HTTPException(status_code=500, detail=f"codex exited {code}")
-    return ActionResponse(
-        ok=True,
-        notes="Implementation run completed",
-        produced_artifacts=[f"runs/{bead_id}/codex.log"],
-    )
+    def run(job: JobHandle) -> dict[str, Any]:
+        from .agents import run_implement
+
+        code = run_implement(paths, bead_id, agent_actor, auto_transition=auto_transition)
+        if code != 0:
+            raise RuntimeError(f"codex exited {code}")
+        return {
+            "notes": "Implementation run completed",
+            "produced_artifacts": [f"runs/{bead_id}/codex.log"],
+        }
+
+    return await _submit_job(paths, "implement", bead_id, run)
 
 
-@app.post("/api/beads/{bead_id}/agent/verify", response_model=ActionResponse)
-def agent_verify(
+@app.post("/api/beads/{bead_id}/agent/verify", response_model=JobOut, status_code=202)
+async def agent_verify(
     bead_id: str,
     auto_transition: bool = Body(False),
     actor: Optional[Actor] = Body(None),
     paths: Paths = Depends(get_paths),
-) -> ActionResponse:
-    from .agents import run_verify
+) -> JobOut:
+    agent_actor = actor or Actor(kind="agent", name="sdlc-web")
 
-    actor = actor or Actor(kind="agent", name="sdlc-web")
-    code = run_verify(paths, bead_id, actor, auto_transition=auto_transition)
-    if code != 0:
-        raise HTTPException(status_code=400, detail="evidence validation failed")
-    return ActionResponse(
-        ok=True,
-        notes="Verify run completed",
-        produced_artifacts=[f"runs/{bead_id}/evidence.json"],
+    def run(job: JobHandle) -> dict[str, Any]:
+        from .agents import run_verify
+
+        code = run_verify(paths, bead_id, agent_actor, auto_transition=auto_transition)
+        if code != 0:
+            raise RuntimeError("evidence validation failed")
+        return {
+            "notes": "Verify run completed",
+            "produced_artifacts": [f"runs/{bead_id}/evidence.json"],
+        }
+
+    return await _submit_job(paths, "verify", bead_id, run)
+
+
+@app.get("/api/jobs", response_model=List[JobOut])
+async def list_jobs(
+    bead_id: Optional[str] = Query(None),
+    status: Optional[JobStatus] = Query(None),
+    kind: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    paths: Paths = Depends(get_paths),
+) -> List[JobOut]:
+    """Jobs newest first."""
+    queue = load_job_queue(paths)
+    jobs = await async_engine.run_blocking(
+        queue.list_jobs, bead_id=bead_id, status=status, kind=kind
+    )
+    return [_job_out(job) for job in jobs[:limit]]
+
+
+async def _job_or_404(paths: Paths, job_id: str) -> Job:
+    job = await async_engine.run_blocking(load_job_queue(paths).get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobOut)
+async def get_job(job_id: str, paths: Paths = Depends(get_paths)) -> JobOut:
+    return _job_out(await _job_or_404(paths, job_id))
+
+
+@app.get("/api/jobs/{job_id}/log", response_model=JobLogOut)
+async def get_job_log(
+    job_id: str,
+    offset: int = Query(0, ge=0, description="Byte offset to continue from (next_offset)"),
+    paths: Paths = Depends(get_paths),
+) -> JobLogOut:
+    await _job_or_404(paths, job_id)
+    text, next_offset = await async_engine.run_blocking(
+        load_job_queue(paths).read_log, job_id, offset
     )
+    return JobLogOut(job_id=job_id, offset=offset, next_offset=next_offset, text=text)
+
+
+@app.post("/api/jobs/{job_id}/cancel", response_model=JobOut)
+async def cancel_job(job_id: str, paths: Paths = Depends(get_paths)) -> JobOut:
+    """Cancel a queued job, or ask a running one to stop (409 once it has finished)."""
+    job = await async_engine.run_blocking(load_job_queue(paths).cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status in FINISHED and not job.cancel_requested:
+        raise HTTPException(status_code=409, detail=f"Job already {job.status.value}")
+    return _job_out(job)
 
 
 @app.get("/api/beads/{bead_id}/review", response_model=Optional[BeadReview])
@@ -568,8 +783,10 @@ def bead_journal(
     limit: int = Query(500, ge=1, le=5000),
     paths: Paths = Depends(get_paths),
 ) -> List[dict[str, Any]]:
-    records = [r for r in load_execution_records(paths) if r.bead_id == bead_id]
-    records = records[-limit:]
+    mirror = open_mirror(paths)
+    if mirror is not None:
+        return mirror.query_execution_records(bead_id=bead_id, limit=limit)
+    records = load_execution_records_for_bead(paths, bead_id, limit=limit)
     return [r.model_dump(mode="json") for r in records]
 
 
@@ -579,21 +796,95 @@ def bead_decisions(
     limit: int = Query(500, ge=1, le=5000),
     paths: Paths = Depends(get_paths),
 ) -> List[dict[str, Any]]:
-    entries = [e for e in load_decision_ledger(paths) if e.bead_id == bead_id]
-    entries = entries[-limit:]
+    mirror = open_mirror(paths)
+    if mirror is not None:
+        return mirror.query_decision_entries(bead_id=bead_id, limit=limit)
+    entries = load_recent_decision_entries(paths, bead_id, limit=limit)
     return [e.model_dump(mode="json") for e in entries]
 
 
+@app.get("/api/journal", response_model=List[dict[str, Any]])
+def journal_query(
+    bead_id: Optional[str] = Query(None),
+    phase: Optional[RunPhase] = Query(None),
+    exit_code: Optional[int] = Query(None),
+    since: Optional[datetime] = Query(None, description="Only records created at/after this"),
+    limit: int = Query(500, ge=1, le=5000),
+    paths: Paths = Depends(get_paths),
+) -> List[dict[str, Any]]:
+    """Filter execution records across all beads (indexed when the SQLite mirror exists)."""
+    mirror = open_mirror(paths)
+    if mirror is not None:
+        return mirror.query_execution_records(
+            bead_id=bead_id,
+            phase=phase.value if phase else None,
+            exit_code=exit_code,
+            since=since,
+            limit=limit,
+        )
+    records = [
+        r
+        for r in load_execution_records(paths)
+        if (bead_id is None or r.bead_id == bead_id)
+        and (phase is None or r.phase == phase)
+        and (exit_code is None or r.exit_code == exit_code)
+        and (since is None or r.created_at >= since)
+    ]
+    return [r.model_dump(mode="json") for r in records[-limit:]]
+
+
+@app.get("/api/decisions", response_model=List[dict[str, Any]])
+def decisions_query(
+    bead_id: Optional[str] = Query(None),
+    decision_type: Optional[DecisionType] = Query(None),
+    since: Optional[datetime] = Query(None, description="Only entries created at/after this"),
+    limit: int = Query(500, ge=1, le=5000),
+    paths: Paths = Depends(get_paths),
+) -> List[dict[str, Any]]:
+    """Filter decision ledger entries across all beads (indexed when the mirror exists)."""
+    mirror = open_mirror(paths)
+    if mirror is not None:
+        return mirror.query_decision_entries(
+            bead_id=bead_id,
+            decision_type=decision_type.value if decision_type else None,
+            since=since,
+            limit=limit,
+        )
+    entries = [
+        e
+        for e in load_decision_ledger(paths)
+        if (bead_id is None or e.bead_id == bead_id)
+        and (decision_type is None or e.decision_type == decision_type)
+        and (since is None or e.created_at >= since)
+    ]
+    return [e.model_dump(mode="json") for e in entries[-limit:]]
+
+
 @app.post("/api/beads/{bead_id}/transition", response_model=TransitionResponse)
-def transition_bead(
+async def transition_bead(
     bead_id: str,
+    response: Response,
     req: TransitionRequest = Body(...),
+    if_match: Optional[str] = Header(None),
     paths: Paths = Depends(get_paths),
 ) -> TransitionResponse:
+    """Request a transition; send the bead's ETag as If-Match to reject stale writes (412)."""
     actor = req.actor or _default_actor("human")
-    result = request_transition(paths, bead_id, req.transition, actor)
+    expected = _etag_value(if_match)
+    result = await async_engine.request_transition(
+        paths, bead_id, req.transition, actor, if_match=expected
+    )
     phase = phase_for_transition_str(req.transition)
-    record = record_transition_attempt(paths, bead_id, phase, actor, req.transition, result)
+    record = await async_engine.record_transition_attempt(
+        paths, bead_id, phase, actor, req.transition, result
+    )
+    headers = {"ETag": _quote_etag(result.etag)} if result.etag else None
+    if result.conflict:
+        # 412 when the client's If-Match was stale, 409 when another writer won the race.
+        status_code = 412 if expected is not None else 409
+        raise HTTPException(status_code=status_code, detail=result.notes, headers=headers)
+    if headers:
+        response.headers.update(headers)
 
     return TransitionResponse(
         ok=result.ok,
@@ -601,6 +892,7 @@ def transition_bead(
         requested_transition=req.transition,
         applied_transition=result.applied_transition if result.ok else None,
         auto_abort=result.auto_abort,
+        etag=result.etag,
         execution_record=record.model_dump(mode="json"),
     )
 
@@ -653,7 +945,7 @@ def evidence_collect(
 
 
 @app.post("/api/beads/{bead_id}/evidence/validate", response_model=ActionResponse)
-def evidence_validate(
+async def evidence_validate(
     bead_id: str,
     mark_validated: bool = Query(
         True, description="If true, set EvidenceBundle.status=validated on success"
@@ -662,16 +954,19 @@ def evidence_validate(
     paths: Paths = Depends(get_paths),
 ) -> ActionResponse:
     # Mimic CLI behavior: if the evidence bundle is human-authored, journal under that actor.
-    evidence = load_evidence(paths, bead_id)
+    evidence = await async_engine.run_blocking(load_evidence, paths, bead_id)
     effective_actor = actor or Actor(kind="system", name="sdlc-web")
     if evidence and evidence.created_by.kind == "human":
         effective_actor = evidence.created_by
 
-    evidence_after, errors = validate_evidence_bundle(
+    evidence_after, errors = await async_engine.validate_evidence_bundle(
         paths, bead_id, effective_actor, mark_validated=mark_validated
     )
 
-    git_ref = GitRef(head_before=git_head(paths), dirty_before=git_is_dirty(paths))
+    git_ref = GitRef(
+        head_before=await async_engine.git_head(paths),
+        dirty_before=await async_engine.git_is_dirty(paths),
+    )
     record = build_execution_record(
         bead_id=bead_id,
         phase=RunPhase.verify,
@@ -685,7 +980,7 @@ def evidence_validate(
         if evidence_after
         else [],
     )
-    write_execution_record(paths, record)
+    await async_engine.run_blocking(write_execution_record, paths, record)
 
     return ActionResponse(
         ok=not errors,
@@ -695,13 +990,13 @@ def evidence_validate(
 
 
 @app.post("/api/beads/{bead_id}/evidence/invalidate-if-stale", response_model=ActionResponse)
-def evidence_invalidate_stale(
+async def evidence_invalidate_stale(
     bead_id: str,
     actor: Optional[Actor] = Body(None),
     paths: Paths = Depends(get_paths),
 ) -> ActionResponse:
     actor = actor or Actor(kind="system", name="sdlc-web")
-    reason = invalidate_evidence_if_stale(paths, bead_id, actor)
+    reason = await async_engine.invalidate_evidence_if_stale(paths, bead_id, actor)
     return ActionResponse(ok=True, notes=reason or "not stale")
 
 
@@ -764,7 +1059,7 @@ def approve_bead(
 
 
 @app.post("/api/beads/{bead_id}/abort", response_model=TransitionResponse)
-def abort_bead(
+async def abort_bead(
     bead_id: str,
     req: AbortRequest = Body(...),
     paths: Paths = Depends(get_paths),
@@ -772,9 +1067,12 @@ def abort_bead(
     actor = req.actor or _default_actor("human")
     if not req.reason.strip():
         raise HTTPException(status_code=400, detail="reason must be non-empty")
+    return await async_engine.offload(paths, _abort_bead, paths, bead_id, req.reason, actor)
+
 
+def _abort_bead(paths: Paths, bead_id: str, reason: str, actor: Actor) -> TransitionResponse:
     # 1) Create + append abort decision
-    entry = create_abort_entry(bead_id, req.reason, actor)
+    entry = create_abort_entry(bead_id, reason, actor)
     append_decision_entry(paths, entry)
 
     # 2) Journal the decision action itself (spec-friendly)
@@ -825,54 +1123,140 @@ async def _tail_jsonl(
     bead_id: Optional[str],
     poll_seconds: float,
     start_at_end: bool,
-) -> AsyncIterator[str]:
+    after_seq: Optional[int] = None,
+) -> AsyncIterator[tuple[Optional[int], str]]:
     """
-    Async generator that yields SSE frames for new JSONL lines appended to `path`.
+    Async generator that yields (seq, SSE frame) for new JSONL lines appended to `path`.
+
+    The file handle stays open between polls so a segment roll (the active file renamed into
+    `<log>.segments/`) is detected by inode: the old handle is drained before switching to
+    the new active file, so lines written just before the roll are not lost.
+
+    With `after_seq` (framed logs only), the stream resumes exactly after that record,
+    replaying from sealed segments if needed; unframed lines are skipped in that mode.
     """
-    # We keep our own file position to support tailing.
     pos = 0
-    if start_at_end and path.exists():
+    if start_at_end and after_seq is None and path.exists():
         pos = path.stat().st_size
+    handle: Optional[BinaryIO] = None
+    if after_seq is not None and path.exists():
+        # Open before listing segments: anything sealed afterwards is still in this handle.
+        handle = path.open("rb")
+        for segment in segments.sealed_segments(path):
+            if segment.last_seq is not None and segment.last_seq <= after_seq:
+                continue
+            for seq, frame in _sse_frames(
+                segments.iter_segment_lines(path, segment),
+                path=path,
+                event_name=event_name,
+                bead_id=bead_id,
+                after_seq=after_seq,
+            ):
+                after_seq = seq if seq is not None else after_seq
+                yield seq, frame
+
+    try:
+        while True:
+            try:
+                if handle is None and path.exists():
+                    handle = path.open("rb")
+                    handle.seek(pos)
+                if handle is not None:
+                    try:
+                        current = path.stat()
+                        rolled = current.st_ino != os.fstat(handle.fileno()).st_ino
+                    except FileNotFoundError:
+                        rolled = True
+                    if not rolled and current.st_size < handle.tell():
+                        # Truncated in place: start over.
+                        handle.seek(0)
+                    for seq, frame in _sse_frames(
+                        _complete_lines(handle),
+                        path=path,
+                        event_name=event_name,
+                        bead_id=bead_id,
+                        after_seq=after_seq,
+                    ):
+                        after_seq = seq if seq is not None else after_seq
+                        yield seq, frame
+                    pos = handle.tell()
+                    if rolled:
+                        handle.close()
+                        handle = None
+                        pos = 0
+                        continue
+            except Exception:
+                # If file is mid-rotate or transiently unreadable, just retry.
+                logger.exception("Failed to tail events file", extra={"path": str(path)})
+                await asyncio.sleep(poll_seconds)
 
-    while True:
-        if not path.exists():
             await asyncio.sleep(poll_seconds)
-            continue
+    finally:
+        if handle is not None:
+            handle.close()
 
+
+def _complete_lines(handle: BinaryIO) -> Iterator[bytes]:
+    while True:
+        start = handle.tell()
+        line = handle.readline()
+        if not line:
+            return
+        if not line.endswith(b"\n"):
+            # Partial write in progress: pick it up on the next poll.
+            handle.seek(start)
+            return
+        yield line
+
+
+def _sse_frames(
+    lines: Iterable[bytes],
+    *,
+    path: Path,
+    event_name: str,
+    bead_id: Optional[str],
+    after_seq: Optional[int],
+) -> Iterator[tuple[Optional[int], str]]:
+    for line in lines:
         try:
-            with path.open("r", encoding="utf-8") as f:
-                f.seek(pos)
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
-                    pos = f.tell()
-
-                    raw = line.strip()
-                    if not raw:
-                        continue
+            seq, payload = framing.parse(line)
+        except framing.CorruptRecordError:
+            logger.exception("Skipping corrupt SSE line", extra={"path": str(path)})
+            continue
+        if after_seq is not None:
+            if seq is None or seq <= after_seq:
+                continue
+            after_seq = seq
 
-                    # Filter by bead_id (parse minimal JSON)
-                    if bead_id is not None:
-                        try:
-                            obj = json.loads(raw)
-                        except Exception:
-                            logger.exception(
-                                "Failed to parse SSE line as JSON", extra={"path": str(path)}
-                            )
-                            continue
-                        obj_bead = obj.get("bead_id")
-                        if obj_bead != bead_id:
-                            continue
-                        raw = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
-
-                    yield f"event: {event_name}\ndata: {raw}\n\n"
-        except Exception:
-            # If file is mid-rotate or transiently unreadable, just retry.
-            logger.exception("Failed to tail events file", extra={"path": str(path)})
-            await asyncio.sleep(poll_seconds)
+        raw = payload.decode("utf-8").strip()
+        if not raw:
+            continue
+
+        # Filter by bead_id (parse minimal JSON)
+        if bead_id is not None:
+            try:
+                obj = json.loads(raw)
+            except Exception:
+                logger.exception("Failed to parse SSE line as JSON", extra={"path": str(path)})
+                continue
+            obj_bead = obj.get("bead_id")
+            if obj_bead != bead_id:
+                continue
+            raw = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
-        await asyncio.sleep(poll_seconds)
+        yield seq, f"event: {event_name}\ndata: {raw}\n\n"
+
+
+def _parse_last_event_id(value: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+    """Split an `<journal seq>:<decision seq>` event id; empty/invalid parts mean "no resume"."""
+
+    if not value:
+        return None, None
+    parts = value.split(":")
+    if len(parts) != 2:
+        return None, None
+    seqs = [int(part) if part.isdigit() else None for part in parts]
+    return seqs[0], seqs[1]
 
 
 @app.get("/api/events")
@@ -880,15 +1264,22 @@ async def events(
     bead_id: Optional[str] = Query(None, description="If set, only stream events for this bead_id"),
     start_at_end: bool = Query(True, description="If true, don't replay old events"),
     poll_seconds: float = Query(0.5, ge=0.1, le=5.0),
+    last_event_id: Optional[str] = Header(None),
     paths: Paths = Depends(get_paths),
 ) -> StreamingResponse:
     """
     Streams:
       - event: execution_record   data: <json>
       - event: decision_entry     data: <json>
+      - event: job                data: <json>  (background job lifecycle, see /api/jobs)
+
+    With journal framing enabled (SDLC_JOURNAL_FRAMING=1) every event carries an
+    `id: <journal seq>:<decision seq>`; browsers send it back as `Last-Event-ID` on reconnect and
+    the stream resumes exactly after those records.
 
     Tip: if you put nginx in front, disable proxy buffering for this route.
     """
+    journal_after, decision_after = _parse_last_event_id(last_event_id)
 
     async def stream() -> AsyncIterator[str]:
         # small initial hello (helps some clients)
@@ -900,6 +1291,7 @@ async def events(
             bead_id=bead_id,
             poll_seconds=poll_seconds,
             start_at_end=start_at_end,
+            after_seq=journal_after,
         )
         decision_task = _tail_jsonl(
             paths.decision_ledger_path,
@@ -907,29 +1299,44 @@ async def events(
             bead_id=bead_id,
             poll_seconds=poll_seconds,
             start_at_end=start_at_end,
+            after_seq=decision_after,
         )
-
-        # Interleave both streams (simple, fair-ish)
-        iters = [journal_task.__aiter__(), decision_task.__aiter__()]
-        i = 0
-        while True:
-            # keep-alive comment every ~15s to prevent idle timeouts
-            # (with poll_seconds default 0.5, this is about every 30 iterations)
-            if i % 30 == 0:
-                yield ": keep-alive\n\n"
-
-            # round-robin pull
-            for _ in range(len(iters)):
-                idx = i % len(iters)
-                i += 1
+        # Job events are not part of the resume id: current job state is at /api/jobs.
+        job_task = _tail_jsonl(
+            paths.jobs_events_path,
+            event_name="job",
+            bead_id=bead_id,
+            poll_seconds=poll_seconds,
+            start_at_end=True,
+        )
+        last_seqs: list[Optional[int]] = [journal_after, decision_after]
+        merged: asyncio.Queue[tuple[int, Optional[int], str]] = asyncio.Queue(maxsize=256)
+
+        async def pump(idx: int, source: AsyncIterator[tuple[Optional[int], str]]) -> None:
+            async for seq, msg in source:
+                await merged.put((idx, seq, msg))
+
+        # Each stream is pumped on its own, so a quiet log never holds back the others.
+        pumps = [
+            asyncio.create_task(pump(idx, source))
+            for idx, source in enumerate((journal_task, decision_task, job_task))
+        ]
+        try:
+            while True:
                 try:
-                    msg = await iters[idx].__anext__()
-                    yield msg
-                except StopAsyncIteration:
-                    # shouldn't happen, but just continue
+                    idx, seq, msg = await asyncio.wait_for(merged.get(), timeout=15.0)
+                except asyncio.TimeoutError:
+                    # keep-alive comment to prevent idle timeouts
+                    yield ": keep-alive\n\n"
                     continue
-
-            await asyncio.sleep(0)
+                if seq is not None and idx < len(last_seqs):
+                    last_seqs[idx] = seq
+                    ids = ["" if value is None else str(value) for value in last_seqs]
+                    msg = f"id: {ids[0]}:{ids[1]}\n{msg}"
+                yield msg
+        finally:
+            for task in pumps:
+                task.cancel()
 
     return StreamingResponse(
         stream(),
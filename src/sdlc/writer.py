@@ -0,0 +1,231 @@
+"""
+Lock-safe, group-committing appender for the JSONL logs.
+
+Several uvicorn workers and CLI processes may append to `runs/journal.jsonl` and
+`decision_ledger.jsonl` at the same time. Every append therefore:
+
+- takes an advisory `flock` on a sibling `<log>.lock` file (not the log itself, so segment
+  rolls that rename the active log are serialized with writers too)
+- opens the log *after* acquiring the lock, so it never writes into a file that has just
+  been sealed away
+- writes all of its bytes with a single `os.write` on an `O_APPEND` descriptor (looping only
+  on short writes, still under the lock), so lines from different writers never interleave
+
+Within a process, appends that arrive while another thread is committing are batched and
+written together with one write (+ one fsync): the classic group commit. An optional window
+(`SDLC_GROUP_COMMIT_MS`) makes the committing thread wait briefly for more appends.
+
+Durability (`SDLC_JOURNAL_DURABILITY`):
+- `none` (default): data is handed to the OS; survives a process crash, not a power loss
+- `fdatasync` / `fsync`: the batch is synced to disk before any appender in it returns
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Iterator, Optional
+
+from . import framing
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to in-process locking
+    fcntl = None  # type: ignore[assignment]
+
+
+class Durability(str, Enum):
+    none = "none"
+    fdatasync = "fdatasync"
+    fsync = "fsync"
+
+
+def durability_level() -> Durability:
+    raw = os.getenv("SDLC_JOURNAL_DURABILITY", Durability.none.value).strip().lower()
+    try:
+        return Durability(raw)
+    except ValueError as exc:
+        raise ValueError(f"Unsupported SDLC_JOURNAL_DURABILITY: {raw}") from exc
+
+
+def group_commit_window() -> float:
+    raw = os.getenv("SDLC_GROUP_COMMIT_MS", "")
+    try:
+        value = float(raw) if raw.strip() else 0.0
+    except ValueError:
+        return 0.0
+    return max(0.0, value) / 1000.0
+
+
+def lock_path(log_path: Path) -> Path:
+    return log_path.with_name(f"{log_path.name}.lock")
+
+
+_PROCESS_LOCKS: dict[Path, threading.Lock] = {}
+_PROCESS_LOCKS_GUARD = threading.Lock()
+
+
+def _process_lock(log_path: Path) -> threading.Lock:
+    with _PROCESS_LOCKS_GUARD:
+        lock = _PROCESS_LOCKS.get(log_path)
+        if lock is None:
+            lock = threading.Lock()
+            _PROCESS_LOCKS[log_path] = lock
+        return lock
+
+
+@contextmanager
+def locked(log_path: Path) -> Iterator[None]:
+    """Hold the exclusive append lock for `log_path` (threads and processes)."""
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with _process_lock(log_path):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(lock_path(log_path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+@dataclass
+class _PendingAppend:
+    data: bytes
+    offset: Optional[int] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def done(self) -> bool:
+        return self.offset is not None or self.error is not None
+
+
+class GroupCommitWriter:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._cond = threading.Condition()
+        self._pending: list[_PendingAppend] = []
+        self._committing = False
+        self.commits = 0
+        # (inode, size, seq) of the log right after our last framed commit.
+        self._last_framed: Optional[tuple[int, int, int]] = None
+
+    def append(self, data: bytes) -> tuple[int, int]:
+        """
+        Append `data` (one JSON line); returns the (offset, length) of what was written.
+
+        With framing enabled the line is written with its sequence/checksum prefix, so the
+        returned length covers the framed line.
+        """
+
+        item = _PendingAppend(data)
+        with self._cond:
+            self._pending.append(item)
+            while self._committing and not item.done:
+                self._cond.wait()
+            if not item.done:
+                self._committing = True
+                leader = True
+            else:
+                leader = False
+        if leader:
+            try:
+                self._commit_pending()
+            finally:
+                with self._cond:
+                    self._committing = False
+                    self._cond.notify_all()
+        if item.error is not None:
+            raise item.error
+        assert item.offset is not None
+        return item.offset, len(item.data)
+
+    def _commit_pending(self) -> None:
+        window = group_commit_window()
+        if window:
+            time.sleep(window)
+        with self._cond:
+            batch, self._pending = self._pending, []
+        try:
+            durability = durability_level()
+            with locked(self.path):
+                fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    stat = os.fstat(fd)
+                    if stat.st_size and os.pread(fd, 1, stat.st_size - 1) != b"\n":
+                        # Under the lock an unterminated tail can only be left by a writer that
+                        # died mid-append; appending after it would corrupt our line too.
+                        framing.repair_torn_tail(self.path)
+                        stat = os.fstat(fd)
+                    offset = stat.st_size
+                    if framing.framing_enabled():
+                        seq = self._next_seq(stat)
+                        for item in batch:
+                            item.data = framing.frame(seq, item.data)
+                            seq += 1
+                        size = offset + sum(len(item.data) for item in batch)
+                        self._last_framed = (stat.st_ino, size, seq - 1)
+                    _write_all(fd, b"".join(item.data for item in batch))
+                    if durability == Durability.fsync:
+                        os.fsync(fd)
+                    elif durability == Durability.fdatasync:
+                        getattr(os, "fdatasync", os.fsync)(fd)
+                finally:
+                    os.close(fd)
+        except BaseException as exc:
+            for item in batch:
+                item.error = exc
+            raise
+        self.commits += 1
+        for item in batch:
+            item.offset = offset
+            offset += len(item.data)
+
+    def _next_seq(self, stat: os.stat_result) -> int:
+        """Next sequence number; the caller holds the append lock."""
+
+        if self._last_framed is not None and self._last_framed[:2] == (
+            stat.st_ino,
+            stat.st_size,
+        ):
+            return self._last_framed[2] + 1
+        # Another process appended (or the log rolled) since our last commit: recover from disk.
+        from .io import iter_lines_reversed
+        from .segments import last_sealed_seq
+
+        last = framing.last_seq_in_lines(iter_lines_reversed(self.path))
+        if last is None:
+            last = last_sealed_seq(self.path)
+        return (last or 0) + 1
+
+
+_WRITERS: dict[Path, GroupCommitWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def log_writer(path: Path) -> GroupCommitWriter:
+    """Return the process-wide writer for the log at `path`."""
+
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(path)
+        if writer is None:
+            writer = GroupCommitWriter(path)
+            _WRITERS[path] = writer
+        return writer
@@ -2215,3 +2215,1592 @@ def test_policy_violation_record_helper(tmp_path: Path) -> None:
     records = load_execution_records(paths)
     assert records
     assert "out-of-grounding access" in (records[-1].notes_md or "")
+
+
+def test_journal_index_per_bead_reads(tmp_path: Path) -> None:
+    from sdlc.io import Paths, load_execution_records_for_bead, write_execution_record
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    for idx in range(3):
+        for bead_id in ("work-a12345", "work-b12345"):
+            record = build_execution_record(
+                bead_id, RunPhase.plan, actor, exit_code=idx, notes_md=f"{bead_id}-{idx}"
+            )
+            write_execution_record(paths, record)
+
+    assert paths.journal_index_path.exists()
+    records = load_execution_records_for_bead(paths, "work-a12345")
+    assert [r.notes_md for r in records] == [f"work-a12345-{idx}" for idx in range(3)]
+    latest = load_execution_records_for_bead(paths, "work-b12345", limit=2)
+    assert [r.exit_code for r in latest] == [1, 2]
+    assert load_execution_records_for_bead(paths, "work-c12345") == []
+
+
+def test_journal_index_catches_up_and_rebuilds(tmp_path: Path) -> None:
+    from sdlc.io import Paths, load_execution_records_for_bead, write_execution_record
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    write_execution_record(paths, build_execution_record("work-a12345", RunPhase.plan, actor))
+    assert len(load_execution_records_for_bead(paths, "work-a12345")) == 1
+
+    # Lines appended without going through write_execution_record are indexed lazily.
+    unindexed = build_execution_record("work-a12345", RunPhase.verify, actor, exit_code=7)
+    with paths.journal_path.open("a", encoding="utf-8") as handle:
+        handle.write(unindexed.model_dump_json() + "\n")
+    records = load_execution_records_for_bead(paths, "work-a12345")
+    assert [r.phase for r in records] == [RunPhase.plan, RunPhase.verify]
+
+    # A rewritten (shorter) journal forces a rebuild instead of reading stale offsets.
+    replacement = build_execution_record("work-b12345", RunPhase.plan, actor)
+    paths.journal_path.write_text(replacement.model_dump_json() + "\n", encoding="utf-8")
+    assert load_execution_records_for_bead(paths, "work-a12345") == []
+    assert len(load_execution_records_for_bead(paths, "work-b12345")) == 1
+
+
+def test_decision_ledger_reader_parses_only_appended_tail(tmp_path: Path) -> None:
+    from sdlc.engine import create_approval_entry
+    from sdlc.io import Paths, load_decision_ledger, write_decision_entry
+    from sdlc.ledger import ledger_reader
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="human", name="tester")
+    assert list(load_decision_ledger(paths)) == []
+    write_decision_entry(paths, create_approval_entry("work-a12345", "APPROVAL: one", actor))
+    first = list(load_decision_ledger(paths))
+    reader = ledger_reader(paths.decision_ledger_path)
+    parsed_after_first = reader.parsed_bytes
+
+    write_decision_entry(paths, create_approval_entry("work-b12345", "APPROVAL: two", actor))
+    second = list(load_decision_ledger(paths))
+    assert [e.bead_id for e in second] == ["work-a12345", "work-b12345"]
+    # The first entry is reused, not re-validated.
+    assert second[0] is first[0]
+    assert reader.parsed_bytes > parsed_after_first
+
+    # Replacing the file (new inode / shorter content) invalidates the cache.
+    replacement = create_approval_entry("work-c12345", "APPROVAL: three", actor)
+    tmp_file = tmp_path / "ledger.tmp"
+    tmp_file.write_text(replacement.model_dump_json() + "\n", encoding="utf-8")
+    tmp_file.replace(paths.decision_ledger_path)
+    assert [e.bead_id for e in load_decision_ledger(paths)] == ["work-c12345"]
+
+
+def test_decision_state_aggregates_per_bead(tmp_path: Path) -> None:
+    from sdlc.engine import create_approval_entry, find_active_exception_decision
+    from sdlc.io import Paths, load_decision_state, write_decision_entry
+    from sdlc.ledger import ledger_reader
+
+    paths = Paths(tmp_path)
+    human = Actor(kind="human", name="tester")
+    bead_id = "work-a12345"
+
+    def exception(summary: str, expires_at: datetime | None, waived: list[str]) -> None:
+        write_decision_entry(
+            paths,
+            DecisionLedgerEntry(
+                schema_name="sdlc.decision_ledger_entry",
+                schema_version=1,
+                artifact_id=f"decision-{summary}",
+                created_at=_now(),
+                created_by=human,
+                bead_id=bead_id,
+                decision_type=DecisionType.exception,
+                summary=summary,
+                expires_at=expires_at,
+                waived_acceptance_checks=waived,
+            ),
+        )
+
+    exception("expired", _now() - timedelta(minutes=5), ["lint"])
+    exception("active", _now() + timedelta(days=1), ["typecheck"])
+    exception("later", _now() + timedelta(hours=1), [])
+    write_decision_entry(paths, create_approval_entry(bead_id, "APPROVAL: ok", human))
+    write_decision_entry(paths, create_approval_entry("work-b12345", "APPROVAL: other", human))
+
+    state = load_decision_state(paths, bead_id)
+    assert state.latest_approval is not None
+    assert state.latest_approval.summary == "APPROVAL: ok"
+    assert state.waived_acceptance_checks == {"lint", "typecheck"}
+    assert state.intervention_count([DecisionType.exception]) == 3
+    active = find_active_exception_decision(paths, bead_id)
+    assert active is not None and active.summary == "later"
+    assert state.active_exception(_now() + timedelta(hours=2)).summary == "active"
+    assert state.active_exception(_now() + timedelta(days=2)) is None
+
+    # Writes from this process are folded into the aggregate without re-reading the file.
+    reader = ledger_reader(paths.decision_ledger_path)
+    parsed = reader.parsed_bytes
+    exception("newest", None, [])
+    assert reader.parsed_bytes > parsed
+    assert load_decision_state(paths, bead_id).intervention_count([DecisionType.exception]) == 4
+
+
+def test_iter_lines_reversed_small_blocks(tmp_path: Path) -> None:
+    from sdlc.io import iter_lines_reversed
+
+    path = tmp_path / "log.jsonl"
+    lines = [json.dumps({"n": idx, "pad": "x" * idx}) for idx in range(20)]
+    path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+    for block_size in (1, 7, 64, 4096):
+        got = [line.decode("utf-8") for line in iter_lines_reversed(path, block_size=block_size)]
+        assert got == list(reversed(lines))
+    assert list(iter_lines_reversed(tmp_path / "missing.jsonl")) == []
+
+
+def test_recent_decision_entries_limit(tmp_path: Path) -> None:
+    from sdlc.engine import create_approval_entry
+    from sdlc.io import Paths, load_recent_decision_entries, write_decision_entry
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="human", name="tester")
+    for idx in range(5):
+        for bead_id in ("work-a12345", "work-b12345"):
+            entry = create_approval_entry(bead_id, f"APPROVAL: {bead_id} {idx}", actor)
+            write_decision_entry(paths, entry)
+    recent = load_recent_decision_entries(paths, "work-a12345", limit=2)
+    assert [e.summary for e in recent] == ["APPROVAL: work-a12345 3", "APPROVAL: work-a12345 4"]
+    assert load_recent_decision_entries(paths, "work-c12345", limit=5) == []
+
+
+def test_segmented_journal_reads_across_segments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc import segments
+    from sdlc.engine import create_approval_entry
+    from sdlc.io import (
+        Paths,
+        load_decision_ledger,
+        load_decision_state,
+        load_execution_records,
+        load_execution_records_for_bead,
+        load_recent_decision_entries,
+        write_decision_entry,
+        write_execution_record,
+    )
+
+    monkeypatch.setenv("SDLC_SEGMENT_MAX_BYTES", "1500")
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    human = Actor(kind="human", name="tester")
+    for idx in range(6):
+        for bead_id in ("work-a12345", "work-b12345"):
+            record = build_execution_record(
+                bead_id, RunPhase.plan, actor, exit_code=idx, notes_md=f"{bead_id}-{idx}"
+            )
+            write_execution_record(paths, record)
+            entry = create_approval_entry(bead_id, f"APPROVAL: {bead_id} {idx}", human)
+            write_decision_entry(paths, entry)
+
+    sealed = segments.sealed_segments(paths.journal_path)
+    assert sealed and all(s.name.endswith(".jsonl.gz") for s in sealed)
+    assert (segments.segments_dir(paths.journal_path) / segments.MANIFEST_NAME).exists()
+    assert len(load_execution_records(paths)) == 12
+
+    records = load_execution_records_for_bead(paths, "work-a12345")
+    assert [r.exit_code for r in records] == list(range(6))
+    latest = load_execution_records_for_bead(paths, "work-b12345", limit=4)
+    assert [r.exit_code for r in latest] == [2, 3, 4, 5]
+
+    assert segments.sealed_segments(paths.decision_ledger_path)
+    assert len(load_decision_ledger(paths)) == 12
+    recent = load_recent_decision_entries(paths, "work-a12345", limit=6)
+    assert [e.summary for e in recent] == [f"APPROVAL: work-a12345 {i}" for i in range(6)]
+    assert load_decision_state(paths, "work-b12345").intervention_counts[DecisionType.approval] == 6
+
+
+def test_segment_roll_rechecks_size_and_compresses_outside_append_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+    import time
+
+    from sdlc import segments
+    from sdlc.io import append_jsonl
+
+    monkeypatch.setenv("SDLC_SEGMENT_MAX_BYTES", "1000")
+    log_path = tmp_path / "journal.jsonl"
+    for n in range(20):
+        append_jsonl(log_path, {"bead_id": "work-roll", "n": n, "pad": "x" * 50})
+
+    # Two writers crossed the limit; the one that loses the race must not seal again.
+    rollers = [threading.Thread(target=segments.maybe_roll, args=(log_path,)) for _ in range(2)]
+    with segments._ROLL_LOCK:
+        for roller in rollers:
+            roller.start()
+        time.sleep(0.1)
+    for roller in rollers:
+        roller.join(10)
+    assert len(segments.sealed_segments(log_path)) == 1
+
+    # Appends proceed while a sealed segment is being compressed.
+    for n in range(20):
+        append_jsonl(log_path, {"bead_id": "work-roll", "n": n, "pad": "x" * 50})
+    original = segments._compress
+    appended = threading.Event()
+
+    def compress(source: Path, compression: str) -> Path:
+        writer = threading.Thread(
+            target=lambda: (append_jsonl(log_path, {"bead_id": "work-roll"}), appended.set())
+        )
+        writer.start()
+        writer.join(5)
+        return original(source, compression)
+
+    monkeypatch.setattr(segments, "_compress", compress)
+    assert segments.maybe_roll(log_path) is not None
+    assert appended.is_set()
+    assert [s.record_count for s in segments.sealed_segments(log_path)] == [20, 20]
+    assert len(log_path.read_bytes().splitlines()) == 1
+
+
+def test_group_commit_writer_concurrent_appends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    from sdlc.io import append_jsonl
+    from sdlc.writer import lock_path
+
+    monkeypatch.setenv("SDLC_JOURNAL_DURABILITY", "fsync")
+    monkeypatch.setenv("SDLC_GROUP_COMMIT_MS", "2")
+    path = tmp_path / "log.jsonl"
+    results: list[tuple[int, int]] = []
+
+    def worker(idx: int) -> None:
+        for n in range(20):
+            results.append(append_jsonl(path, {"worker": idx, "n": n, "pad": "x" * 5000}))
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    raw = path.read_bytes()
+    lines = raw.splitlines()
+    assert len(lines) == 160
+    assert all(json.loads(line)["pad"] == "x" * 5000 for line in lines)
+    assert sorted(offset for offset, _ in results) == [
+        sum(len(line) + 1 for line in lines[:idx]) for idx in range(160)
+    ]
+    for offset, length in results:
+        assert raw[offset + length - 1 : offset + length] == b"\n"
+    assert lock_path(path).exists()
+
+
+def test_framed_journal_sequence_checksum_and_repair(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc import framing
+    from sdlc.io import (
+        Paths,
+        load_execution_records,
+        load_execution_records_for_bead,
+        repair_logs,
+        verify_logs,
+        write_execution_record,
+    )
+
+    monkeypatch.setenv("SDLC_JOURNAL_FRAMING", "1")
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    # An unframed legacy line followed by framed records.
+    legacy = build_execution_record("work-a12345", RunPhase.plan, actor, exit_code=0)
+    paths.journal_path.parent.mkdir(parents=True)
+    paths.journal_path.write_text(legacy.model_dump_json() + "\n", encoding="utf-8")
+    for idx in range(1, 4):
+        write_execution_record(
+            paths, build_execution_record("work-a12345", RunPhase.plan, actor, exit_code=idx)
+        )
+
+    lines = paths.journal_path.read_bytes().splitlines(keepends=True)
+    assert [framing.frame_seq(line) for line in lines] == [None, 1, 2, 3]
+    assert [r.exit_code for r in load_execution_records(paths)] == [0, 1, 2, 3]
+    assert len(load_execution_records_for_bead(paths, "work-a12345")) == 4
+    journal_report = verify_logs(paths)[0]
+    assert journal_report.ok and journal_report.last_seq == 3
+
+    # Simulate a writer dying mid-append.
+    with paths.journal_path.open("ab") as handle:
+        handle.write(lines[-1][:40])
+    assert verify_logs(paths)[0].torn_tail_bytes == 40
+    assert len(load_execution_records(paths)) == 4
+    assert repair_logs(paths)[paths.journal_path] == 40
+    assert verify_logs(paths)[0].ok
+
+    write_execution_record(
+        paths, build_execution_record("work-a12345", RunPhase.plan, actor, exit_code=4)
+    )
+    assert framing.frame_seq(paths.journal_path.read_bytes().splitlines()[-1]) == 4
+
+    with pytest.raises(framing.CorruptRecordError):
+        framing.parse(lines[1].replace(b'"exit_code":1', b'"exit_code":9'))
+
+
+def test_sse_frames_resume_after_sequence() -> None:
+    from sdlc import framing
+    from sdlc.server import _parse_last_event_id, _sse_frames
+
+    lines = [
+        b'{"bead_id":"work-a12345","n":0}\n',
+        framing.frame(1, b'{"bead_id":"work-a12345","n":1}'),
+        framing.frame(2, b'{"bead_id":"work-b12345","n":2}'),
+        framing.frame(3, b'{"bead_id":"work-a12345","n":3}'),
+    ]
+    frames = list(_sse_frames(lines, path=Path("x"), event_name="e", bead_id=None, after_seq=None))
+    assert [seq for seq, _ in frames] == [None, 1, 2, 3]
+    resumed = list(_sse_frames(lines, path=Path("x"), event_name="e", bead_id=None, after_seq=1))
+    assert [seq for seq, _ in resumed] == [2, 3]
+    assert _parse_last_event_id("7:") == (7, None)
+    assert _parse_last_event_id("garbage") == (None, None)
+
+
+def test_sqlite_mirror_syncs_incrementally(tmp_path: Path) -> None:
+    from sdlc.engine import create_approval_entry
+    from sdlc.io import (
+        Paths,
+        open_mirror,
+        rebuild_mirror,
+        write_decision_entry,
+        write_execution_record,
+        write_model,
+    )
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    assert open_mirror(paths) is None
+    bead = Bead(
+        artifact_id="work-a12345",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-a12345",
+        title="Mirror",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.ready,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+    )
+    write_model(paths.bead_path("work-a12345"), bead)
+    for idx in range(3):
+        write_execution_record(
+            paths,
+            build_execution_record("work-a12345", RunPhase.plan, actor, exit_code=idx),
+        )
+    stats = rebuild_mirror(paths)
+    assert (stats.execution_records, stats.beads) == (3, 1)
+
+    write_execution_record(
+        paths, build_execution_record("work-b12345", RunPhase.verify, actor, exit_code=1)
+    )
+    write_decision_entry(
+        paths,
+        create_approval_entry("work-a12345", "APPROVAL", Actor(kind="human", name="tester")),
+    )
+    mirror = open_mirror(paths)
+    assert mirror is not None
+    assert [r["exit_code"] for r in mirror.query_execution_records(bead_id="work-a12345")] == [
+        0,
+        1,
+        2,
+    ]
+    assert len(mirror.query_execution_records(exit_code=1)) == 2
+    assert [r["bead_id"] for r in mirror.query_execution_records(phase="verify")] == ["work-b12345"]
+    assert mirror.query_execution_records(bead_id="work-a12345", limit=1)[0]["exit_code"] == 2
+    assert len(mirror.query_decision_entries(decision_type="approval")) == 1
+    assert [row["bead_id"] for row in mirror.query_beads(q="A12345")] == ["work-a12345"]
+    assert mirror.sync().execution_records == 0
+
+
+def test_sqlite_mirror_reads_without_write_lock_and_applies_segments_incrementally(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import sqlite3
+    import threading
+
+    from sdlc import segments
+    from sdlc.io import Paths, open_mirror, rebuild_mirror, write_bead, write_execution_record
+
+    monkeypatch.setenv("SDLC_MIRROR_BEAD_SCAN_SECONDS", "3600")
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    for idx in range(3):
+        write_execution_record(
+            paths, build_execution_record("work-m12345", RunPhase.plan, actor, exit_code=idx)
+        )
+    rebuild_mirror(paths)
+    mirror = open_mirror(paths)
+    assert mirror is not None
+
+    # A fresh mirror answers reads while another process holds the write lock.
+    writer = sqlite3.connect(paths.mirror_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    reader = threading.Thread(target=mirror.refresh)
+    reader.start()
+    reader.join(5)
+    assert not reader.is_alive()
+    writer.execute("ROLLBACK")
+    writer.close()
+
+    # Sealing continues from the stored offset instead of resyncing the table.
+    write_execution_record(
+        paths, build_execution_record("work-m12345", RunPhase.plan, actor, exit_code=3)
+    )
+    segments.seal_active(paths.journal_path, compression="gzip")
+    write_execution_record(
+        paths, build_execution_record("work-m12345", RunPhase.plan, actor, exit_code=4)
+    )
+    assert mirror.refresh().execution_records == 2
+    assert [r["exit_code"] for r in mirror.query_execution_records()] == [0, 1, 2, 3, 4]
+    assert mirror.refresh().execution_records == 0
+
+    # Bead writes reach the mirror without waiting for the next bead scan.
+    bead = Bead(
+        artifact_id="work-m12345",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-m12345",
+        title="Mirrored on write",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.ready,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+    )
+    write_bead(paths, bead)
+    assert [row["title"] for row in mirror.query_beads()] == ["Mirrored on write"]
+
+
+def test_bd_store_indexes_and_reads_only_changes(tmp_path: Path) -> None:
+    from sdlc.bd_store import BdIssueStore, sniff_format
+    from sdlc.io import Paths, load_bd_store, load_bead
+
+    paths = Paths(tmp_path)
+    issues_path = tmp_path / ".beads" / "issues.jsonl"
+    issues_path.parent.mkdir()
+
+    def issue(bead_id: str, title: str) -> str:
+        return json.dumps({"id": bead_id, "title": title, "status": "ready"}) + "\n"
+
+    issues_path.write_text(issue("work-a1", "A") + issue("work-b1", "B"), encoding="utf-8")
+    assert sniff_format(issues_path) == "jsonl"
+    assert load_bead(paths, "work-b1").title == "B"
+    store = load_bd_store(paths)
+    assert store is not None
+    parsed = store.lines_parsed
+
+    with issues_path.open("a", encoding="utf-8") as handle:
+        handle.write(issue("work-c1", "C"))
+    assert load_bead(paths, "work-c1").title == "C"
+    assert store.lines_parsed == parsed + 1
+
+    # Rewrite one line in place: only that line is parsed again.
+    issues_path.write_text(
+        issue("work-a1", "A") + issue("work-b1", "B2") + issue("work-c1", "C"), encoding="utf-8"
+    )
+    assert [i["title"] for i in store.issues()] == ["A", "B2", "C"]
+    assert store.lines_parsed == parsed + 2
+
+    # A fresh process reuses the persisted index for lookups.
+    fresh = BdIssueStore(issues_path, paths.bd_index_path)
+    assert fresh.issue("work-c1") == {"id": "work-c1", "title": "C", "status": "ready"}
+    assert fresh.lines_parsed == 1
+    with pytest.raises(FileNotFoundError):
+        load_bead(paths, "work-zz1")
+
+    whole = tmp_path / "issues.json"
+    whole.write_text(json.dumps({"issues": [{"id": "work-a1"}]}, indent=2), encoding="utf-8")
+    assert sniff_format(whole) == "json"
+    assert BdIssueStore(whole).ids() == ["work-a1"]
+
+
+def test_bd_store_keeps_lines_whose_crc32_collides(tmp_path: Path) -> None:
+    import hashlib
+    import zlib
+
+    from sdlc.bd_store import BdIssueStore
+
+    def issue(n: int) -> bytes:
+        title = hashlib.sha256(str(n).encode()).hexdigest()[:12]
+        return (json.dumps({"id": f"bd-{n}", "title": title}) + "\n").encode()
+
+    # Found by a birthday search over issue(0), issue(1), ...
+    first, second = 1844, 80727
+    assert zlib.crc32(issue(first)) == zlib.crc32(issue(second))
+
+    issues_path = tmp_path / "issues.jsonl"
+    issues_path.write_bytes(issue(first) + issue(second))
+    index_path = tmp_path / "bd.index.json"
+    store = BdIssueStore(issues_path, index_path)
+    assert store.ids() == [f"bd-{first}", f"bd-{second}"]
+    assert [i["id"] for i in store.issues()] == [f"bd-{first}", f"bd-{second}"]
+    assert store.issue(f"bd-{second}") == json.loads(issue(second))
+
+    # A rewrite reuses known lines by content, never by a colliding checksum.
+    issues_path.write_bytes(issue(second) + issue(first))
+    assert [i["id"] for i in store.issues()] == [f"bd-{second}", f"bd-{first}"]
+    fresh = BdIssueStore(issues_path, index_path)
+    assert fresh.issue(f"bd-{first}") == json.loads(issue(first))
+
+
+def test_bd_import_materializes_in_bulk(tmp_path: Path) -> None:
+    from sdlc.io import Paths, import_bd_issues, load_bead, write_model
+
+    paths = Paths(tmp_path)
+    issues_path = tmp_path / ".beads" / "issues.jsonl"
+    issues_path.parent.mkdir()
+    issues = [
+        {"id": "work-a1", "title": "A", "status": "ready"},
+        {"id": "work-b1", "title": "B", "status": "draft"},
+        {"id": "not-a-bead", "title": "X"},
+    ]
+    issues_path.write_text("".join(json.dumps(i) + "\n" for i in issues), encoding="utf-8")
+
+    summary = import_bd_issues(paths, workers=4)
+    assert sorted(summary.imported) == ["work-a1", "work-b1"]
+    assert summary.invalid == ["not-a-bead"]
+    assert paths.bead_path("work-a1").exists()
+
+    # Loom edits a materialized bead; bd changes both issues.
+    edited = load_bead(paths, "work-b1").model_copy(update={"title": "B (edited)"})
+    write_model(paths.bead_path("work-b1"), edited)
+    issues[0]["title"] = "A2"
+    issues[1]["title"] = "B2"
+    issues_path.write_text("".join(json.dumps(i) + "\n" for i in issues), encoding="utf-8")
+
+    summary = import_bd_issues(paths, status="ready")
+    assert summary.updated == ["work-a1"] and summary.skipped == []
+    assert load_bead(paths, "work-a1").title == "A2"
+    summary = import_bd_issues(paths)
+    assert summary.unchanged == ["work-a1"] and summary.skipped == ["work-b1"]
+    assert load_bead(paths, "work-b1").title == "B (edited)"
+
+
+def test_artifact_cache_hits_copies_and_invalidates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc.artifact_cache import artifact_cache
+    from sdlc.io import Paths, load_bead, write_model
+
+    monkeypatch.setenv("SDLC_ARTIFACT_CACHE", "8")
+    cache = artifact_cache()
+    cache.clear()
+    paths = Paths(tmp_path)
+    bead = Bead(
+        artifact_id="work-a12345",
+        created_at=_now(),
+        created_by=Actor(kind="system", name="tester"),
+        bead_id="work-a12345",
+        title="Cached",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.ready,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+    )
+    write_model(paths.bead_path("work-a12345"), bead)
+
+    first = load_bead(paths, "work-a12345")
+    first.title = "mutated by caller"
+    second = load_bead(paths, "work-a12345")
+    assert second.title == "Cached"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    write_model(paths.bead_path("work-a12345"), bead.model_copy(update={"title": "Updated"}))
+    assert load_bead(paths, "work-a12345").title == "Updated"
+    assert cache.misses == 2
+
+    monkeypatch.setenv("SDLC_ARTIFACT_CACHE", "0")
+    assert len(artifact_cache()) == 0
+
+
+def _git_repo(root: Path) -> None:
+    import subprocess
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "tester@example.com")
+    git("config", "user.name", "tester")
+    (root / "a.txt").write_text("a\n", encoding="utf-8")
+    (root / "b.txt").write_text("b\n", encoding="utf-8")
+    git("add", "a.txt", "b.txt")
+    git("commit", "-q", "-m", "init")
+
+
+def test_git_probe_single_status_per_scope(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import subprocess
+
+    from sdlc.engine import detect_changed_files
+    from sdlc.git_probe import git_probe, git_probe_scope
+    from sdlc.io import git_head, git_is_dirty
+
+    _git_repo(tmp_path)
+    paths = Paths(tmp_path)
+    rev = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=tmp_path, text=True).strip()
+    assert git_head(paths) == rev
+    assert git_is_dirty(paths) is False
+
+    (tmp_path / "a.txt").write_text("changed\n", encoding="utf-8")
+    subprocess.run(["git", "mv", "b.txt", "c.txt"], cwd=tmp_path, check=True)
+    (tmp_path / "new.txt").write_text("new\n", encoding="utf-8")
+    with git_probe_scope():
+        assert git_head(paths) == rev
+        assert git_is_dirty(paths) is True
+        assert sorted(detect_changed_files(paths)) == ["a.txt", "b.txt", "c.txt", "new.txt"]
+        probe = git_probe(tmp_path)
+        assert probe.snapshot() is not None and probe.snapshot().untracked_files == ["new.txt"]
+        # HEAD came from .git/HEAD, everything else from one `git status`.
+        assert probe.git_calls == 1
+
+    (tmp_path / "a.txt").write_text("a\n", encoding="utf-8")
+    subprocess.run(["git", "mv", "c.txt", "b.txt"], cwd=tmp_path, check=True)
+    monkeypatch.setenv("SDLC_GIT_UNTRACKED", "no")
+    assert git_is_dirty(paths) is False
+    plain = tmp_path.parent / f"{tmp_path.name}-plain"
+    plain.mkdir()
+    assert git_is_dirty(Paths(plain)) is None
+
+
+def test_changed_files_stream_and_boundary_stops_early(tmp_path: Path) -> None:
+    import subprocess
+    from typing import Iterator
+
+    from sdlc.engine import compute_touched_subsystems, detect_changed_files
+
+    _git_repo(tmp_path)
+    paths = Paths(tmp_path)
+    head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=tmp_path, text=True).strip()
+    subprocess.run(["git", "mv", "a.txt", "odd\nname.txt"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "rename"], cwd=tmp_path, check=True)
+    assert sorted(detect_changed_files(paths, head_before=head)) == ["a.txt", "odd\nname.txt"]
+
+    gen = tmp_path / "gen"
+    gen.mkdir()
+    for i in range(50):
+        (gen / f"f{i}.txt").write_text("x", encoding="utf-8")
+    assert len(list(detect_changed_files(paths))) == 1  # untracked dir collapses to "gen/"
+    consumed: list[str] = []
+
+    def tracking() -> Iterator[str]:
+        for path in [f"gen/f{i}.txt" for i in range(50)]:
+            consumed.append(path)
+            yield path
+
+    registry = BoundaryRegistry(
+        artifact_id="boundary-registry-test",
+        created_at=_now(),
+        created_by=Actor(kind="system", name="tester"),
+        registry_name="test",
+        subsystems=[Subsystem(name="gen", paths=["gen/"])],
+    )
+    touched, count = compute_touched_subsystems(registry, tracking(), max_files=3)
+    assert (touched, count) == (["gen"], 4)
+    assert len(consumed) == 4
+
+
+def test_path_classifier_prefixes_globs_and_allowlist() -> None:
+    from sdlc.path_classifier import path_classifier
+
+    registry = BoundaryRegistry(
+        artifact_id="boundary-registry-test",
+        created_at=_now(),
+        created_by=Actor(kind="system", name="tester"),
+        registry_name="test",
+        subsystems=[
+            Subsystem(name="core", paths=["src/", "./pkg/*/core/"]),
+            Subsystem(name="docs", paths=["docs/", "*.md"]),
+        ],
+    )
+    classifier = path_classifier(registry, allowlist=["docs/", "notes/"])
+    assert path_classifier(registry, allowlist=["docs/", "notes/"]) is classifier
+
+    readme = classifier.classify("./README.md")
+    assert readme.subsystems == {"docs"} and readme.production and not readme.allowlisted
+    assert classifier.classify("docs/src/guide.md").subsystems == {"docs"}
+    assert classifier.classify("docs/guide.txt").allowlisted
+    assert classifier.subsystems_for("pkg/a/core/x.py") == {"core"}
+    assert not classifier.classify("notes/todo.txt").production
+    assert classifier.production_prefixes == ["*.md", "docs/", "pkg/*/core/*", "src/"]
+
+
+def test_boundary_registry_parsed_and_hashed_once_per_change(tmp_path: Path) -> None:
+    from sdlc.engine import canonical_hash_for_boundary_registry, evaluate_boundary
+
+    paths = Paths(tmp_path)
+    _write_boundary_registry(paths)
+    bead = Bead(
+        artifact_id="work-r1",
+        created_at=_now(),
+        created_by=Actor(kind="system", name="tester"),
+        bead_id="work-r1",
+        title="Registry",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.verification_pending,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+    )
+    first = evaluate_boundary(paths, bead, changed_files=["docs/a.md"])
+    second = evaluate_boundary(paths, bead, changed_files=["src/x.py"])
+    assert second.registry is first.registry
+    assert first.registry_hash == canonical_hash_for_boundary_registry(first.registry)
+
+    _write_boundary_registry_with(paths, [{"name": "src", "paths": ["src/"]}])
+    third = evaluate_boundary(paths, bead, changed_files=["src/x.py"])
+    assert third.registry is not first.registry
+    assert third.touched_subsystems == ["src"]
+    assert third.registry_hash == canonical_hash_for_boundary_registry(third.registry)
+
+
+def test_model_hash_matches_canonical_json() -> None:
+    from sdlc.codec import sha256_canonical_model, sha256_canonical_models
+
+    bead = Bead(
+        artifact_id="work-h1",
+        created_at=_now(),
+        created_by=Actor(kind="system", name="tester"),
+        bead_id="work-h1",
+        title="Hash ✓ naïve",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.ready,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[
+            AcceptanceCheck(name="unit", command="pytest -q"),
+            AcceptanceCheck(name="lint", command="ruff check"),
+        ],
+    )
+    expected = sha256_canonical_json(bead.model_dump(mode="json"))
+    assert sha256_canonical_model(bead) == expected
+    assert sha256_canonical_model(bead.model_copy(deep=True)) == expected
+    checks = bead.acceptance_checks
+    assert sha256_canonical_models(checks) == sha256_canonical_json(
+        [check.model_dump(mode="json") for check in checks]
+    )
+    assert sha256_canonical_models([]) == sha256_canonical_json([])
+
+    bead.title = "changed"
+    assert sha256_canonical_model(bead) == sha256_canonical_json(bead.model_dump(mode="json"))
+
+
+def test_stale_evidence_names_changed_bead_fields(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc.codec import model_hash_tree
+    from sdlc.engine import (
+        canonical_hash_for_acceptance_checks,
+        invalidate_evidence_if_stale,
+        validate_evidence_bundle,
+    )
+    from sdlc.io import write_model
+
+    paths = Paths(tmp_path)
+    bead_id = "work-m1"
+    actor = Actor(kind="system", name="tester")
+    bead = Bead(
+        artifact_id=bead_id,
+        created_at=_now(),
+        created_by=actor,
+        bead_id=bead_id,
+        title="Merkle",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.verification_pending,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[AcceptanceCheck(name="unit", command="pytest -q")],
+    )
+    tree = model_hash_tree(bead)
+    assert tree.root == canonical_hash_for_model(bead).hash
+    assert tree.fields["acceptance_checks"] == (
+        canonical_hash_for_acceptance_checks(bead.acceptance_checks).hash
+    )
+    assert len(tree.items["acceptance_checks"]) == 1
+
+    evidence = EvidenceBundle(
+        artifact_id="evidence-m1",
+        created_at=_now(),
+        created_by=actor,
+        bead_id=bead_id,
+        for_bead_hash=canonical_hash_for_model(bead),
+        items=[
+            EvidenceItem(
+                name="unit", evidence_type=EvidenceType.test_run, command="pytest -q", exit_code=0
+            )
+        ],
+    )
+    write_model(paths.bead_path(bead_id), bead)
+    write_model(paths.evidence_path(bead_id), evidence)
+    _, errors = validate_evidence_bundle(paths, bead_id, actor)
+    assert errors == []
+
+    monkeypatch.setattr("sdlc.engine.git_head", lambda _: None)
+    monkeypatch.setattr("sdlc.engine.git_is_dirty", lambda _: None)
+    write_model(paths.bead_path(bead_id), bead.model_copy(update={"title": "Edited"}))
+    reason = invalidate_evidence_if_stale(paths, bead_id, actor)
+    assert reason == "bead hash changed (fields: title)"
+
+
+def test_bead_context_prefetches_gate_artifacts(tmp_path: Path) -> None:
+    from sdlc.engine import load_bead_context, request_transition
+    from sdlc.io import write_model
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+
+    def bead(bead_id: str, status: BeadStatus, depends_on: list[str]) -> Bead:
+        return Bead(
+            artifact_id=bead_id,
+            created_at=_now(),
+            created_by=actor,
+            bead_id=bead_id,
+            title=bead_id,
+            bead_type=BeadType.implementation,
+            status=status,
+            requirements_md="req",
+            acceptance_criteria_md="acc",
+            context_md="ctx",
+            acceptance_checks=[],
+            depends_on=depends_on,
+        )
+
+    write_model(
+        paths.bead_path("work-c1"), bead("work-c1", BeadStatus.ready, ["work-c2", "work-c3"])
+    )
+    write_model(paths.bead_path("work-c2"), bead("work-c2", BeadStatus.done, []))
+    grounding = GroundingBundle(
+        artifact_id="grounding-work-c1",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-c1",
+        items=[],
+        allowed_commands=[],
+        disallowed_commands=[],
+        excluded_paths=[],
+    )
+    write_model(paths.grounding_path("work-c1"), grounding)
+
+    ctx = load_bead_context(paths, "work-c1", "in_progress")
+    assert ctx.grounding is not None
+    assert ctx.openspec_ref_json is None
+    assert ctx.evidence is None
+    assert ctx.dependencies["work-c3"] is None
+    assert ctx.dependencies["work-c2"] == BeadStatus.done
+
+    # Only the artifacts the requested transition's gates read are loaded.
+    assert load_bead_context(paths, "work-c1", "done").grounding is None
+
+    result = request_transition(
+        paths, "work-c1", "ready -> in_progress", Actor(kind="human", name="tester")
+    )
+    assert not result.ok
+    assert "work-c3 (missing)" in result.notes
+    assert result.context is not None
+    assert set(result.context.dependencies) == {"work-c2", "work-c3"}
+
+
+def test_readiness_report_is_side_effect_free(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from typer.testing import CliRunner
+
+    from sdlc.engine import readiness_report
+    from sdlc.io import write_model
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    for bead_id, status in [("work-r1", BeadStatus.draft), ("work-r2", BeadStatus.ready)]:
+        bead = Bead(
+            artifact_id=bead_id,
+            created_at=_now(),
+            created_by=actor,
+            bead_id=bead_id,
+            title=bead_id,
+            bead_type=BeadType.implementation,
+            status=status,
+            requirements_md="req",
+            acceptance_criteria_md="acc",
+            context_md="ctx",
+            acceptance_checks=[],
+        )
+        write_model(paths.bead_path(bead_id), bead)
+    before = {p: p.read_bytes() for p in paths.runs_dir.rglob("*") if p.is_file()}
+
+    report = {item.bead_id: item for item in readiness_report(paths)}
+    assert report["work-r1"].ready
+    assert [t.transition for t in report["work-r1"].transitions] == ["draft -> sized"]
+    blocked = report["work-r2"].transitions[0]
+    assert blocked.transition == "ready -> in_progress" and not blocked.ok
+    assert "GroundingBundle missing" in blocked.blockers
+    assert "Acceptance checks snapshot missing after ready" in blocked.blockers
+
+    with_failures = readiness_report(paths, ["work-r1"], include_failure_targets=True)
+    assert "draft -> blocked" in [t.transition for t in with_failures[0].transitions]
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["readiness"])
+    assert result.exit_code == 0
+    assert "work-r2: ready -> in_progress: blocked" in result.stdout
+    after = {p: p.read_bytes() for p in paths.runs_dir.rglob("*") if p.is_file()}
+    assert after == before
+
+
+def test_dependency_graph_queries_and_persistence(tmp_path: Path) -> None:
+    from sdlc.dep_graph import DependencyGraph
+    from sdlc.io import load_dependency_graph, write_bead, write_model
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+
+    def bead(bead_id: str, status: BeadStatus, depends_on: list[str]) -> Bead:
+        return Bead(
+            artifact_id=bead_id,
+            created_at=_now(),
+            created_by=actor,
+            bead_id=bead_id,
+            title=bead_id,
+            bead_type=BeadType.implementation,
+            status=status,
+            requirements_md="req",
+            acceptance_criteria_md="acc",
+            context_md="ctx",
+            acceptance_checks=[],
+            depends_on=depends_on,
+        )
+
+    # a <- b <- c, d -> e -> d (cycle), f depends on a bead that does not exist
+    for item in [
+        bead("work-a", BeadStatus.done, []),
+        bead("work-b", BeadStatus.ready, ["work-a"]),
+        bead("work-c", BeadStatus.draft, ["work-b"]),
+        bead("work-d", BeadStatus.draft, ["work-e"]),
+        bead("work-e", BeadStatus.draft, ["work-d"]),
+        bead("work-f", BeadStatus.draft, ["work-zzz"]),
+    ]:
+        write_model(paths.bead_path(item.bead_id), item)
+
+    graph = load_dependency_graph(paths)
+    assert graph.beads_parsed == 6
+    assert graph.topological_order() == ["work-a", "work-b", "work-c", "work-f"]
+    assert graph.cycles() == [["work-d", "work-e"]]
+    assert graph.transitive_blockers("work-c") == ["work-b"]
+    assert graph.blockers("work-f") == ["work-zzz"]
+    assert graph.ready_frontier() == ["work-b"]
+    assert graph.dependents("work-a") == ["work-b"]
+
+    # Engine writes update the graph in place; unchanged files are not re-read.
+    write_bead(paths, bead("work-b", BeadStatus.done, ["work-a"]))
+    assert not graph.refresh()
+    assert graph.beads_parsed == 6
+    assert graph.ready_frontier() == ["work-c"]
+
+    # A fresh process starts from runs/deps.index.json and parses nothing.
+    fresh = DependencyGraph(paths.runs_dir, paths.deps_index_path)
+    assert not fresh.refresh()
+    assert fresh.beads_parsed == 0
+    assert fresh.ready_frontier() == ["work-c"]
+
+
+def test_dependency_gate_revalidates_only_dependencies_and_defers_persist(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc import dep_graph
+    from sdlc.engine import _dependency_statuses
+    from sdlc.io import load_dependency_graph, write_bead, write_model
+
+    monkeypatch.setenv("SDLC_DEPS_PERSIST_SECONDS", "3600")
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+
+    def bead(bead_id: str, status: BeadStatus, depends_on: list[str]) -> Bead:
+        return Bead(
+            artifact_id=bead_id,
+            created_at=_now(),
+            created_by=actor,
+            bead_id=bead_id,
+            title=bead_id,
+            bead_type=BeadType.implementation,
+            status=status,
+            requirements_md="req",
+            acceptance_criteria_md="acc",
+            context_md="ctx",
+            acceptance_checks=[],
+            depends_on=depends_on,
+        )
+
+    for item in [
+        bead("work-r1", BeadStatus.ready, []),
+        bead("work-r2", BeadStatus.ready, ["work-r1"]),
+        bead("work-r3", BeadStatus.draft, []),
+    ]:
+        write_model(paths.bead_path(item.bead_id), item)
+    graph = load_dependency_graph(paths)
+    assert graph.beads_parsed == 3
+
+    # Both files change behind the graph's back; the gate only stats and parses the dependency.
+    write_model(paths.bead_path("work-r1"), bead("work-r1", BeadStatus.done, []))
+    write_model(paths.bead_path("work-r3"), bead("work-r3", BeadStatus.ready, []))
+
+    def no_full_scan(self: dep_graph.DependencyGraph) -> bool:
+        raise AssertionError("dependency gate scanned runs/")
+
+    with monkeypatch.context() as m:
+        m.setattr(dep_graph.DependencyGraph, "refresh", no_full_scan)
+        statuses = _dependency_statuses(paths, bead("work-r2", BeadStatus.ready, ["work-r1"]))
+    assert statuses == {"work-r1": BeadStatus.done}
+    assert graph.beads_parsed == 4
+    assert graph.status("work-r3") == "draft"
+
+    # Writes inside the persist interval leave the index alone until it is flushed.
+    write_bead(paths, bead("work-r2", BeadStatus.in_progress, ["work-r1"]))
+    persisted = paths.deps_index_path.read_bytes()
+    write_bead(paths, bead("work-r2", BeadStatus.done, ["work-r1"]))
+    assert paths.deps_index_path.read_bytes() == persisted
+    graph.flush()
+    fresh = dep_graph.DependencyGraph(paths.runs_dir, paths.deps_index_path)
+    assert fresh.revalidate(["work-r2"]) is False
+    assert fresh.status("work-r2") == "done"
+    assert fresh.beads_parsed == 0
+
+
+def test_projection_replays_from_snapshots_and_time_travels(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc import segments
+    from sdlc.engine import audit_bead_status
+    from sdlc.io import load_bead, write_execution_record, write_model
+    from sdlc.projection import BeadProjection
+
+    monkeypatch.setenv("SDLC_PROJECTION_SNAPSHOT_EVERY", "2")
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    base = _now()
+    steps = [
+        ("work-p1", "draft -> sized"),
+        ("work-p2", "draft -> sized"),
+        ("work-p1", "sized -> ready"),
+        ("work-p1", None),
+        ("work-p1", "ready -> in_progress"),
+    ]
+    for i, (bead_id, transition) in enumerate(steps):
+        record = build_execution_record(
+            bead_id, RunPhase.plan, actor, applied_transition=transition, exit_code=0
+        )
+        write_execution_record(
+            paths, record.model_copy(update={"created_at": base + timedelta(minutes=i)})
+        )
+        if i == 2:
+            segments.seal_active(paths.journal_path, compression="gzip")
+
+    projection = BeadProjection(paths.journal_path, paths.projection_dir)
+    state = projection.current()
+    assert state.records == 5
+    assert state.status_of("work-p1") == "in_progress"
+    assert state.status_of("work-p2") == "sized"
+    assert sorted(p.name for p in paths.projection_dir.glob("*.json")) == [
+        "000000000002.json",
+        "000000000004.json",
+    ]
+
+    # A fresh projection starts from the latest snapshot and replays only the tail.
+    fresh = BeadProjection(paths.journal_path, paths.projection_dir)
+    assert fresh.current().status_of("work-p1") == "in_progress"
+    assert fresh.records_replayed == 1
+    past = fresh.at(base + timedelta(minutes=2, seconds=30))
+    assert past.records == 3
+    assert past.status_of("work-p1") == "ready"
+    assert fresh.at(base - timedelta(minutes=1)).beads == {}
+
+    bead = Bead(
+        artifact_id="work-p1",
+        created_at=base,
+        created_by=actor,
+        bead_id="work-p1",
+        title="Projected",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.ready,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[],
+    )
+    write_model(paths.bead_path("work-p1"), bead)
+    drifts = audit_bead_status(paths, repair=True)
+    assert [(d.bead_id, d.file_status, d.projected_status) for d in drifts] == [
+        ("work-p1", "ready", "in_progress"),
+        ("work-p2", None, "sized"),
+    ]
+    assert load_bead(paths, "work-p1").status == BeadStatus.in_progress
+    assert audit_bead_status(paths)[0].bead_id == "work-p2"
+
+
+def test_bead_writes_compare_and_swap_version_tokens(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc import engine
+    from sdlc.io import BeadConflictError, bead_etag, load_bead, write_bead, write_model
+
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    bead = Bead(
+        artifact_id="work-v1",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-v1",
+        title="Versioned",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.draft,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[],
+    )
+    write_model(paths.bead_path("work-v1"), bead)
+    loaded = bead_etag(paths, "work-v1")
+
+    # A writer that raced us wins; the stale writer gets a conflict and writes nothing.
+    newer = write_bead(paths, bead.model_copy(update={"title": "Edited"}), expected_etag=loaded)
+    assert newer != loaded and bead_etag(paths, "work-v1") == newer
+    with pytest.raises(BeadConflictError):
+        write_bead(paths, bead, expected_etag=loaded)
+    assert load_bead(paths, "work-v1").title == "Edited"
+
+    stale = engine.request_transition(paths, "work-v1", "draft -> sized", actor, if_match=loaded)
+    assert stale.conflict and not stale.ok and stale.etag == newer
+
+    original = engine.evaluate_transition
+
+    def racing(*args: object, **kwargs: object) -> object:
+        write_model(paths.bead_path("work-v1"), bead.model_copy(update={"title": "Raced"}))
+        return original(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(engine, "evaluate_transition", racing)
+    raced = engine.request_transition(paths, "work-v1", "draft -> sized", actor)
+    assert raced.conflict and not raced.ok
+    assert load_bead(paths, "work-v1").status == BeadStatus.draft
+
+    monkeypatch.setattr(engine, "evaluate_transition", original)
+    applied = engine.request_transition(paths, "work-v1", "draft -> sized", actor)
+    assert applied.ok and applied.etag == bead_etag(paths, "work-v1")
+
+    # Version reads share load_bead's opt-in cache instead of keeping their own.
+    from sdlc.artifact_cache import artifact_cache
+    from sdlc.io import load_bead_versioned
+
+    monkeypatch.setenv("SDLC_ARTIFACT_CACHE", "8")
+    cache = artifact_cache()
+    cached_bead, cached_etag = load_bead_versioned(paths, "work-v1")
+    assert bead_etag(paths, "work-v1") == cached_etag == applied.etag
+    assert cache.hits == 1 and cache.misses == 1
+    cached_bead.title = "Mutated copy"
+    assert load_bead(paths, "work-v1").title == "Raced"
+
+
+def test_gate_verdicts_memoized_on_input_fingerprints(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc import engine
+    from sdlc.io import load_execution_records, write_model
+
+    _git_repo(tmp_path)
+    paths = Paths(tmp_path)
+    _write_boundary_registry(paths)
+    actor = Actor(kind="system", name="tester")
+    bead = Bead(
+        artifact_id="work-memo",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-memo",
+        title="Memo",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.verification_pending,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[],
+    )
+    write_model(paths.bead_path("work-memo"), bead)
+    (tmp_path / "a.txt").write_text("edited\n", encoding="utf-8")
+    boundary_runs: list[int] = []
+    original_boundary = engine.evaluate_boundary
+
+    def counting_boundary(*args: object, **kwargs: object) -> object:
+        boundary_runs.append(1)
+        return original_boundary(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "evaluate_boundary", counting_boundary)
+    transition = "verification_pending -> verified"
+
+    first = engine.request_transition(paths, "work-memo", transition, actor)
+    assert not first.ok and "EvidenceBundle missing" in first.notes
+    assert "gates_from_cache" not in first.notes
+    second = engine.request_transition(paths, "work-memo", transition, actor)
+    assert second.notes == first.notes + "; gates_from_cache=evidence,boundary"
+    assert len(boundary_runs) == 1
+    engine.record_transition_attempt(paths, "work-memo", RunPhase.verify, actor, transition, second)
+    assert "gates_from_cache=evidence,boundary" in (
+        load_execution_records(paths)[-1].notes_md or ""
+    )
+
+    # New evidence only invalidates the evidence gate; a new `git status` the boundary gate.
+    evidence = EvidenceBundle(
+        artifact_id="evidence-memo",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-memo",
+        status=EvidenceStatus.collected,
+        for_bead_hash=canonical_hash_for_model(bead),
+        items=[],
+    )
+    write_model(paths.evidence_path("work-memo"), evidence)
+    third = engine.request_transition(paths, "work-memo", transition, actor)
+    assert "EvidenceBundle not validated" in third.notes
+    assert third.notes.endswith("gates_from_cache=boundary")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("guide\n", encoding="utf-8")
+    fourth = engine.request_transition(paths, "work-memo", transition, actor)
+    assert fourth.notes.endswith("gates_from_cache=evidence")
+    assert len(boundary_runs) == 2
+
+    monkeypatch.setenv("SDLC_GATE_CACHE", "0")
+    uncached = engine.request_transition(paths, "work-memo", transition, actor)
+    assert "gates_from_cache" not in uncached.notes and len(boundary_runs) == 3
+
+
+def test_boundary_gate_stops_early_with_gate_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from typing import Iterator
+
+    from sdlc import engine
+    from sdlc.io import write_model
+
+    _git_repo(tmp_path)
+    paths = Paths(tmp_path)
+    _write_boundary_registry(paths)
+    for index in range(20):
+        (tmp_path / f"change{index:02d}.txt").write_text("x\n", encoding="utf-8")
+    actor = Actor(kind="system", name="tester")
+    bead = Bead(
+        artifact_id="work-early",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-early",
+        title="Early stop",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.verification_pending,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[],
+    )
+    write_model(paths.bead_path("work-early"), bead)
+    consumed: list[str] = []
+    original = engine.detect_changed_files
+
+    def counting(*args: object, **kwargs: object) -> Iterator[str]:
+        for path in original(*args, **kwargs):  # type: ignore[arg-type]
+            consumed.append(path)
+            yield path
+
+    monkeypatch.setattr(engine, "detect_changed_files", counting)
+    monkeypatch.setenv("SDLC_MAX_FILES_TOUCHED", "3")
+    transition = "verification_pending -> verified"
+
+    assert engine.gate_cache_enabled()
+    result = engine.request_transition(paths, "work-early", transition, actor)
+    assert "files_touched:4,subsystems_touched:0,partial" in result.notes
+    assert result.auto_abort and len(consumed) == 4
+
+
+def test_async_engine_facade_and_async_endpoints(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+
+    from fastapi.testclient import TestClient
+
+    from sdlc import async_engine
+    from sdlc.git_probe import git_probe, git_probe_scope
+    from sdlc.io import load_bead, write_model
+    from sdlc.server import app
+
+    _git_repo(tmp_path)
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    for bead_id in ("work-async1", "work-async2"):
+        bead = Bead(
+            artifact_id=bead_id,
+            created_at=_now(),
+            created_by=actor,
+            bead_id=bead_id,
+            title="Async",
+            bead_type=BeadType.implementation,
+            status=BeadStatus.draft,
+            requirements_md="req",
+            acceptance_criteria_md="acc",
+            context_md="ctx",
+            acceptance_checks=[],
+        )
+        write_model(paths.bead_path(bead_id), bead)
+
+    async def transition_one() -> tuple[bool, int]:
+        with git_probe_scope():
+            result = await async_engine.request_transition(
+                paths, "work-async1", "draft -> sized", actor
+            )
+            record = await async_engine.record_transition_attempt(
+                paths, "work-async1", RunPhase.plan, actor, "draft -> sized", result
+            )
+            assert record.git is not None and record.git.dirty_before is True
+            # The worker read the snapshot the loop took: one `git status` in total.
+            return result.ok, git_probe(tmp_path).git_calls
+
+    assert asyncio.run(transition_one()) == (True, 1)
+    assert load_bead(paths, "work-async1").status == BeadStatus.sized
+
+    monkeypatch.setenv("SDLC_REPO_ROOT", str(tmp_path))
+    client = TestClient(app)
+    fetched = client.get("/api/beads/work-async2")
+    assert fetched.status_code == 200
+    etag = fetched.headers["ETag"]
+    moved = client.post(
+        "/api/beads/work-async2/transition",
+        json={"transition": "draft -> sized", "actor": {"kind": "system", "name": "tester"}},
+        headers={"If-Match": etag},
+    )
+    assert moved.status_code == 200 and moved.json()["ok"]
+    stale = client.post(
+        "/api/beads/work-async2/transition",
+        json={"transition": "sized -> ready", "actor": {"kind": "system", "name": "tester"}},
+        headers={"If-Match": etag},
+    )
+    assert stale.status_code == 412
+    readiness = client.get("/api/readiness", params={"bead_id": "work-async1"})
+    assert readiness.status_code == 200 and readiness.json()[0]["status"] == "sized"
+
+
+def test_evidence_validate_endpoint_records_post_write_git_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import subprocess
+
+    from fastapi.testclient import TestClient
+
+    from sdlc.engine import invalidate_evidence_if_stale
+    from sdlc.io import load_execution_records, write_model
+    from sdlc.server import app
+
+    _git_repo(tmp_path)
+    paths = Paths(tmp_path)
+    actor = Actor(kind="system", name="tester")
+    bead = Bead(
+        artifact_id="work-evgit",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-evgit",
+        title="Evidence git state",
+        bead_type=BeadType.implementation,
+        status=BeadStatus.verification_pending,
+        requirements_md="req",
+        acceptance_criteria_md="acc",
+        context_md="ctx",
+        acceptance_checks=[],
+    )
+    write_model(paths.bead_path("work-evgit"), bead)
+    evidence = EvidenceBundle(
+        artifact_id="evidence-evgit",
+        created_at=_now(),
+        created_by=actor,
+        bead_id="work-evgit",
+        status=EvidenceStatus.collected,
+        for_bead_hash=canonical_hash_for_model(bead),
+        items=[],
+    )
+    write_model(paths.evidence_path("work-evgit"), evidence)
+    # A clean tree whose evidence.json is tracked: validating it makes the tree dirty.
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-q", "-m", "runs"], cwd=tmp_path, check=True)
+
+    monkeypatch.setenv("SDLC_REPO_ROOT", str(tmp_path))
+    client = TestClient(app)
+    validated = client.post("/api/beads/work-evgit/evidence/validate")
+    assert validated.status_code == 200 and validated.json()["ok"]
+    record = load_execution_records(paths)[-1]
+    assert record.git is not None and record.git.dirty_before is True
+    assert invalidate_evidence_if_stale(paths, "work-evgit", actor) is None
+
+
+def test_job_queue_limits_cancellation_events_and_endpoints(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import subprocess
+    import threading
+    import time
+
+    from fastapi.testclient import TestClient
+
+    import sdlc.agents
+    from sdlc import jobs
+    from sdlc.io import load_job_queue
+    from sdlc.server import app
+
+    monkeypatch.setenv("SDLC_JOB_LIMITS", "slow=1")
+    paths = Paths(tmp_path)
+    queue = load_job_queue(paths)
+    release = threading.Event()
+
+    def slow(job: jobs.JobHandle) -> dict[str, int]:
+        job.progress(0.5, "halfway")
+        release.wait(10)
+        return {"n": 1}
+
+    def wait_for(job_id: str, status: jobs.JobStatus) -> None:
+        deadline = time.monotonic() + 10
+        while queue.get(job_id).status != status:  # type: ignore[union-attr]
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    first = queue.submit("slow", slow, bead_id="work-job1")
+    second = queue.submit("slow", slow, bead_id="work-job1")
+    wait_for(first.job_id, jobs.JobStatus.running)
+    # One "slow" job at a time: the second waits and can be cancelled before it starts.
+    assert queue.get(second.job_id).status == jobs.JobStatus.queued  # type: ignore[union-attr]
+    assert queue.cancel(second.job_id).status == jobs.JobStatus.cancelled  # type: ignore[union-attr]
+    release.set()
+    done = queue.wait(first.job_id, timeout=10)
+    assert done is not None and done.status == jobs.JobStatus.succeeded
+    assert done.result == {"n": 1} and done.progress == 1.0
+    assert "halfway" in queue.read_log(first.job_id)[0]
+
+    # A running job's subprocess is killed on cancel.
+    def sleeper(job: jobs.JobHandle) -> None:
+        jobs.communicate(subprocess.Popen(["sleep", "30"], stdout=subprocess.PIPE))
+
+    sleeping = queue.submit("sleep", sleeper)
+    wait_for(sleeping.job_id, jobs.JobStatus.running)
+    queue.cancel(sleeping.job_id)
+    cancelled = queue.wait(sleeping.job_id, timeout=10)
+    assert cancelled is not None and cancelled.status == jobs.JobStatus.cancelled
+
+    events = [
+        json.loads(line)["event"]
+        for line in paths.jobs_events_path.read_text(encoding="utf-8").splitlines()
+    ]
+    for event in ("job_queued", "job_started", "job_progress", "job_succeeded", "job_cancelled"):
+        assert event in events
+
+    # Jobs left running by a process that is gone are failed when the table is loaded.
+    gone = subprocess.Popen(["true"])
+    gone.wait()
+    orphan = jobs.Job("job-orphan", "plan", None, jobs.JobStatus.running, "", gone.pid)
+    (paths.jobs_dir / "job-orphan.json").write_text(json.dumps(orphan.to_json()))
+    recovered = jobs.JobQueue(paths.jobs_dir).get("job-orphan")
+    assert recovered is not None and recovered.status == jobs.JobStatus.failed
+
+    planned: list[str] = []
+    monkeypatch.setattr(sdlc.agents, "run_plan", lambda p, bead_id, actor: planned.append(bead_id))
+    monkeypatch.setenv("SDLC_REPO_ROOT", str(tmp_path))
+    client = TestClient(app)
+    accepted = client.post("/api/beads/work-job1/agent/plan", json=None)
+    assert accepted.status_code == 202
+    job_id = accepted.json()["job_id"]
+    deadline = time.monotonic() + 10
+    while client.get(f"/api/jobs/{job_id}").json()["status"] != "succeeded":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert planned == ["work-job1"]
+    listed = client.get("/api/jobs", params={"bead_id": "work-job1", "kind": "plan"}).json()
+    assert [job["job_id"] for job in listed] == [job_id]
+    assert client.post(f"/api/jobs/{job_id}/cancel").status_code == 409
+    assert client.get("/api/jobs/job-missing").status_code == 404
+
+
+def test_job_kind_limits_hold_across_queues(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+    import time
+
+    from sdlc import jobs
+
+    monkeypatch.setenv("SDLC_JOB_LIMITS", "excl=1")
+    monkeypatch.setattr(jobs, "_SLOT_POLL_SECONDS", 0.05)
+    jobs_dir = tmp_path / "runs" / "jobs"
+    # Two queues on one directory stand in for two server processes.
+    first_queue = jobs.JobQueue(jobs_dir)
+    second_queue = jobs.JobQueue(jobs_dir)
+    release = threading.Event()
+
+    def held(job: jobs.JobHandle) -> None:
+        release.wait(10)
+
+    first = first_queue.submit("excl", held)
+    deadline = time.monotonic() + 10
+    while first_queue.get(first.job_id).status != jobs.JobStatus.running:  # type: ignore[union-attr]
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    second = second_queue.submit("excl", lambda job: {"ran": True})
+    time.sleep(0.2)
+    assert second_queue.get(second.job_id).status == jobs.JobStatus.queued  # type: ignore[union-attr]
+
+    # The CLI agent commands wait on the same slots.
+    entered = threading.Event()
+
+    def cli_run() -> None:
+        with jobs.job_slot(jobs_dir, "excl"):
+            entered.set()
+
+    cli = threading.Thread(target=cli_run)
+    cli.start()
+    assert not entered.wait(0.2)
+
+    release.set()
+    done = second_queue.wait(second.job_id, timeout=10)
+    assert done is not None and done.result == {"ran": True}
+    assert entered.wait(10)
+    cli.join(10)
+
+
+def test_job_progress_does_not_overwrite_cancel_from_another_queue(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    from sdlc import jobs
+
+    monkeypatch.setattr(jobs, "_CANCEL_POLL_SECONDS", 0.0)
+    jobs_dir = tmp_path / "runs" / "jobs"
+    first_queue = jobs.JobQueue(jobs_dir)
+    second_queue = jobs.JobQueue(jobs_dir)
+    original_store = first_queue._store
+    cancellers: list[threading.Thread] = []
+
+    def store(job: jobs.Job) -> None:
+        # Between the progress write's read and its store, the other "process" cancels.
+        if job.message == "halfway" and not cancellers:
+            canceller = threading.Thread(target=second_queue.cancel, args=(job.job_id,))
+            cancellers.append(canceller)
+            canceller.start()
+            canceller.join(0.3)
+        original_store(job)
+
+    monkeypatch.setattr(first_queue, "_store", store)
+
+    def work(job: jobs.JobHandle) -> None:
+        job.progress(0.5, "halfway")
+        for _ in range(1000):
+            job.raise_if_cancelled()
+            threading.Event().wait(0.01)
+
+    submitted = first_queue.submit("plan", work)
+    done = first_queue.wait(submitted.job_id, timeout=20)
+    cancellers[0].join(10)
+    assert done is not None and done.status == jobs.JobStatus.cancelled
+    assert done.cancel_requested
+    assert done.message == "halfway"
@@ -111,6 +111,25 @@ export interface ActionResponse {
   produced_artifacts?: string[];
 }
 
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled';
+
+// Agent endpoints answer 202 with a job; follow it at /api/jobs/<job_id>.
+export interface JobOut {
+  job_id: string;
+  kind: string;
+  bead_id?: string | null;
+  status: JobStatus;
+  created_at: string;
+  pid: number;
+  started_at?: string | null;
+  finished_at?: string | null;
+  progress: number;
+  message: string;
+  result?: { notes?: string; produced_artifacts?: string[]; [k: string]: unknown } | null;
+  error?: string | null;
+  cancel_requested: boolean;
+}
+
 export type TimelineItem =
   | { kind: 'execution_record'; at: string; record: ExecutionRecord }
   | { kind: 'decision_entry'; at: string; entry: DecisionLedgerEntry };